@@ -2,12 +2,212 @@ from ddoitranslatormodule.BaseFunction import TranslatorModuleFunction
 from ddoitranslatormodule.ddoiexceptions.DDOIExceptions import DDOIInvalidArguments, DDOIKTLTimeOut
 from ddoitranslatormodule.ddoiexceptions.DDOIExceptions import DDOINotSelectedInstrument, DDOINoInstrumentDefined
 
+from telescopetranslator import cancel
+from telescopetranslator import config_cache
+from telescopetranslator import inst_config
+from telescopetranslator import ktl_retry
+from telescopetranslator import request_scope
+from telescopetranslator import subsystem_locks
+from telescopetranslator.cancel import CommandCancelled
+from telescopetranslator.move_watch import MoveWatcher
+from telescopetranslator.snapshot import Snapshot
+
 import os
 import ktl
+import queue
+import configparser
+import threading
+import contextvars
+from time import monotonic, sleep
 
 
 class TelescopeBase(TranslatorModuleFunction):
 
+    # keywords that trigger an action on the values written before them,
+    # these are always written last in _write_to_kw
+    trigger_kws = ('rel2curr', 'rel2base', 'movetel', 'secmove', 'poselect',
+                   'rotmode')
+
+    # process-wide pool of KTL service and keyword handles,  shared by all
+    # translator modules,  {service: ktl.Service}, {(service, kw): Keyword}
+    _ktl_services = {}
+    _ktl_keywords = {}
+    _ktl_pool_lock = threading.Lock()
+
+    # read-through cache for slow changing keywords,  the TTLs are set in the
+    # [ktl_cache_ttl] config section,  {(service, kw, binary): (value, expire)}
+    _kw_cache = {}
+    _kw_cache_watched = set()
+    _kw_cache_stats = {'hits': 0, 'misses': 0, 'invalidations': 0}
+    _kw_cache_lock = threading.Lock()
+
+    # the declared arguments (ArgSchema) of the translator,  see arg_schema
+    arg_schema = None
+
+    # the telescope subsystems the translator moves or sets (axes, rotator,
+    # secondary, primary, guider, nod),  used to decide which translators
+    # can run at the same time.  None: unknown,  conflicts with everything.
+    subsystems = None
+
+    # the KTL keywords the translator writes and reads as 'service.keyword',
+    # 'inst.<keyword>' for the instrument service,  the keywords a move
+    # drives (ie: axestat) count as written.  Used to order the steps of an
+    # OB,  see step_graph.  ktl_writes None: unknown,  ordered after all.
+    ktl_writes = None
+    ktl_reads = ()
+
+    # the status keywords read to report the state left by a cancel
+    cancel_status_kws = {
+        'dcs': ('axestat', 'raoff', 'decoff', 'rotstat', 'rotmode',
+                'rotpposn', 'secmove', 'telfocus'),
+        'acs': ('pmfm',)
+    }
+
+    @classmethod
+    def execute(cls, args, logger=None, cfg=None, deadline=None,
+                cancel_token=None):
+        """
+        Run the translator module.  The top level execute opens the request
+        scope,  the translator executes nested under it share the values
+        resolved there (ie: the instrument) instead of reading them again.
+        Every execute has its own execution context (see _context),  so
+        concurrent executes of a translator do not share state,  and holds
+        the locks of its subsystems,  so concurrent executes that move the
+        same mechanism run one after the other.  The waits of the execute
+        return early with CommandCancelled when the cancel token is cancelled.
+
+        :param args: <dict> The OB (or portion of OB) in dictionary form
+        :param logger: <DDOILoggerClient>, optional
+        :param cfg: <class 'configparser.ConfigParser'> the config file parser.
+        :param deadline: <float> optional time budget [seconds] for the
+            command,  shared with the nested executes and KTL operations.
+        :param cancel_token: <CancelToken> optional,  cancels the command,
+            by default the token of the calling command (see cancel).
+        """
+        with cancel.cancel_scope(cancel_token) as token, \
+                request_scope.request_scope(deadline=deadline) as scope:
+            if token is not None:
+                token.check()
+            if scope.deadline is not None and scope.deadline.expired():
+                msg = f'{cls.__name__} not started,  the command deadline ' \
+                      f'of {scope.deadline.seconds} s has passed'
+                raise DDOIKTLTimeOut(msg)
+
+            timeout = None
+            if scope.deadline is not None:
+                timeout = scope.deadline.remaining()
+
+            try:
+                with subsystem_locks.locks.hold(cls.subsystems, cls.__name__,
+                                                timeout):
+                    with request_scope.exec_context(cls.__name__):
+                        return super().execute(args, logger=logger, cfg=cfg)
+            except CommandCancelled as err:
+                # the innermost execute reports the state
+                if err.state is None:
+                    err.state = cls._cancel_state(cls)
+                    if logger:
+                        logger.warning(f'{cls.__name__} {err}')
+                raise
+
+    @staticmethod
+    def _wait_event(event, timeout):
+        """
+        Wait for an event,  limited to the time left before the command
+        deadline and woken up by a cancel of the command.
+
+        :param event: <threading.Event> the event to wait for
+        :param timeout: <float> the seconds to wait
+
+        :return: <bool> True if the event was set,  False on timeout.
+
+        :raises CommandCancelled: if the command is cancelled
+        """
+        timeout = TelescopeBase._time_left(timeout)
+        token = cancel.current()
+        if token is None:
+            return event.wait(timeout)
+
+        return token.wait(event, timeout)
+
+    @staticmethod
+    def _sleep(seconds):
+        """
+        Sleep,  limited to the time left before the command deadline and
+        woken up by a cancel of the command.
+
+        :param seconds: <float> the time to sleep
+
+        :raises CommandCancelled: if the command is cancelled
+        """
+        seconds = TelescopeBase._time_left(seconds)
+        token = cancel.current()
+        if token is None:
+            sleep(seconds)
+        else:
+            token.sleep(seconds)
+
+    @staticmethod
+    def _check_cancel():
+        """
+        :raises CommandCancelled: if the command is cancelled
+        """
+        token = cancel.current()
+        if token is not None:
+            token.check()
+
+    def _cancel_state(cls):
+        """
+        Read the status keywords (cancel_status_kws) after a cancel.
+
+        :return: <dict> {service: {keyword: value}},  {service: error
+            message} for a service that could not be read.
+        """
+        state = {}
+        for ktl_service, ktl_keys in cls.cancel_status_kws.items():
+            try:
+                state[ktl_service] = cls.snapshot(cls, ktl_service, ktl_keys,
+                                                  timeout=1).values
+            except Exception as err:
+                state[ktl_service] = f'not read: {err}'
+
+        return state
+
+    @staticmethod
+    def _context():
+        """
+        The execution context of the running execute,  holds the per-call
+        state of the translator (ie: the offsets read in pre_condition).
+
+        :return: <ExecContext>
+
+        :raises RuntimeError: if called outside of execute (ie: a hook called
+            directly),  the state set there would be lost on the next call.
+        """
+        ctx = request_scope.current_exec()
+        if ctx is None:
+            raise RuntimeError('no execution context,  the pre_condition, '
+                               'perform and post_condition of a translator '
+                               'are run through execute')
+
+        return ctx
+
+    @staticmethod
+    def _time_left(timeout):
+        """
+        Limit the timeout of a KTL operation to the time left before the
+        command deadline.
+
+        :param timeout: <float> the timeout of the operation [seconds]
+
+        :return: <float> the timeout to use
+        """
+        scope = request_scope.current()
+        if scope is None or scope.deadline is None:
+            return timeout
+
+        return scope.deadline.clamp(timeout)
+
     def _cfg_location(cls, args):
         """
         Return the fullpath + filename of default configuration file.
@@ -19,8 +219,11 @@ class TelescopeBase(TranslatorModuleFunction):
         cfg_path_base = os.path.dirname(os.path.abspath(__file__))
         cfg = f"{cfg_path_base}/ddoi_configurations/default_tel_config.ini"
         config_files = [cfg]
+        scope = request_scope.current()
         if args:
             inst = args.get('instrument', None)
+            if not inst and scope is not None:
+                inst = scope.inst
         else:
             inst = cls.read_current_inst(cls, None)
 
@@ -34,6 +237,95 @@ class TelescopeBase(TranslatorModuleFunction):
 
         return config_files
 
+    def _load_config(cls, cfg, args=None):
+        """
+        Load the configuration files for reading.  The parsed files are cached
+        process-wide and only parsed again when one of the files changes.
+
+        :param cfg: <class 'configparser.ConfigParser'> the config file parser,
+            or the config file(s) to read.  If None the files are found with
+            _cfg_location.
+        :param args: <dict> The OB (or portion of OB) in dictionary form
+
+        :return: <class 'configparser.ConfigParser'> the config file parser.
+        """
+        if isinstance(cfg, configparser.ConfigParser):
+            return cfg
+
+        if not cfg:
+            cfg = cls._cfg_location(cls, args)
+
+        return config_cache.cache.load(cfg)
+
+    @staticmethod
+    def watch_config(interval=2.0, logger=None):
+        """
+        Reload the config files in the background when they change,  for
+        long running processes (ie: a sequencer).  The commands pick up the
+        new values on their next execute.
+
+        :param interval: <float> seconds between the checks of the files
+        :param logger: <DDOILoggerClient>, optional
+        """
+        config_cache.cache.start_watcher(interval, logger)
+
+    @staticmethod
+    def cfg_cache_stats():
+        """
+        :return: <dict> the hits, misses and reloads of the config cache
+        """
+        return config_cache.cache.report()
+
+    def _inst_cfg(cls, cfg, inst):
+        """
+        The compiled configuration of an instrument,  use its attributes in
+        place of the [ktl_serv], [ktl_kw_<inst>] and [<inst>_parameters]
+        lookups.
+
+        :param cfg: <class 'configparser.ConfigParser'> the config file parser.
+        :param inst: <str> the instrument name
+
+        :return: <InstConfig>
+        """
+        return inst_config.get_inst_config(cfg, inst)
+
+    @classmethod
+    def validate_args(cls, args, cfg=None):
+        """
+        Check and convert the arguments of the translator without running it.
+
+        :param args: <dict> The OB (or portion of OB) in dictionary form,  or
+            an argparse Namespace
+        :param cfg: <class 'configparser.ConfigParser'> the config file parser.
+
+        :return: the args object,  the arguments as attributes
+
+        :raises DDOIInvalidArguments: see _validate_args
+        """
+        if not isinstance(args, dict):
+            args = vars(args)
+        cfg = cls._load_config(cls, cfg, args)
+        return cls._validate_args(cls, args, cfg)
+
+    def _validate_args(cls, args, cfg):
+        """
+        Check and convert the arguments declared in arg_schema.
+
+        :param args: <dict> The OB (or portion of OB) in dictionary form
+        :param cfg: <class 'configparser.ConfigParser'> the config file parser.
+
+        :return: the args object,  the arguments as attributes
+
+        :raises DDOIInvalidArguments: if an argument is missing or invalid,  or
+            the translator declares no arguments (arg_schema is None)
+        """
+        if cls.arg_schema is None:
+            raise DDOIInvalidArguments(f'{cls.__name__}: no arg_schema '
+                                       f'declared,  the arguments can not be '
+                                       f'validated')
+
+        return cls.arg_schema.compile(cfg).validate(args, cls.__name__)
+
     def _add_inst_arg(cls, parser, cfg, is_req=True):
         """
         Add Instrument as a command line argument.
@@ -73,54 +365,519 @@ class TelescopeBase(TranslatorModuleFunction):
         return val
 
     def _write_to_kw(cls, cfg, ktl_service, key_val, logger, cls_name,
-                     cfg_key=False, retry=True):
+                     cfg_key=False, retry=True, batch=True):
         """
         Write to KTL keywords while handling the Timeout Exception
 
+        With batch=True the keywords are pipelined: every non-trigger keyword
+        is sent without blocking and the completions are waited on together.
+        The trigger keywords (rel2curr, rel2base, ...) are written afterwards,
+        in order,  so they always act on the new values.
+
+        Failed writes are retried with the policy in the [ktl_retry] config
+        sections,  only the keywords not yet written are sent again.
+
         :param cfg:
         :param ktl_service: The KTL service name
         :param key_val: <dict> {cfg_key_name: new value}
             cfg_key_name = the ktl_keyword_name in the config
         :param logger: <DDOILoggerClient>, optional
             The DDOILoggerClient that should be used. If none is provided,
-            defaults to a generic name specified in the config, by
-            default None
+            defaults to a generic name specified in the config, by default None
         :param cls_name: The name of the calling class
+        :param retry: <bool> False to fail on the first KTL error
+        :param batch: <bool> pipeline the writes instead of one round trip
+            per keyword.
 
         :return: None
         """
-
+        writes = []
         for ktl_key, new_val in key_val.items():
             if cfg_key:
                 ktl_key = cls._cfg_val(cfg, ktl_service, ktl_key)
+            writes.append((ktl_key, new_val))
+
+        # {ktl_key: completion time},  {ktl_key: number of failed attempts}
+        done = {}
+        retries = {}
+        start = monotonic()
+
+        attempt = 1
+        while True:
+            remaining = [kv for kv in writes if kv[0] not in done]
+            failed = cls._send_kws(cls, ktl_service, remaining, done, logger,
+                                   batch=batch)
+            if not failed:
+                break
+
+            for ktl_key, new_val, err in failed:
+                retries[ktl_key] = retries.get(ktl_key, 0) + 1
+
+            ktl_key, new_val, err = failed[0]
+            if isinstance(err, ktl.TimeoutException):
+                cls._record_writes(cls, ktl_service, writes, done, retries,
+                                   start)
+                msg = f"{cls_name} timeout writing to service: " \
+                      f"{ktl_service}, keyword: {ktl_key}, new value: " \
+                      f"{new_val}. Error: {err}."
+                if logger:
+                    logger.error(msg)
+                raise ktl.TimeoutException(msg)
+
+            policy = ktl_retry.RetryPolicy.from_cfg(cfg, ktl_service, ktl_key)
+            max_attempts = policy.max_attempts if retry else 1
+            if attempt >= max_attempts:
+                cls._record_writes(cls, ktl_service, writes, done, retries,
+                                   start)
+                line_str = "="*80
+                msg = f"\n\n{line_str}\n{cls_name} error writing to " \
+                      f"service: {ktl_service.upper()}, keyword: " \
+                      f"{ktl_key.upper()}, new value: {new_val}. " \
+                      f"Tried {attempt} time(s). \n\n  KTL Error: {err}. " \
+                      f"{line_str}\n\n"
+                if logger:
+                    logger.error(msg)
+                raise ktl.ktlError(msg)
+
+            delay = cls._time_left(policy.delay(attempt))
+            attempt += 1
+            if logger:
+                failed_keys = ', '.join(key for key, _, _ in failed)
+                logger.info(f"retrying {failed_keys} in {delay:.2f} s, "
+                            f"attempt {attempt} of {max_attempts},  "
+                            f"KTL error: {err}")
+            cls._drop_kw(cls, ktl_service)
+            cls._sleep(delay)
+
+        cls._record_writes(cls, ktl_service, writes, done, retries, start)
+
+    def _send_kws(cls, ktl_service, writes, done, logger, batch=True):
+        """
+        Make one attempt at writing a set of keywords,  the completion time
+        of each keyword written is added to done.  The trigger keywords are
+        not sent if any of the other keywords failed.
+
+        :param ktl_service: The KTL service name
+        :param writes: <list> [(ktl_key, new value)]
+        :param done: <dict> {ktl_key: completion time} of the written keywords
+        :param logger: <DDOILoggerClient>, optional
+        :param batch: <bool> pipeline the non-trigger keywords
+
+        :return: <list> the failed writes,  [(ktl_key, new value, error)]
+        """
+        if batch:
+            pipelined = [kv for kv in writes
+                         if kv[0].lower() not in cls.trigger_kws]
+            in_order = [kv for kv in writes
+                        if kv[0].lower() in cls.trigger_kws]
+        else:
+            pipelined = []
+            in_order = writes
+
+        # send the batch without blocking,  then wait for all completions
+        failed = []
+        pending = []
+        for ktl_key, new_val in pipelined:
             if logger:
                 logger.info(f"KTL write: {ktl_service} {ktl_key} {new_val}")
+            try:
+                kw = cls._get_kw(cls, ktl_service, ktl_key)
+                pending.append((ktl_key, new_val, kw,
+                                kw.write(new_val, wait=False)))
+            except ktl.ktlError as err:
+                failed.append((ktl_key, new_val, err))
 
+        for ktl_key, new_val, kw, sequence in pending:
             try:
-                ktl.write(ktl_service, ktl_key, new_val, wait=True, timeout=2)
-                # print(ktl_key, new_val, type(new_val))
-                # print(f'reading {ktl_service} {ktl_key}:', ktl.read(ktl_service, ktl_key))
-            except ktl.TimeoutException as err:
-                msg = f"{cls_name} timeout writing to service: {ktl_service}, " \
-                      f"keyword: {ktl_key}, new value: {new_val}. Error: {err}."
-                if logger:
-                    logger.error(msg)
-                raise ktl.TimeoutException(msg)
+                if not kw.wait(sequence=sequence,
+                               timeout=cls._time_left(2)):
+                    raise ktl.TimeoutException('write not acknowledged')
+                done[ktl_key] = monotonic()
             except ktl.ktlError as err:
-                if retry:
-                    logger.info(f"retrying,  KTL error: {err}")
-                    cls._write_to_kw(cls, cfg, ktl_service, key_val, logger,
-                                     cls_name, cfg_key=cfg_key, retry=False)
-                else:
-                    line_str = "="*80
-                    msg = f"\n\n{line_str}\n{cls_name} error writing to " \
-                          f"service: {ktl_service.upper()}, keyword: " \
-                          f"{ktl_key.upper()}, new value: {new_val}. " \
-                          f"Re-tried once. \n\n  KTL Error: {err}. " \
-                          f"{line_str}\n\n"
-                    if logger:
-                        logger.error(msg)
-                    raise ktl.ktlError(msg)
+                failed.append((ktl_key, new_val, err))
+
+        if failed:
+            return failed
+
+        # do not trigger a move for a cancelled command
+        if in_order:
+            cls._check_cancel()
+
+        for ktl_key, new_val in in_order:
+            if logger:
+                logger.info(f"KTL write: {ktl_service} {ktl_key} {new_val}")
+            try:
+                cls._get_kw(cls, ktl_service, ktl_key).write(
+                    new_val, wait=True, timeout=cls._time_left(2))
+                done[ktl_key] = monotonic()
+            except ktl.ktlError as err:
+                return [(ktl_key, new_val, err)]
+
+        return failed
+
+    def _record_writes(cls, ktl_service, writes, done, retries, start):
+        """
+        Add the latency and retry counts of a _write_to_kw call to the KTL
+        write metrics.
+        """
+        for ktl_key, _ in writes:
+            end = done.get(ktl_key)
+            ktl_retry.stats.record(ktl_service, ktl_key,
+                                   (end or monotonic()) - start,
+                                   retries=retries.get(ktl_key, 0),
+                                   failed=end is None)
+
+    @staticmethod
+    def kw_write_stats():
+        """
+        The KTL write metrics.
+
+        :return: <dict> {(service, keyword): writes, retries, failures,
+            total/mean/max latency}
+        """
+        return ktl_retry.stats.report()
+
+    def _get_kw(cls, ktl_service, ktl_key):
+        """
+        Get the pooled KTL keyword handle,  the service and keyword are only
+        opened on first use and then reused by every execute in the process.
+
+        :param ktl_service: <str> The KTL service name
+        :param ktl_key: <str> The KTL keyword name
+
+        :return: <ktl.Keyword> the keyword handle
+        """
+        pool_key = (ktl_service.lower(), ktl_key.lower())
+        kw = TelescopeBase._ktl_keywords.get(pool_key)
+        if kw is not None:
+            return kw
+
+        with TelescopeBase._ktl_pool_lock:
+            kw = TelescopeBase._ktl_keywords.get(pool_key)
+            if kw is None:
+                service = TelescopeBase._ktl_services.get(pool_key[0])
+                if service is None:
+                    service = ktl.Service(ktl_service)
+                    TelescopeBase._ktl_services[pool_key[0]] = service
+                kw = service[ktl_key]
+                TelescopeBase._ktl_keywords[pool_key] = kw
+
+        return kw
+
+    def _drop_kw(cls, ktl_service, ktl_key=None):
+        """
+        Remove a stale handle from the pool,  it will be re-opened on next use.
+        Without a keyword the service and all of its keywords are dropped.
+        The read cache entries of the dropped keywords go with them,  their
+        monitor was on the old handle.
+
+        :param ktl_service: <str> The KTL service name
+        :param ktl_key: <str> The KTL keyword name,  optional
+        """
+        serv = ktl_service.lower()
+        key = ktl_key.lower() if ktl_key else None
+
+        def _dropped(pool_key):
+            return pool_key[0] == serv and (key is None or pool_key[1] == key)
+
+        with TelescopeBase._kw_cache_lock:
+            TelescopeBase._kw_cache_watched = {
+                watched for watched in TelescopeBase._kw_cache_watched
+                if not _dropped(watched)}
+            for cache_key in list(TelescopeBase._kw_cache):
+                if _dropped(cache_key):
+                    del TelescopeBase._kw_cache[cache_key]
+
+        with TelescopeBase._ktl_pool_lock:
+            if key:
+                TelescopeBase._ktl_keywords.pop((serv, key), None)
+                return
+
+            TelescopeBase._ktl_services.pop(serv, None)
+            for pool_key in list(TelescopeBase._ktl_keywords):
+                if _dropped(pool_key):
+                    del TelescopeBase._ktl_keywords[pool_key]
+
+    def _read_kw(cls, ktl_service, ktl_key, binary=False, timeout=2):
+        """
+        Read a KTL keyword through the pooled handle.  A handle that fails
+        with a KTL error is assumed stale,  the service is re-opened and the
+        read is tried once more.
+
+        :param ktl_service: <str> The KTL service name
+        :param ktl_key: <str> The KTL keyword name
+        :param binary: <bool> read the binary value instead of the ascii value
+        :param timeout: <float> the read timeout in seconds
+
+        :return: the keyword value
+        """
+        timeout = cls._time_left(timeout)
+        try:
+            return cls._get_kw(cls, ktl_service, ktl_key).read(
+                binary=binary, timeout=timeout)
+        except ktl.TimeoutException:
+            raise
+        except ktl.ktlError:
+            cls._drop_kw(cls, ktl_service)
+
+        return cls._get_kw(cls, ktl_service, ktl_key).read(
+            binary=binary, timeout=cls._time_left(timeout))
+
+    def snapshot(cls, ktl_service, ktl_keys, binary=False, timeout=2):
+        """
+        Read several keywords of a service concurrently,  so the values are
+        sampled at (nearly) the same moment and the reads cost a single
+        round trip.
+
+        :param ktl_service: <str> The KTL service name
+        :param ktl_keys: <list> the KTL keyword names
+        :param binary: <bool> read the binary values instead of the ascii
+        :param timeout: <float> the read timeout in seconds
+
+        :return: <Snapshot> the values,  the sample timestamp and the spread
+            between the sample times.
+        """
+        samples = {}
+        errors = []
+
+        def _sample(key):
+            try:
+                val = cls._read_kw(cls, ktl_service, key, binary=binary,
+                                   timeout=timeout)
+                samples[key] = (val, monotonic())
+            except Exception as err:
+                errors.append(err)
+
+        threads = []
+        for key in ktl_keys:
+            ctx = contextvars.copy_context()
+            thread = threading.Thread(target=ctx.run, args=(_sample, key),
+                                      name=f'{cls.__name__}-{key}',
+                                      daemon=True)
+            thread.start()
+            threads.append(thread)
+
+        for thread in threads:
+            thread.join()
+
+        if errors:
+            raise errors[0]
+
+        return Snapshot(ktl_service, samples, binary=binary)
+
+    def _read_kw_cached(cls, cfg, ktl_service, ktl_key, binary=False):
+        """
+        Read a slow changing KTL keyword through the read cache.  The value is
+        reused until its TTL in the [ktl_cache_ttl] config section expires or
+        a monitor callback reports that the keyword changed.  Keywords without
+        a TTL are read directly.
+
+        :param cfg: <class 'configparser.ConfigParser'> the config file parser.
+        :param ktl_service: <str> The KTL service name
+        :param ktl_key: <str> The KTL keyword name
+        :param binary: <bool> read the binary value instead of the ascii value
+
+        :return: the keyword value
+        """
+        ttl = 0.0
+        if cfg:
+            ttl = cfg.getfloat('ktl_cache_ttl', ktl_key.lower(), fallback=0.0)
+        if ttl <= 0:
+            return cls._read_kw(cls, ktl_service, ktl_key, binary=binary)
+
+        cache_key = (ktl_service.lower(), ktl_key.lower(), binary)
+        with TelescopeBase._kw_cache_lock:
+            entry = TelescopeBase._kw_cache.get(cache_key)
+            if entry and entry[1] > monotonic():
+                TelescopeBase._kw_cache_stats['hits'] += 1
+                return entry[0]
+
+            TelescopeBase._kw_cache_stats['misses'] += 1
+        cls._watch_cached_kw(cls, ktl_service, ktl_key)
+
+        val = cls._read_kw(cls, ktl_service, ktl_key, binary=binary)
+        with TelescopeBase._kw_cache_lock:
+            TelescopeBase._kw_cache[cache_key] = (val, monotonic() + ttl)
+
+        return val
+
+    def _watch_cached_kw(cls, ktl_service, ktl_key):
+        """
+        Monitor a cached keyword so its cache entries are dropped as soon as
+        the keyword value changes.
+
+        :param ktl_service: <str> The KTL service name
+        :param ktl_key: <str> The KTL keyword name
+        """
+        serv, key = ktl_service.lower(), ktl_key.lower()
+
+        # claim the keyword under the lock,  only one thread registers the
+        # callback.  The callback is registered outside of the lock,  a
+        # monitor primes it from this thread and it takes the lock.
+        with TelescopeBase._kw_cache_lock:
+            if (serv, key) in TelescopeBase._kw_cache_watched:
+                return
+            TelescopeBase._kw_cache_watched.add((serv, key))
+
+        def _invalidate(keyword):
+            for binary in (False, True):
+                val = keyword['binary' if binary else 'ascii']
+                with TelescopeBase._kw_cache_lock:
+                    entry = TelescopeBase._kw_cache.get((serv, key, binary))
+                    if entry and val != entry[0]:
+                        del TelescopeBase._kw_cache[(serv, key, binary)]
+                        TelescopeBase._kw_cache_stats['invalidations'] += 1
+
+        try:
+            kw = cls._get_kw(cls, ktl_service, ktl_key)
+            kw.callback(_invalidate)
+            if not kw['monitored']:
+                kw.monitor()
+        except Exception:
+            with TelescopeBase._kw_cache_lock:
+                TelescopeBase._kw_cache_watched.discard((serv, key))
+            raise
+
+    @staticmethod
+    def kw_cache_stats():
+        """
+        The keyword read cache statistics.
+
+        :return: <dict> hits, misses, invalidations,  the hit rate and the
+            number of cached entries.
+        """
+        with TelescopeBase._kw_cache_lock:
+            stats = dict(TelescopeBase._kw_cache_stats)
+            stats['entries'] = len(TelescopeBase._kw_cache)
+        reads = stats['hits'] + stats['misses']
+        stats['hit_rate'] = stats['hits'] / reads if reads else 0.0
+
+        return stats
+
+    def _wait_for_kw(cls, ktl_service, ktl_key, condition, timeout,
+                     binary=False):
+        """
+        Wait for a KTL keyword to meet a condition.  The keyword is monitored
+        and the condition is checked from its callbacks,  so the wait returns
+        as soon as the new value is broadcast instead of on a polling tick.
+        A cancel of the command ends the wait (CommandCancelled).
+
+        :param ktl_service: <str> The KTL service name
+        :param ktl_key: <str> The KTL keyword name
+        :param condition: <callable> called with the keyword ascii value,
+            returns True when the wait is done.  Or an iterable of the
+            (case insensitive) ascii values to wait for.
+        :param timeout: <float> the length in seconds to wait,  may be a
+            fraction of a second.
+        :param binary: <bool> check the binary value instead of the ascii
+
+        :return: <bool> True if the condition was met,  False on timeout.
+        """
+        value_type = 'binary' if binary else 'ascii'
+        if not callable(condition):
+            values = {str(val).lower() for val in condition}
+            condition = lambda val: str(val).lower() in values
+
+        kw = cls._get_kw(cls, ktl_service, ktl_key)
+        met = threading.Event()
+
+        def _check(keyword):
+            if keyword['populated']:
+                try:
+                    if condition(keyword[value_type]):
+                        met.set()
+                except (TypeError, ValueError):
+                    pass
+
+        kw.callback(_check)
+        try:
+            if not kw['monitored']:
+                kw.monitor()
+            _check(kw)
+
+            return cls._wait_event(met, timeout)
+        finally:
+            kw.callback(_check, remove=True)
+
+    def _watch_move(cls, ktl_service, status_kw, done_vals):
+        """
+        Arm a MoveWatcher on a status keyword.  Call before commanding the
+        move,  then pass the watcher to _wait_move_ack.
+
+        :param ktl_service: <str> The KTL service name
+        :param status_kw: <str> the status keyword (ie: axestat, rotstat)
+        :param done_vals: the status values when no move is in progress
+
+        :return: <MoveWatcher>
+        """
+        return MoveWatcher(cls._get_kw(cls, ktl_service, status_kw), done_vals)
+
+    def _wait_move_ack(cls, cfg, watch, guard_name, logger=None):
+        """
+        Wait until the status keyword shows the commanded move,  then apply the
+        guard delay.  The allowed time and the guard delays are set in the
+        [move_guard] config section (per instrument in the instrument config).
+
+        :param cfg: <class 'configparser.ConfigParser'> the config file parser.
+        :param watch: <MoveWatcher> armed before the move was commanded
+        :param guard_name: <str> the [move_guard] key of the guard delay
+        :param logger: <DDOILoggerClient>, optional
+
+        :return: <bool> True if the move was seen
+        """
+        start_timeout = cfg.getfloat('move_guard', 'start_timeout',
+                                     fallback=3.0)
+        guard = cfg.getfloat('move_guard', guard_name, fallback=0.0)
+
+        try:
+            started = cls._wait_event(watch.started, start_timeout)
+        finally:
+            watch.close()
+
+        if not started and logger:
+            logger.info(f'no move seen on {watch.kw.name} '
+                        f'in {start_timeout} s')
+        if guard > 0:
+            cls._sleep(guard)
+
+        return started
+
+    def _run_preconditions(cls, checks, logger=None):
+        """
+        Run a set of independent precondition checks concurrently.  Each
+        check is a callable that raises on failure.  The first failure is
+        raised as soon as it happens,  without waiting for the other checks.
+
+        :param checks: <dict> {check name: callable}
+        :param logger: <DDOILoggerClient>, optional
+            The DDOILoggerClient that should be used. If none is provided,
+            defaults to a generic name specified in the config, by default None
+
+        :return: None
+        """
+        results = queue.Queue()
+
+        def _run(name, check):
+            try:
+                check()
+                results.put((name, None))
+            except Exception as err:
+                results.put((name, err))
+
+        # daemon threads,  a check still waiting after a failure is abandoned
+        for name, check in checks.items():
+            ctx = contextvars.copy_context()
+            threading.Thread(target=ctx.run, args=(_run, name, check),
+                             name=f'{cls.__name__}-{name}',
+                             daemon=True).start()
+
+        for _ in checks:
+            name, err = results.get()
+            if err is not None:
+                if logger:
+                    logger.error(f'{cls.__name__} precondition {name} '
+                                 f'failed: {err}')
+                raise err
 
     def get_inst_name(cls, args, cfg, allow_current=True):
         """
@@ -139,7 +896,7 @@ class TelescopeBase(TranslatorModuleFunction):
         if inst:
             # confirm INST = the selected instrument
             current_inst = cls.read_current_inst(cls, cfg)
-            if current_inst != inst:
+            if current_inst != inst.lower():
                 raise DDOINotSelectedInstrument(current_inst, inst.upper())
         elif allow_current:
             inst = cls.read_current_inst(cls, cfg)
@@ -147,15 +904,24 @@ class TelescopeBase(TranslatorModuleFunction):
             msg = f'{cls.__name__} requires instrument name to be defined'
             raise DDOINoInstrumentDefined(msg)
 
+        scope = request_scope.current()
+        if scope is not None:
+            scope.inst = inst.lower()
+
         return inst.lower()
 
     def read_current_inst(cls, cfg):
         """
-        Determine the current selected instrument
+        Determine the current selected instrument.  DCS is read at most once
+        per request scope,  nested commands re-use the value.
 
         :param cfg:
         :return:
         """
+        scope = request_scope.current()
+        if scope is not None and scope.current_inst:
+            return scope.current_inst
+
         serv_name = 'dcs'
         if cfg:
             ktl_instrument = cls._cfg_val(cfg, 'ktl_kw_dcs', 'instrument')
@@ -163,12 +929,15 @@ class TelescopeBase(TranslatorModuleFunction):
             ktl_instrument = 'instrume'
 
         try:
-            inst = ktl.read(serv_name, ktl_instrument, timeout=2)
+            inst = cls._read_kw_cached(cls, cfg, serv_name, ktl_instrument)
         except ktl.TimeoutException:
             msg = f'timeout reading,  service {serv_name}, ' \
                   f'keyword: {ktl_instrument}'
             raise ktl.TimeoutException(msg)
 
+        if scope is not None:
+            scope.current_inst = inst.lower()
+
         return inst.lower()
 
     @staticmethod
@@ -185,7 +954,7 @@ class TelescopeBase(TranslatorModuleFunction):
         :param print_only: <bool> True if it is meant to be printed to stdout
         """
         # if logger instance,  write to the log
-        if not print_only:
+        if logger and not print_only:
             logger.info(msg)
-        else: # print to stdout for 'print_only'
+        else: # print to stdout for 'print_only' or without a logger
             print(msg)
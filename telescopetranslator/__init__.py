@@ -1,8 +1,58 @@
+"""
+Keck telescope translator modules.
 
+The translator modules and classes are loaded on first access,  importing the
+package (or one command) does not import the other commands.
 
-__all__ = ["fromsky.py", "gxy.py", "mov.py", "nodn.py", "rotpposn.py",
-           "telfoc.py", "default_tel_config.inigcent.py", "mxy.py",
-           "pmfm.py", "skypa.py", "wftel.py", "elabs.py", "gomark.py",
-           "mark.py", "nod.py", "poname.py", "slitmov.py", "azel.py",
-           "en.py", "gotobase.py", "markbase.py", "node.py", "pxy.py",
-           "tel_utils.py"]
+    from telescopetranslator import slitmov
+    from telescopetranslator import MoveAlongSlit
+"""
+import importlib
+
+# translator class: module
+_TRANSLATORS = {
+    "OffsetAzEl": "azel",
+    "MoveToElevation": "elabs",
+    "OffsetEastNorth": "en",
+    "OffsetBackFromNod": "fromsky",
+    "MoveToGuiderCenter": "gcent",
+    "GoToMark": "gomark",
+    "GoToBase": "gotobase",
+    "OffsetGuiderCoordXY": "gxy",
+    "MarkCoords": "mark",
+    "MarkBase": "markbase",
+    "MoveP1ToP2": "mov",
+    "OffsetXY": "mxy",
+    "SetNodValues": "nod",
+    "SetNodEastValue": "node",
+    "SetNodNorthValue": "nodn",
+    "PMFM": "pmfm",
+    "SetPointingOriginName": "poname",
+    "MovePixelXY": "pxy",
+    "RotatePhysicalPosAngle": "rotpposn",
+    "SetRotSkyPA": "skypa",
+    "MoveAlongSlit": "slitmov",
+    "MoveTelescopeFocus": "telfoc",
+    "WaitForTel": "wftel",
+}
+
+_SUBMODULES = sorted(set(_TRANSLATORS.values())) + ["tel_utils"]
+
+__all__ = _SUBMODULES + list(_TRANSLATORS)
+
+
+def __getattr__(name):
+    if name in _TRANSLATORS:
+        module = importlib.import_module(f"{__name__}.{_TRANSLATORS[name]}")
+        attr = getattr(module, name)
+    elif name in _SUBMODULES:
+        attr = importlib.import_module(f"{__name__}.{name}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = attr
+    return attr
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
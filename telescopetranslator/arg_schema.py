@@ -0,0 +1,167 @@
+"""
+Declared arguments of the translator modules.
+
+A translator declares its arguments once as an ArgSchema class attribute:
+
+    arg_schema = ArgSchema(
+        Arg('x_offset', 'ob_keys', 'inst_x_offset', float, units='arcsec'),
+        Arg('y_offset', 'ob_keys', 'inst_y_offset', float, units='arcsec'))
+
+The schema is compiled against the config (the OB key names are read from
+the config sections) into a validator that checks and converts an args dict
+in one pass and returns a slotted args object:
+
+    offsets = cls._validate_args(cls, args, cfg)
+    offsets.x_offset
+"""
+from ddoitranslatormodule.ddoiexceptions.DDOIExceptions import DDOIInvalidArguments
+
+import weakref
+import threading
+
+_TRUE = ('true', 't', 'yes', 'y', '1')
+_FALSE = ('false', 'f', 'no', 'n', '0')
+
+
+def _to_bool(val):
+    if isinstance(val, bool):
+        return val
+    if isinstance(val, (int, float)):
+        return bool(val)
+    if isinstance(val, str):
+        if val.strip().lower() in _TRUE:
+            return True
+        if val.strip().lower() in _FALSE:
+            return False
+    raise ValueError(val)
+
+
+class Arg:
+    """
+    One translator argument.
+
+    :param name: <str> the attribute name on the args object
+    :param section: <str> the config section of the OB key name,  None if
+        key is the OB key name itself
+    :param key: <str> the config key of the OB key name (or the OB key name)
+    :param arg_type: the type to convert to (float, int, str or bool)
+    :param required: <bool> True if the argument must be given
+    :param default: the value of an optional argument that is not given
+    :param units: <str> the units,  used in the messages
+    """
+    __slots__ = ('name', 'section', 'key', 'arg_type', 'required', 'default',
+                 'units')
+
+    def __init__(self, name, section, key, arg_type=float, required=True,
+                 default=None, units=''):
+        self.name = name
+        self.section = section
+        self.key = key
+        self.arg_type = arg_type
+        self.required = required
+        self.default = default
+        self.units = units
+
+
+class ArgSchema:
+    """
+    The arguments of a translator module.
+
+    :param args: <Arg> the arguments
+    """
+
+    def __init__(self, *args):
+        self.args = args
+        self._lock = threading.Lock()
+        self._compiled = None
+        self._args_class = type('Args', (_ArgsBase,), {
+            '__slots__': tuple(arg.name for arg in args)})
+
+    def compile(self, cfg):
+        """
+        The validator for a config,  compiled once per config.
+
+        :param cfg: <class 'configparser.ConfigParser'> the config file parser.
+
+        :return: <ArgValidator>
+        """
+        with self._lock:
+            compiled = self._compiled
+        if compiled is not None and compiled[0]() is cfg:
+            return compiled[1]
+
+        fields = []
+        for arg in self.args:
+            ob_key = cfg.get(arg.section, arg.key) if arg.section else arg.key
+            convert = _to_bool if arg.arg_type is bool else arg.arg_type
+            fields.append((arg, ob_key, convert))
+        validator = ArgValidator(self._args_class, fields)
+
+        with self._lock:
+            self._compiled = (weakref.ref(cfg), validator)
+
+        return validator
+
+
+class ArgValidator:
+    """
+    Checks and converts the args of a translator in one pass.
+    """
+    __slots__ = ('args_class', 'fields')
+
+    def __init__(self, args_class, fields):
+        self.args_class = args_class
+        self.fields = fields
+
+    def ob_keys(self):
+        """
+        :return: <dict> {attribute name: OB key name}
+        """
+        return {arg.name: ob_key for arg, ob_key, _ in self.fields}
+
+    def validate(self, args, cls_name=''):
+        """
+        :param args: <dict> The OB (or subset) in dictionary form,  or an
+            argparse Namespace
+        :param cls_name: <str> the translator name for the error message
+
+        :return: the args object,  the values as attributes
+
+        :raises DDOIInvalidArguments: listing every missing or invalid
+            argument
+        """
+        if not isinstance(args, dict):
+            args = vars(args)
+
+        values = self.args_class()
+        errors = []
+        for arg, ob_key, convert in self.fields:
+            val = args.get(ob_key, None)
+            if val is None:
+                if arg.required:
+                    errors.append(f'{ob_key} argument not defined')
+                val = arg.default
+            else:
+                try:
+                    val = convert(val)
+                except (TypeError, ValueError):
+                    units = f' [{arg.units}]' if arg.units else ''
+                    errors.append(f'{ob_key} expected '
+                                  f'{arg.arg_type.__name__}{units}, '
+                                  f'got {val!r}')
+            setattr(values, arg.name, val)
+
+        if errors:
+            prefix = f'{cls_name}: ' if cls_name else ''
+            raise DDOIInvalidArguments(prefix + ',  '.join(errors))
+
+        return values
+
+
+class _ArgsBase:
+    __slots__ = ()
+
+    def __repr__(self):
+        vals = ', '.join(f'{name}={getattr(self, name)!r}'
+                         for name in self.__slots__)
+        return f'{type(self).__name__}({vals})'
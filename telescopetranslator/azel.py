@@ -1,9 +1,9 @@
 from ddoitranslatormodule.ddoiexceptions.DDOIExceptions import DDOIPreConditionNotRun
 from telescopetranslator.BaseTelescope import TelescopeBase
+from telescopetranslator.arg_schema import Arg, ArgSchema
 
 import telescopetranslator.tel_utils as utils
 
-from time import sleep
 from collections import OrderedDict
 
 
@@ -33,6 +33,14 @@ class OffsetAzEl(TelescopeBase):
     adapted from sh script: kss/mosfire/scripts/procs/tel/azel
     """
 
+    subsystems = ('axes',)
+    ktl_writes = ('dcs.azoff', 'dcs.eloff', 'dcs.rel2curr', 'dcs.axestat')
+    ktl_reads = ('dcs.poname',)
+
+    arg_schema = ArgSchema(
+        Arg('az_offset', 'ob_keys', 'az_offset', float, units='arcsec'),
+        Arg('el_offset', 'ob_keys', 'el_offset', float, units='arcsec'))
+
     @classmethod
     def add_cmdline_args(cls, parser, cfg=None):
         """
@@ -56,13 +64,13 @@ class OffsetAzEl(TelescopeBase):
             parser, 'absolute',
             'True if offset is relative to current position.', default=False)
 
-        cls.key_az_offset = cls._cfg_val(cfg, 'ob_keys', 'az_offset')
-        cls.key_el_offset = cls._cfg_val(cfg, 'ob_keys', 'el_offset')
+        key_az_offset = cls._cfg_val(cfg, 'ob_keys', 'az_offset')
+        key_el_offset = cls._cfg_val(cfg, 'ob_keys', 'el_offset')
 
         args_to_add = OrderedDict([
-            (cls.key_az_offset, {'type': float,
+            (key_az_offset, {'type': float,
                                  'help': 'The offset in Azimuth in arcseconds.'}),
-            (cls.key_el_offset, {'type': float,
+            (key_el_offset, {'type': float,
                                  'help': 'The offset in Elevation in arcseconds.'}),
         ])
         parser = cls._add_args(parser, args_to_add, print_only=False)
@@ -78,13 +86,11 @@ class OffsetAzEl(TelescopeBase):
             defaults to a generic name specified in the config, by default None
         :param cfg: <class 'configparser.ConfigParser'> the config file parser.
         """
-        if not hasattr(cls, 'key_az_offset'):
-            cls.key_az_offset = cls._cfg_val(cfg, 'ob_keys', 'az_offset')
-        if not hasattr(cls, 'key_el_offset'):
-            cls.key_el_offset = cls._cfg_val(cfg, 'ob_keys', 'el_offset')
+        ctx = cls._context()
 
-        cls.az_off = cls._get_arg_value(args, cls.key_az_offset)
-        cls.el_off = cls._get_arg_value(args, cls.key_el_offset)
+        offsets = cls._validate_args(cls, args, cfg)
+        ctx.az_off = offsets.az_offset
+        ctx.el_off = offsets.el_offset
 
     @classmethod
     def perform(cls, args, logger, cfg):
@@ -97,7 +103,9 @@ class OffsetAzEl(TelescopeBase):
 
         :return: None
         """
-        if not hasattr(cls, 'az_off'):
+        ctx = cls._context()
+
+        if not hasattr(ctx, 'az_off'):
             raise DDOIPreConditionNotRun(cls.__name__)
 
         if args.get('relative', True):
@@ -107,13 +115,14 @@ class OffsetAzEl(TelescopeBase):
 
         # the ktl key name to modify and the value
         key_val = {
-            'azoff': cls.az_off,
-            'eloff': cls.el_off,
+            'azoff': ctx.az_off,
+            'eloff': ctx.el_off,
             relative: 't'
         }
+        watch = cls._watch_move(cls, 'dcs', 'axestat', ('tracking',))
         cls._write_to_kw(cls, cfg, 'dcs', key_val, logger, cls.__name__)
 
-        sleep(3)
+        cls._wait_move_ack(cls, cfg, watch, 'azel', logger)
 
     @classmethod
     def post_condition(cls, args, logger, cfg):
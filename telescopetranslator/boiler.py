@@ -15,6 +15,10 @@ class Boiler(TelescopeBase):
     adapted from sh script: kss/mosfire/scripts/procs/tel/
     """
 
+    subsystems = ('axes',)
+    ktl_writes = ('dcs.xxx',)
+    ktl_reads = ()
+
     @classmethod
     def add_cmdline_args(cls, parser, cfg=None):
         """
@@ -29,12 +33,12 @@ class Boiler(TelescopeBase):
         # read the config file
         cfg = cls._load_config(cls, cfg)
 
-        cls.xxx = cls._cfg_val(cfg, 'ob_keys', '...')
+        key_xxx = cls._cfg_val(cfg, 'ob_keys', '...')
 
         args_to_add = {
-            cls.xxx: {'type': float, 'req': True,
+            key_xxx: {'type': float, 'req': True,
                       'help': 'The offset in Azimuth in degrees.'},
-            cls.xxx: {'type': float, 'req': True,
+            key_xxx: {'type': float, 'req': True,
                       'help': 'The offset in Elevation in degrees.'}}
         parser = cls._add_args(parser, args_to_add, print_only=False)
 
@@ -51,8 +55,10 @@ class Boiler(TelescopeBase):
             defaults to a generic name specified in the config, by default None
         :param cfg: <class 'configparser.ConfigParser'> the config file parser.
         """
-        if not hasattr(cls, '...'):
-            cls.xxx = cls._cfg_val(cfg, 'ob_keys', '...')
+        ctx = cls._context()
+
+        key_xxx = cls._cfg_val(cfg, 'ob_keys', '...')
+        ctx.xxx = cls._get_arg_value(args, key_xxx)
 
     @classmethod
     def perform(cls, args, logger, cfg):
@@ -65,7 +71,9 @@ class Boiler(TelescopeBase):
 
         :return: None
         """
-        if not hasattr(cls, 'print_only'):
+        ctx = cls._context()
+
+        if not hasattr(ctx, 'print_only'):
             raise DDOIPreConditionNotRun(cls.__name__)
 
         # the ktl key name to modify and the value
@@ -0,0 +1,144 @@
+"""
+Cooperative cancellation of a running command.
+
+A CancelToken is passed to the top level execute (or entered with
+cancel_scope) and is seen by every translator execute nested under it,
+including the ones run on the threads of parallel_exec and step_graph.
+The translator waits (keyword waits,  move acknowledgements,  retry and
+guard delays,  subsystem locks) wake up as soon as the token is cancelled and raise
+CommandCancelled,  carrying the state of the telescope status keywords:
+
+    token = CancelToken()
+    threading.Thread(target=SetRotSkyPA.execute, args=(args,),
+                     kwargs={'cancel_token': token}).start()
+    ...
+    token.cancel('target changed')
+
+A KTL read or write already in progress is not interrupted,  the command
+stops before the next one.
+"""
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+_current_token = ContextVar('telescopetranslator_cancel_token', default=None)
+
+
+class CommandCancelled(Exception):
+    """
+    Raised in the command when its CancelToken is cancelled.
+
+    reason = the reason given to cancel
+    state = {service: {keyword: value}} the telescope status keywords read
+        after the cancel,  None until read
+    """
+
+    def __init__(self, reason, state=None):
+        super().__init__(reason)
+        self.reason = reason
+        self.state = state
+
+    def __str__(self):
+        if not self.state:
+            return f'cancelled: {self.reason}'
+
+        return f'cancelled: {self.reason},  state: {self.state}'
+
+
+class CancelToken:
+    """
+    The cancel request of a command,  safe to cancel from any thread.
+    """
+
+    def __init__(self):
+        self.reason = None
+        self._cancelled = threading.Event()
+        self._waiters = set()
+        self._lock = threading.Lock()
+
+    @property
+    def cancelled(self):
+        return self._cancelled.is_set()
+
+    def cancel(self, reason='cancelled'):
+        """
+        Cancel the command,  the waits in progress return within
+        milliseconds.  Only the first reason is kept.
+
+        :param reason: <str> the reason,  reported by CommandCancelled
+        """
+        with self._lock:
+            if self._cancelled.is_set():
+                return
+            self.reason = reason
+            self._cancelled.set()
+            waiters = list(self._waiters)
+
+        for event in waiters:
+            event.set()
+
+    def check(self):
+        """
+        :raises CommandCancelled: if cancelled
+        """
+        if self._cancelled.is_set():
+            raise CommandCancelled(self.reason)
+
+    def wait(self, event, timeout):
+        """
+        Wait for an event,  the event is set to wake up the wait on cancel.
+
+        :param event: <threading.Event> the event to wait for
+        :param timeout: <float> seconds to wait,  None for no limit
+
+        :return: <bool> True if the event was set,  False on timeout.
+
+        :raises CommandCancelled: if cancelled before or during the wait
+        """
+        with self._lock:
+            self._waiters.add(event)
+        try:
+            self.check()
+            met = event.wait(timeout)
+        finally:
+            with self._lock:
+                self._waiters.discard(event)
+
+        self.check()
+        return met
+
+    def sleep(self, seconds):
+        """
+        :param seconds: <float> the time to sleep
+
+        :raises CommandCancelled: if cancelled before or during the sleep
+        """
+        self._cancelled.wait(seconds)
+        self.check()
+
+
+def current():
+    """
+    :return: <CancelToken> of the running command,  None if not cancellable.
+    """
+    return _current_token.get()
+
+
+@contextmanager
+def cancel_scope(token):
+    """
+    Make a token the cancel token of the commands run inside the scope.
+
+    :param token: <CancelToken> the token,  None keeps the current one
+
+    :return: <CancelToken> the active token
+    """
+    if token is None:
+        yield _current_token.get()
+        return
+
+    reset = _current_token.set(token)
+    try:
+        yield token
+    finally:
+        _current_token.reset(reset)
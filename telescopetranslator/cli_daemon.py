@@ -0,0 +1,309 @@
+"""
+Persistent translator daemon for the CLI.
+
+The daemon keeps the translator modules, the config, the linking table and
+the KTL connections loaded and runs the CLI commands sent to it over a local
+Unix socket.  cli_interface is then a thin client,  it sends the arguments
+and prints the output streamed back until the exit status arrives.
+
+    python -m telescopetranslator.cli_interface --serve   # start the daemon
+    python -m telescopetranslator.cli_interface mxy 1 2   # runs in the daemon
+
+The socket is $TELTRANSLATOR_SOCKET,  or telescopetranslator.sock in
+$XDG_RUNTIME_DIR,  or daemon.sock in a private (0700) telescopetranslator-<uid>
+directory in /tmp.  The daemon and the client only use a socket owned by the
+user and closed to other users,  so another local user can not stand in for
+either side.  Without a daemon the CLI runs the command itself.  A client that goes away
+(ie: Ctrl-C) cancels its command,  the waits in progress end at once.
+
+Protocol,  one JSON object per line:
+    client -> daemon  {"argv": [...], "stdin": text or null}
+    daemon -> client  {"out": text} | {"err": text} ... {"exit": status}
+"""
+import io
+import os
+import sys
+import json
+import stat
+import socket
+import signal
+import logging
+import tempfile
+import threading
+import traceback
+import socketserver
+from contextlib import redirect_stdout, redirect_stderr
+
+from telescopetranslator import cancel
+
+
+def _private_dir():
+    """
+    :return: <str> the directory of the socket without $XDG_RUNTIME_DIR
+    """
+    return os.path.join(tempfile.gettempdir(),
+                        f'telescopetranslator-{os.getuid()}')
+
+
+def socket_path():
+    """
+    :return: <str> the path of the daemon socket
+    """
+    path = os.environ.get('TELTRANSLATOR_SOCKET')
+    if path:
+        return path
+
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR')
+    if runtime_dir:
+        return os.path.join(runtime_dir, 'telescopetranslator.sock')
+
+    return os.path.join(_private_dir(), 'daemon.sock')
+
+
+def check_owner(path):
+    """
+    Refuse a socket,  or the private directory of the socket,  that another
+    user made or can use.  A symbolic link is refused as well.
+
+    :param path: <str> the socket or directory path
+
+    :raises PermissionError: if the path is not owned by the user or is open
+        to the group or other users
+    """
+    st = os.lstat(path)
+    if st.st_uid != os.getuid():
+        raise PermissionError(f'{path} is owned by uid {st.st_uid},  not by '
+                              f'uid {os.getuid()}')
+    if stat.S_ISLNK(st.st_mode) or st.st_mode & 0o077:
+        raise PermissionError(f'{path} is open to other users (mode '
+                              f'{stat.S_IMODE(st.st_mode):o})')
+
+
+def _check_socket(path):
+    """
+    Check the socket and,  for the default location,  its private directory.
+
+    :param path: <str> the socket path
+
+    :raises PermissionError: if either can be used by another user
+    """
+    if os.path.dirname(path) == _private_dir():
+        check_owner(os.path.dirname(path))
+    check_owner(path)
+
+
+class _StreamWriter:
+    """
+    A file-like object that sends each write to the client.
+    """
+
+    def __init__(self, wfile, stream):
+        self.wfile = wfile
+        self.stream = stream
+
+    def write(self, text):
+        if text:
+            _send(self.wfile, {self.stream: text})
+        return len(text)
+
+    def flush(self):
+        self.wfile.flush()
+
+
+class _ClientLogHandler(logging.Handler):
+    """
+    Streams the log records of a command to the client (stderr).
+    """
+
+    def __init__(self, wfile, level=logging.INFO):
+        super().__init__(level)
+        self.wfile = wfile
+
+    def emit(self, record):
+        try:
+            _send(self.wfile, {'err': self.format(record) + '\n'})
+        except Exception:
+            self.handleError(record)
+
+
+def _send(wfile, msg):
+    wfile.write((json.dumps(msg) + '\n').encode())
+    wfile.flush()
+
+
+class _CommandHandler(socketserver.StreamRequestHandler):
+
+    def handle(self):
+        # import here,  cli_interface imports this module
+        from telescopetranslator import cli_interface
+
+        try:
+            request = json.loads(self.rfile.readline())
+            argv = [str(arg) for arg in request['argv']]
+            stdin = io.StringIO(request.get('stdin') or '')
+        except (ValueError, KeyError, TypeError):
+            _send(self.wfile, {'err': 'invalid request\n', 'exit': 2})
+            return
+
+        server = self.server
+        handler = _ClientLogHandler(self.wfile)
+        handler.setFormatter(logging.Formatter('%(levelname)8s: %(message)s'))
+        server.logger.addHandler(handler)
+
+        # the client sends nothing more,  end of stream means it is gone
+        token = cancel.CancelToken()
+        threading.Thread(target=self._watch_client, args=(token,),
+                         daemon=True).start()
+
+        stdout = _StreamWriter(self.wfile, 'out')
+        stderr = _StreamWriter(self.wfile, 'err')
+        try:
+            with redirect_stdout(stdout), redirect_stderr(stderr), \
+                    cancel.cancel_scope(token):
+                status = cli_interface.run(argv, logger=server.logger,
+                                           linking_tbl=server.linking_table(),
+                                           stdin=stdin)
+        except SystemExit as err:
+            # argparse exits on bad arguments
+            status = err.code if isinstance(err.code, int) else 1
+        except Exception:
+            server.logger.error(traceback.format_exc())
+            status = 1
+        finally:
+            server.logger.removeHandler(handler)
+
+        try:
+            _send(self.wfile, {'exit': status})
+        except OSError:
+            server.logger.warning('client gone before the exit status')
+
+    def _watch_client(self, token):
+        try:
+            self.rfile.read()
+        except (OSError, ValueError):
+            pass
+        token.cancel('client disconnected')
+
+
+class TranslatorServer(socketserver.UnixStreamServer):
+    """
+    Runs one command at a time,  telescope commands are not run concurrently
+    from the CLI.
+    """
+
+    def __init__(self, path, logger):
+        self.logger = logger
+        super().__init__(path, _CommandHandler)
+
+    def linking_table(self):
+        # LinkingIndex re-validates against the YAML mtime,  so a changed
+        # table is picked up without a restart
+        from telescopetranslator import cli_interface
+        return cli_interface.load_linking_table(self.logger)
+
+
+def serve(path=None):
+    """
+    Run the daemon until interrupted.
+
+    :param path: <str> the socket path,  by default socket_path()
+
+    :return: <int> the exit status
+    """
+    from telescopetranslator import cli_interface
+    from telescopetranslator.BaseTelescope import TelescopeBase
+
+    path = path or socket_path()
+    logger = cli_interface.create_logger()
+
+    try:
+        if os.path.dirname(path) == _private_dir():
+            os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+            check_owner(os.path.dirname(path))
+        if os.path.lexists(path):
+            # only a stale socket of this user is replaced
+            check_owner(path)
+            if send_command(None, path) is not None:
+                logger.error(f'a daemon is already running on {path}')
+                return 1
+            os.remove(path)
+    except PermissionError as err:
+        logger.error(f'not serving on {path}: {err}')
+        return 1
+
+    # keep the warm config current while the daemon runs
+    TelescopeBase.watch_config(logger=logger)
+
+    # the socket is created owner-only,  no other user can connect before
+    # the first command
+    umask = os.umask(0o177)
+    try:
+        server = TranslatorServer(path, logger)
+    finally:
+        os.umask(umask)
+    # remove the socket on a plain kill as well
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    logger.info(f'translator daemon listening on {path}')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        os.remove(path)
+
+    return 0
+
+
+def send_command(argv, path=None, stdin_text=None):
+    """
+    Run a command in the daemon and print its output.
+
+    :param argv: <list> the command line arguments,  None to only check
+        that the daemon is running.
+    :param path: <str> the socket path,  by default socket_path()
+    :param stdin_text: <str> the client stdin for the command (--script -)
+
+    :return: <int> the exit status,  None if no daemon is running or its
+        socket can be used by another user.
+    """
+    path = path or socket_path()
+    if not os.path.lexists(path):
+        return None
+
+    try:
+        _check_socket(path)
+    except PermissionError as err:
+        sys.stderr.write(f'not using the translator daemon: {err}\n')
+        return None
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(path)
+    except OSError:
+        sock.close()
+        return None
+
+    if argv is None:
+        sock.close()
+        return 0
+
+    with sock, sock.makefile('rwb') as stream:
+        _send(stream, {'argv': argv, 'stdin': stdin_text})
+        try:
+            for line in stream:
+                msg = json.loads(line)
+                if 'out' in msg:
+                    sys.stdout.write(msg['out'])
+                if 'err' in msg:
+                    sys.stderr.write(msg['err'])
+                if 'exit' in msg:
+                    return msg['exit']
+        except KeyboardInterrupt:
+            # closing the connection cancels the command in the daemon
+            sys.stderr.write('cancelled\n')
+            return 130
+
+    # the daemon went away mid command
+    sys.stderr.write('connection to the translator daemon lost\n')
+    return 1
@@ -1,5 +1,7 @@
+import io
 import os
 import sys
+import shlex
 import importlib
 import traceback
 import configparser
@@ -7,13 +9,19 @@ from pathlib import Path
 from argparse import ArgumentParser, ArgumentError
 from typing import Dict, List, Tuple
 import logging
-from datetime import datetime, timedelta
-
-import yaml
+from time import perf_counter
 
 from ddoitranslatormodule.ddoiexceptions.DDOIExceptions import DDOITranslatorModuleNotFoundException
 from ddoitranslatormodule.BaseFunction import TranslatorModuleFunction
 
+from telescopetranslator.cancel import CommandCancelled
+from telescopetranslator.linking_index import LinkingIndex
+from telescopetranslator.parser_cache import build_parser
+from telescopetranslator.queued_logging import BoundedQueueHandler, DeferredFileHandler, start_queued_logging
+
+# exit status of a cancelled command,  as for SIGINT
+CANCELLED_STATUS = 130
+
 
 class LinkingTable():
     """Class storing the contents of a linking table
@@ -27,6 +35,8 @@ class LinkingTable():
         filename : str
             Filepath to the linking table
         """
+        import yaml
+
         try:
             with open(filename) as f:
                 self.cfg = yaml.load(f, Loader=yaml.FullLoader)
@@ -38,6 +48,9 @@ class LinkingTable():
         self.suffix = self.cfg['common']['suffix']
         self.links = self.cfg['links']
 
+    def __contains__(self, entry_point) -> bool:
+        return entry_point in self.links
+
     def get_entry_points(self) -> List[str]:
         """Gets a list of all the entry points listed in the linking table
 
@@ -89,6 +102,22 @@ class LinkingTable():
             output += "." + self.suffix
         return output
 
+    def get_module_and_class(self, entry_point) -> Tuple[str, str]:
+        """Gets the module import string and the class name of an entry point
+
+        Parameters
+        ----------
+        entry_point : str
+            Entry point (key) to get
+
+        Returns
+        -------
+        Tuple[str, str]
+            Python import string of the module, and the class name
+        """
+        module_str, _, class_str = self.get_link(entry_point).rpartition(".")
+        return module_str, class_str
+
     def get_link_and_args(self, entry_point) -> Tuple[str, list]:
         """Gets both an import string for an entry point, and a list of Tuples 
         containing information about default arguments needed
@@ -126,7 +155,7 @@ def get_linked_function(linking_tbl, key) -> Tuple[TranslatorModuleFunction, str
 
     Parameters
     ----------
-    linking_tbl : LinkingTable
+    linking_tbl : LinkingTable or LinkingIndex
         Linking Table that should be searched
     key : str
         CLI function being searched for
@@ -144,17 +173,13 @@ def get_linked_function(linking_tbl, key) -> Tuple[TranslatorModuleFunction, str
     """
 
     # Check to see if there is an entry matching the given key
-    if key not in linking_tbl.get_entry_points():
+    if key not in linking_tbl:
         raise DDOITranslatorModuleNotFoundException(
             f"Unable to find an import for {key}")
     link, default_args = linking_tbl.get_link_and_args(key)
 
-    # Get only the module path
-    link_elements = link.split(".")
-    # Get only the module import string
-    module_str = ".".join(link_elements[:-1])
-    # Get only the class name
-    class_str = link_elements[-1]
+    # Get the module import string and the class name
+    module_str, class_str = linking_tbl.get_module_and_class(key)
 
     try:
         # Try to import the package from the string in the linking table
@@ -173,62 +198,205 @@ def get_linked_function(linking_tbl, key) -> Tuple[TranslatorModuleFunction, str
 
 def create_logger():
     log = logging.getLogger('cli_interface')
+    # already set up by an earlier command in this process (daemon, script)
+    if any(isinstance(h, BoundedQueueHandler) for h in log.handlers):
+        return log
     log.setLevel(logging.DEBUG)
+    LogFormat = logging.Formatter('%(asctime)s:%(filename)s:%(levelname)8s: %(message)s')
     ## Set up console output
     LogConsoleHandler = logging.StreamHandler()
     LogConsoleHandler.setLevel(logging.INFO)
-    LogFormat = logging.Formatter('%(asctime)s:%(filename)s:%(levelname)8s: %(message)s')
     LogConsoleHandler.setFormatter(LogFormat)
-    log.addHandler(LogConsoleHandler)
-    ## Set up file output
-    utnow = datetime.utcnow()
-    date = utnow-timedelta(days=1)
-    date_str = date.strftime('%Y%b%d').lower()
-    logdir = Path(f"/s/sdata1701/{os.getlogin()}/{date_str}/logs")
-    if logdir.exists() is False:
-        logdir.mkdir(parents=True)
-    LogFileName = logdir / 'cli_interface.log'
-    LogFileHandler = logging.FileHandler(LogFileName)
+    ## Set up file output,  the directory is created on the first record
+    LogFileHandler = DeferredFileHandler('cli_interface.log')
     LogFileHandler.setLevel(logging.DEBUG)
     LogFileHandler.setFormatter(LogFormat)
-    log.addHandler(LogFileHandler)
+    ## Both are written by a background thread
+    start_queued_logging(log, [LogConsoleHandler, LogFileHandler])
     return log
 
-def main():
+def load_linking_table(logger):
+    """Load the linking table next to this file
+
+    Returns
+    -------
+    LinkingIndex
+        The compiled linking table,  None if the table does not exist
+    """
+    table_loc = Path(__file__).parent / "linking_table.yml"
+    if not table_loc.exists():
+        logger.error(f"Failed to find a linking table at {str(table_loc)}")
+        return None
+    return LinkingIndex(table_loc)
+
+
+def cli_parser_args() -> ArgumentParser:
+    """The ArgumentParser of the cli_interface options
+
+    Returns
+    -------
+    ArgumentParser
+        The parser,  the command and its arguments are left unparsed
+    """
+    cli_parser = ArgumentParser(add_help=False, conflict_handler="resolve")
+    cli_parser.add_argument("-l", "--list", dest="list", action="store_true", help="List functions in this module")
+    cli_parser.add_argument("-n", "--dry-run", dest="dry_run", action="store_true", help="Print what function would be called with what arguments, with no actual invocation")
+    cli_parser.add_argument("-h", "--help", dest="help", action="store_true")
+    cli_parser.add_argument("-v", "--verbose", dest="verbose", action="store_true", help="Print extra information")
+    cli_parser.add_argument("-f", "--file", dest="file", help="JSON or YAML OB file to add to arguments")
+    cli_parser.add_argument("-s", "--script", dest="script", help="Run the commands in a script file, - for stdin")
+    cli_parser.add_argument("--on-error", dest="on_error", choices=("stop", "continue"), default="stop", help="Script mode: stop or continue after a failed command")
+    # cli_parser.add_argument("function_args", nargs="*", help="Function to be executed, and any needed arguments")
+    return cli_parser
+
+
+def parse_script(lines) -> List[Tuple[int, str]]:
+    """Split a script into commands
+
+    One or more commands per line,  separated by ';'.  Blank lines and
+    lines starting with '#' are skipped.  The directive lines
+    'on-error stop' and 'on-error continue' set the error policy of the
+    commands that follow them.
+
+    Parameters
+    ----------
+    lines : iterable of str
+        The lines of the script
+
+    Returns
+    -------
+    List[Tuple[int, str]]
+        (line number, command) for each command,  directives included
+    """
+    commands = []
+    for line_num, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        for command in line.split(";"):
+            command = command.strip()
+            if command:
+                commands.append((line_num, command))
+    return commands
+
+
+def run_script(lines, logger, linking_tbl, on_error="stop") -> int:
+    """Run the commands of a script in this process
+
+    The commands share the logger,  the linking table,  the config and the
+    KTL connections.  A timing summary is printed at the end.
+
+    Parameters
+    ----------
+    lines : iterable of str
+        The lines of the script
+    logger : Logger
+        The logger used by all commands
+    linking_tbl : LinkingIndex
+        The linking table
+    on_error : str, optional
+        "stop" or "continue" after a failed command,  by default "stop"
+
+    Returns
+    -------
+    int
+        0 if every command succeeded,  else the status of the first failure
+    """
+    results = []
+    status = 0
+    script_start = perf_counter()
+
+    for line_num, command in parse_script(lines):
+        try:
+            words = shlex.split(command)
+        except ValueError as e:
+            words = []
+            logger.error(f"Script line {line_num}: {e}")
+        if not words:
+            results.append((line_num, command, 2, 0.0))
+            status = status or 2
+            if on_error == "stop":
+                break
+            continue
+
+        if words[0] == "on-error" and len(words) == 2 and \
+                words[1] in ("stop", "continue"):
+            on_error = words[1]
+            continue
+
+        logger.info(f"Script line {line_num}: {command}")
+        start = perf_counter()
+        try:
+            cmd_status = run(words, logger=logger, linking_tbl=linking_tbl)
+        except SystemExit as e:
+            # argparse exits on bad arguments
+            cmd_status = e.code if isinstance(e.code, int) else 1
+        results.append((line_num, command, cmd_status, perf_counter() - start))
+
+        if cmd_status:
+            status = status or cmd_status
+            logger.error(f"Script line {line_num} failed with status {cmd_status}: {command}")
+            # a cancel stops the script whatever the on-error mode
+            if on_error == "stop" or cmd_status == CANCELLED_STATUS:
+                break
+
+    total = perf_counter() - script_start
+    print(f"{'line':>5} {'status':>6} {'seconds':>8}  command")
+    for line_num, command, cmd_status, elapsed in results:
+        print(f"{line_num:>5} {cmd_status:>6} {elapsed:>8.3f}  {command}")
+    failed = sum(1 for result in results if result[2])
+    print(f"{len(results)} commands, {failed} failed, {total:.3f} seconds")
+
+    return status
+
+
+def run(argv, logger=None, linking_tbl=None, stdin=None) -> int:
+    """Run one CLI command
+
+    Parameters
+    ----------
+    argv : List[str]
+        The command line arguments,  without the program name
+    logger : Logger, optional
+        The logger to use,  by default a new one from create_logger()
+    linking_tbl : LinkingIndex, optional
+        The linking table,  by default loaded from linking_table.yml
+    stdin : file, optional
+        The script stream for --script -,  by default sys.stdin
+
+    Returns
+    -------
+    int
+        The exit status of the command
+    """
 
     #
     # Logging
     #
 
-    logger = create_logger()
-    logger.debug("Created logger")
-    invocation = ' '.join(sys.argv)
+    if logger is None:
+        logger = create_logger()
+        logger.debug("Created logger")
+    invocation = ' '.join(argv)
     logger.debug(f"Invocation: {invocation}")
 
     #
     # Build the linking table
     #
 
-    table_loc = Path(__file__).parent / "linking_table.yml"
-    if not table_loc.exists():
-        logger.error(f"Failed to find a linking table at {str(table_loc)}")
+    if linking_tbl is None:
+        linking_tbl = load_linking_table(logger)
+    if linking_tbl is None:
         logger.error("Exiting...")
-        sys.exit(1)
-    linking_tbl = LinkingTable(table_loc)
+        return 1
 
     #
     # Handle command line arguments
     #
 
-    cli_parser = ArgumentParser(add_help=False, conflict_handler="resolve")
-    cli_parser.add_argument("-l", "--list", dest="list", action="store_true", help="List functions in this module")
-    cli_parser.add_argument("-n", "--dry-run", dest="dry_run", action="store_true", help="Print what function would be called with what arguments, with no actual invocation")
-    cli_parser.add_argument("-h", "--help", dest="help", action="store_true")
-    cli_parser.add_argument("-v", "--verbose", dest="verbose", action="store_true", help="Print extra information")
-    cli_parser.add_argument("-f", "--file", dest="file", help="JSON or YAML OB file to add to arguments")
-    # cli_parser.add_argument("function_args", nargs="*", help="Function to be executed, and any needed arguments")
+    cli_parser = cli_parser_args()
     logger.debug("Parsing cli_interface.py arguments...")
-    parsed_args, function_args = cli_parser.parse_known_args()
+    parsed_args, function_args = cli_parser.parse_known_args(argv)
     logger.debug("Parsed.")
 
     # Help:
@@ -239,8 +407,7 @@ def main():
             try:
                 function, preset_args, mod_str = get_linked_function(
                     linking_tbl, function_args[0])
-                func_parser = ArgumentParser(add_help=False)
-                func_parser = function.add_cmdline_args(func_parser)
+                func_parser = build_parser(function)
                 func_parser.print_help()
                 if parsed_args.verbose:
                     print(function.__doc__)
@@ -255,12 +422,26 @@ def main():
         # Print help for using this CLI script
         else:
             cli_parser.print_help()
-        return
+        return 0
     # List:
     if parsed_args.list:
         logger.debug("Printing list...")
         linking_tbl.print_entry_points()
-        return
+        return 0
+    # Script:
+    if parsed_args.script:
+        logger.debug(f"Running script {parsed_args.script}...")
+        if parsed_args.script == "-":
+            return run_script(stdin or sys.stdin, logger, linking_tbl,
+                              parsed_args.on_error)
+        try:
+            with open(parsed_args.script) as f:
+                lines = f.readlines()
+        except OSError as e:
+            logger.error(f"Failed to read script {parsed_args.script}")
+            logger.error(e)
+            return 1
+        return run_script(lines, logger, linking_tbl, parsed_args.on_error)
 
     #
     # Handle Execution
@@ -281,9 +462,8 @@ def main():
             final_args.insert(arg_tup[0], str(arg_tup[1]))
 
         # Build an ArgumentParser and attach the function's arguments
-        parser = ArgumentParser(add_help=False)
         logger.debug(f"Adding CLI args to parser")
-        parser = function.add_cmdline_args(parser)
+        parser = build_parser(function)
         logger.debug("Parsing function arguments...")
         try:
             parsed_func_args = parser.parse_args(final_args)
@@ -292,7 +472,7 @@ def main():
             logger.error("Failed to parse arguments!")
             logger.error(e)
             print(e)
-            sys.exit(1)
+            return 1
             
         """
         if parsed_args.file:
@@ -339,21 +519,50 @@ def main():
     except DDOITranslatorModuleNotFoundException as e:
         logger.error("Failed to find Translator Module")
         logger.error(e)
-        sys.exit(1)
+        return 1
     except ImportError as e:
         logger.error("Found translator module, but failed to import it")
         logger.error(e)
-        sys.exit(1)
+        return 1
     except TypeError as e:
         logger.error(traceback.format_exc())
-        sys.exit(1)
+        return 1
+    except CommandCancelled as e:
+        # the state left by the cancel is logged by execute
+        logger.error(f"Command cancelled: {e.reason}")
+        return CANCELLED_STATUS
     except Exception as e:
         logger.error("Unexpected exception encountered in CLI:")
         logger.error(e)
-        sys.exit(1)
+        return 1
     
-    # Not strictly needed, but it's nice to be explicit
-    sys.exit(0)
+    return 0
+
+
+def main():
+    argv = sys.argv[1:]
+
+    # run the daemon,  or send the command to a running daemon
+    from telescopetranslator import cli_daemon
+    if argv[:1] == ["--serve"]:
+        sys.exit(cli_daemon.serve())
+
+    # the daemon does not share the cwd or the stdin of the client
+    script = cli_parser_args().parse_known_args(argv)[0].script
+    stdin_text = None
+    if script == "-":
+        stdin_text = sys.stdin.read()
+    elif script:
+        argv = [arg.replace(script, os.path.abspath(script))
+                if arg in (script, f"--script={script}") else arg
+                for arg in argv]
+
+    status = cli_daemon.send_command(argv, stdin_text=stdin_text)
+    if status is None:
+        stdin = io.StringIO(stdin_text) if stdin_text is not None else None
+        status = run(argv, stdin=stdin)
+
+    sys.exit(status)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,190 @@
+"""
+Process-wide cache of the parsed translator config files.
+
+The default config plus the instrument overlay (ie: kpf_tel_config.ini) are
+parsed once and re-used until one of the files changes.  The cache key is the
+resolved list of files,  an entry is valid while the mtimes of its files are
+unchanged.
+
+The instrument configurations are compiled when the files are parsed (see
+inst_config),  so a malformed value fails the load.
+
+The cached ConfigParser is shared,  callers must treat it as read-only.
+
+In a long running process start_watcher() moves the mtime checks and the
+re-parsing to a background thread.  A changed config is parsed and compiled
+there and swapped in as a whole,  a command already running keeps the
+ConfigParser it started with.
+"""
+from telescopetranslator import inst_config
+
+import os
+import threading
+import configparser
+
+
+class ConfigCache:
+    """
+    {(file, ...): (mtimes, ConfigParser)} with hit / miss / reload counts.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._stats = {'hits': 0, 'misses': 0, 'reloads': 0,
+                       'hot_reloads': 0, 'reload_errors': 0}
+        self._watcher = None
+        self._stop_watcher = threading.Event()
+
+    @staticmethod
+    def _mtimes(files):
+        mtimes = []
+        for file_name in files:
+            try:
+                mtimes.append(os.stat(file_name).st_mtime_ns)
+            except OSError:
+                mtimes.append(None)
+
+        return tuple(mtimes)
+
+    @staticmethod
+    def _parse(files):
+        config = configparser.ConfigParser()
+        config.read(files)
+        inst_config.compile_config(config)
+
+        return config
+
+    def load(self, files):
+        """
+        The parsed config of a list of files,  parsed only if the files
+        changed since the last load.
+
+        :param files: <list> the config files,  later files override earlier
+
+        :return: <class 'configparser.ConfigParser'> the config file parser.
+        """
+        if isinstance(files, str):
+            files = [files]
+        key = tuple(os.path.abspath(file_name) for file_name in files)
+
+        # the watcher keeps the entries current,  no stat on the hot path
+        if self.watching():
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry:
+                    self._stats['hits'] += 1
+                    return entry[1]
+
+        mtimes = self._mtimes(key)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] == mtimes:
+                self._stats['hits'] += 1
+                return entry[1]
+
+            self._stats['reloads' if entry else 'misses'] += 1
+
+        # parse outside of the lock,  a concurrent parse of the same files
+        # is harmless and the last one wins
+        config = self._parse(key)
+        with self._lock:
+            self._entries[key] = (mtimes, config)
+
+        return config
+
+    def watching(self):
+        """
+        :return: <bool> True if the watcher thread is running
+        """
+        return self._watcher is not None and self._watcher.is_alive()
+
+    def start_watcher(self, interval=2.0, logger=None):
+        """
+        Start the background thread that checks the config files for changes
+        and swaps in the re-parsed config.
+
+        :param interval: <float> seconds between the checks
+        :param logger: <DDOILoggerClient>, optional
+            used to report the reloads and the config errors.
+        """
+        if self.watching():
+            return
+
+        self._stop_watcher.clear()
+        self._watcher = threading.Thread(target=self._watch,
+                                         args=(interval, logger),
+                                         name='config-watcher', daemon=True)
+        self._watcher.start()
+
+    def stop_watcher(self):
+        self._stop_watcher.set()
+        if self._watcher is not None:
+            self._watcher.join()
+        self._watcher = None
+
+    def _watch(self, interval, logger):
+        while not self._stop_watcher.wait(interval):
+            self.refresh(logger)
+
+    def refresh(self, logger=None):
+        """
+        Re-parse the cached configs whose files changed.  A config that fails
+        to parse or compile is reported and the previous version is kept.
+
+        :param logger: <DDOILoggerClient>, optional
+
+        :return: <int> the number of configs swapped in
+        """
+        with self._lock:
+            entries = list(self._entries.items())
+
+        swapped = 0
+        for key, (mtimes, _) in entries:
+            new_mtimes = self._mtimes(key)
+            if new_mtimes == mtimes:
+                continue
+
+            try:
+                config = self._parse(key)
+            except Exception as err:
+                with self._lock:
+                    self._stats['reload_errors'] += 1
+                    # do not retry until the files change again
+                    if key in self._entries:
+                        self._entries[key] = (new_mtimes,
+                                              self._entries[key][1])
+                if logger:
+                    logger.error(f'config reload of {key} failed,  keeping '
+                                 f'the previous version: {err}')
+                continue
+
+            with self._lock:
+                self._entries[key] = (new_mtimes, config)
+                self._stats['hot_reloads'] += 1
+            swapped += 1
+            if logger:
+                logger.info(f'config reloaded: {key}')
+
+        return swapped
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def report(self):
+        """
+        :return: <dict> the hits, misses, reloads, the hot reloads by the
+            watcher,  and the number of entries
+        """
+        with self._lock:
+            report = dict(self._stats)
+            report['entries'] = len(self._entries)
+            report['watching'] = self.watching()
+
+        return report
+
+
+# process-wide cache of the config files
+cache = ConfigCache()
@@ -1,7 +1,7 @@
 from ddoitranslatormodule.ddoiexceptions.DDOIExceptions import DDOIPreConditionNotRun
 from telescopetranslator.BaseTelescope import TelescopeBase
+from telescopetranslator.arg_schema import Arg, ArgSchema
 
-import ktl
 from collections import OrderedDict
 
 
@@ -33,6 +33,13 @@ class MoveToElevation(TelescopeBase):
     adapted from sh script: kss/mosfire/scripts/procs/tel/elabs
     """
 
+    subsystems = ('axes',)
+    ktl_writes = ('dcs.targel', 'dcs.targfram', 'dcs.movetel', 'dcs.axestat')
+    ktl_reads = ('dcs.el',)
+
+    arg_schema = ArgSchema(
+        Arg('el_offset', 'ob_keys', 'tel_elevation', float, units='deg'))
+
     @classmethod
     def add_cmdline_args(cls, parser, cfg=None):
         """
@@ -52,10 +59,10 @@ class MoveToElevation(TelescopeBase):
                              f'Modifies KTL DCS keyword: TARGEL, TARGFRAM,' \
                              f' MOVETEL.'
 
-        cls.key_el_offset = cls._cfg_val(cfg, 'ob_keys', 'tel_elevation')
+        key_el_offset = cls._cfg_val(cfg, 'ob_keys', 'tel_elevation')
 
         args_to_add = OrderedDict([
-            (cls.key_el_offset, {'type': float,
+            (key_el_offset, {'type': float,
                                 'help': 'The offset in Elevation in degrees.'})
         ])
         parser = cls._add_args(parser, args_to_add, print_only=True)
@@ -71,15 +78,14 @@ class MoveToElevation(TelescopeBase):
             defaults to a generic name specified in the config, by default None
         :param cfg: <class 'configparser.ConfigParser'> the config file parser.
         """
+        ctx = cls._context()
+
         # check if it is only set to print the current values
-        cls.print_only = args.get('print_only', False)
-        if cls.print_only:
+        ctx.print_only = args.get('print_only', False)
+        if ctx.print_only:
             return
 
-        if not hasattr(cls, 'key_el_offset'):
-            cls.key_el_offset = cls._cfg_val(cfg, 'ob_keys', 'tel_elevation')
-
-        cls.el_offset = cls._get_arg_value(args, cls.key_el_offset)
+        ctx.el_offset = cls._validate_args(cls, args, cfg).el_offset
 
     @classmethod
     def perform(cls, args, logger, cfg):
@@ -92,12 +98,14 @@ class MoveToElevation(TelescopeBase):
 
         :return: None
         """
-        if not hasattr(cls, 'print_only'):
+        ctx = cls._context()
+
+        if not hasattr(ctx, 'print_only'):
             raise DDOIPreConditionNotRun(cls.__name__)
 
         # only print the elevation
-        if cls.print_only:
-            el_value = ktl.read('dcs', 'el')
+        if ctx.print_only:
+            el_value = cls._read_kw(cls, 'dcs', 'el')
             msg = f"Current Elevation = {el_value}"
             cls.write_msg(logger, msg, print_only=True)
 
@@ -105,7 +113,7 @@ class MoveToElevation(TelescopeBase):
 
         # the ktl key name to modify and the value
         key_val = {
-            'targel': cls.el_offset,
+            'targel': ctx.el_offset,
             'targfram': 'mount',
             'movetel': 1
         }
@@ -1,5 +1,6 @@
 from ddoitranslatormodule.ddoiexceptions.DDOIExceptions import DDOIPreConditionNotRun
 from telescopetranslator.BaseTelescope import TelescopeBase
+from telescopetranslator.arg_schema import Arg, ArgSchema
 
 import telescopetranslator.tel_utils as utils
 from collections import OrderedDict
@@ -37,6 +38,16 @@ class OffsetEastNorth(TelescopeBase):
     adapted from sh script: kss/mosfire/scripts/procs/tel/en
     """
 
+    subsystems = ('axes',)
+    ktl_writes = ('dcs.raoff', 'dcs.decoff', 'dcs.rel2curr', 'dcs.axestat')
+    ktl_reads = ('dcs.poname',)
+
+    arg_schema = ArgSchema(
+        Arg('east_offset', 'ob_keys', 'tel_east_offset', float,
+            units='arcsec'),
+        Arg('north_offset', 'ob_keys', 'tel_north_offset', float,
+            units='arcsec'))
+
     @classmethod
     def add_cmdline_args(cls, parser, cfg=None):
         """
@@ -55,13 +66,13 @@ class OffsetEastNorth(TelescopeBase):
         parser.description = f'Moves telescope X,Y arcseconds East and North.' \
                              f' Modifies KTL DCS Keyword: RAOFF, DECOFF.'
 
-        cls.key_east_offset = cls._cfg_val(cfg, 'ob_keys', 'tel_east_offset')
-        cls.key_north_offset = cls._cfg_val(cfg, 'ob_keys', 'tel_north_offset')
+        key_east_offset = cls._cfg_val(cfg, 'ob_keys', 'tel_east_offset')
+        key_north_offset = cls._cfg_val(cfg, 'ob_keys', 'tel_north_offset')
 
         args_to_add = OrderedDict([
-            (cls.key_east_offset, {'type': float,
+            (key_east_offset, {'type': float,
                                    'help': 'The offset East in arcseconds.'}),
-            (cls.key_north_offset, {'type': float,
+            (key_north_offset, {'type': float,
                                     'help': 'The offset North in arcseconds.'})
             ])
 
@@ -78,16 +89,12 @@ class OffsetEastNorth(TelescopeBase):
             defaults to a generic name specified in the config, by default None
         :param cfg: <class 'configparser.ConfigParser'> the config file parser.
         """
-        if not hasattr(cls, 'key_east_offset'):
-            cls.key_east_offset = cls._cfg_val(cfg, 'ob_keys',
-                                                    'tel_east_offset')
-        if not hasattr(cls, 'key_north_offset'):
-            cls.key_north_offset = cls._cfg_val(cfg, 'ob_keys',
-                                                     'tel_north_offset')
+        ctx = cls._context()
 
-        cls.east_off = cls._get_arg_value(args, cls.key_east_offset)
-        cls.north_off = cls._get_arg_value(args, cls.key_north_offset)
-        utils.check_for_zero_offsets(cls.east_off, cls.north_off)
+        offsets = cls._validate_args(cls, args, cfg)
+        ctx.east_off = offsets.east_offset
+        ctx.north_off = offsets.north_offset
+        utils.check_for_zero_offsets(ctx.east_off, ctx.north_off)
 
     @classmethod
     def perform(cls, args, logger, cfg):
@@ -100,13 +107,15 @@ class OffsetEastNorth(TelescopeBase):
 
         :return: None
         """
-        if not hasattr(cls, 'east_off'):
+        ctx = cls._context()
+
+        if not hasattr(ctx, 'east_off'):
             raise DDOIPreConditionNotRun(cls.__name__)
 
         # the ktl key name to modify and the value
         key_val = {
-            'raoff': cls.east_off,
-            'decoff': cls.north_off,
+            'raoff': ctx.east_off,
+            'decoff': ctx.north_off,
             'rel2curr': 't'
         }
         cls._write_to_kw(cls, cfg, 'dcs', key_val, logger, cls.__name__)
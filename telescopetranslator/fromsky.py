@@ -1,8 +1,5 @@
 from telescopetranslator.BaseTelescope import TelescopeBase
-
-from telescopetranslator.en import OffsetEastNorth
-
-import ktl
+from telescopetranslator.arg_schema import ArgSchema
 
 
 class OffsetBackFromNod(TelescopeBase):
@@ -26,6 +23,14 @@ class OffsetBackFromNod(TelescopeBase):
 
     adapted from sh script: kss/mosfire/scripts/procs/tel/fromsky
     """
+
+    subsystems = ('axes', 'nod')
+    ktl_writes = ('dcs.raoff', 'dcs.decoff', 'dcs.rel2curr', 'dcs.axestat')
+    ktl_reads = ('inst.nod_north', 'inst.nod_east', 'dcs.poname')
+
+    # no arguments besides the instrument
+    arg_schema = ArgSchema()
+
     @classmethod
     def add_cmdline_args(cls, parser, cfg=None):
         """
@@ -74,23 +79,22 @@ class OffsetBackFromNod(TelescopeBase):
         """
         inst = cls.get_inst_name(cls, args, cfg)
 
-        serv_name = cls._cfg_val(cfg, 'ktl_serv', inst)
-
-        if not hasattr(cls, 'key_east_offset'):
-            cls.key_east_offset = cls._cfg_val(cfg, 'ob_keys',
-                                                    'tel_east_offset')
-        if not hasattr(cls, 'key_north_offset'):
-            cls.key_north_offset = cls._cfg_val(cfg, 'ob_keys',
-                                                     'tel_north_offset')
+        inst_cfg = cls._inst_cfg(cls, cfg, inst)
 
-        ktl_nodded_north = cls._cfg_val(cfg, f'ktl_kw_{inst}', 'nod_north')
-        ktl_nodded_east = cls._cfg_val(cfg, f'ktl_kw_{inst}', 'nod_east')
+        key_east_offset = cls._cfg_val(cfg, 'ob_keys',
+                                       'tel_east_offset')
+        key_north_offset = cls._cfg_val(cfg, 'ob_keys',
+                                        'tel_north_offset')
 
-        nodded_north = ktl.read(serv_name, ktl_nodded_north)
-        nodded_east = ktl.read(serv_name, ktl_nodded_east)
+        nodded = cls.snapshot(cls, inst_cfg.serv_name,
+                              [inst_cfg.ktl_nod_north, inst_cfg.ktl_nod_east])
+        nodded_north = float(nodded[inst_cfg.ktl_nod_north])
+        nodded_east = float(nodded[inst_cfg.ktl_nod_east])
 
-        OffsetEastNorth.execute({cls.key_east_offset: -1.0 * nodded_east,
-                                 cls.key_north_offset: -1.0 * nodded_north})
+        from telescopetranslator.en import OffsetEastNorth
+        OffsetEastNorth.execute({key_east_offset: -1.0 * nodded_east,
+                                 key_north_offset: -1.0 * nodded_north,
+                                 'instrument': inst}, cfg=cfg)
 
     @classmethod
     def post_condition(cls, args, logger, cfg):
@@ -1,9 +1,7 @@
 from ddoitranslatormodule.ddoiexceptions.DDOIExceptions import DDOIPreConditionNotRun
 from telescopetranslator.BaseTelescope import TelescopeBase
+from telescopetranslator.arg_schema import Arg, ArgSchema
 
-from telescopetranslator.gxy import OffsetGuiderCoordXY
-
-import ktl
 from collections import OrderedDict
 
 
@@ -49,6 +47,16 @@ class MoveToGuiderCenter(TelescopeBase):
     adapted from sh script: kss/mosfire/scripts/procs/tel/gcent
     """
 
+    subsystems = ('axes',)
+    ktl_writes = ('dcs.tvxoff', 'dcs.tvyoff', 'dcs.rel2curr', 'dcs.axestat')
+    # the offsets are in the rotated guider frame
+    ktl_reads = ('inst.guider_pix_scale', 'dcs.poname', 'dcs.rotpposn',
+                 'dcs.rotstat')
+
+    arg_schema = ArgSchema(
+        Arg('current_x', 'tel_keys', 'inst_x1', float, units='pixels'),
+        Arg('current_y', 'tel_keys', 'inst_y1', float, units='pixels'))
+
     @classmethod
     def add_cmdline_args(cls, parser, cfg=None):
         """
@@ -68,17 +76,17 @@ class MoveToGuiderCenter(TelescopeBase):
                              f'Coordinates.  Modifies KTL DCS keywords: ' \
                              f'TVXOFF,  TVYOFF.'
 
-        cls.key_inst_x = cls._cfg_val(cfg, 'tel_keys', 'inst_x1')
-        cls.key_inst_y = cls._cfg_val(cfg, 'tel_keys', 'inst_y1')
+        key_inst_x = cls._cfg_val(cfg, 'tel_keys', 'inst_x1')
+        key_inst_y = cls._cfg_val(cfg, 'tel_keys', 'inst_y1')
 
         parser = cls._add_inst_arg(cls, parser, cfg)
 
         args_to_add = OrderedDict([
-            (cls.key_inst_x, {
+            (key_inst_x, {
                 'type': float,
                 'help': 'The X pixel position to move to guider center.'
             }),
-            (cls.key_inst_y, {
+            (key_inst_y, {
                 'type': float,
                 'help': 'The Y pixel position to move to guider center.'
             })
@@ -96,13 +104,11 @@ class MoveToGuiderCenter(TelescopeBase):
             defaults to a generic name specified in the config, by default None
         :param cfg: <class 'configparser.ConfigParser'> the config file parser.
         """
-        if not hasattr(cls, 'key_inst_x'):
-            cls.key_inst_x = cls._cfg_val(cfg, 'tel_keys', 'inst_x1')
-        if not hasattr(cls, 'key_inst_y'):
-            cls.key_inst_y = cls._cfg_val(cfg, 'tel_keys', 'inst_y1')
+        ctx = cls._context()
 
-        cls.current_x = cls._get_arg_value(args, cls.key_inst_x)
-        cls.current_y = cls._get_arg_value(args, cls.key_inst_y)
+        position = cls._validate_args(cls, args, cfg)
+        ctx.current_x = position.current_x
+        ctx.current_y = position.current_y
 
     @classmethod
     def perform(cls, args, logger, cfg):
@@ -115,30 +121,28 @@ class MoveToGuiderCenter(TelescopeBase):
 
         :return: None
         """
-        if not hasattr(cls, 'current_x'):
+        ctx = cls._context()
+
+        if not hasattr(ctx, 'current_x'):
             raise DDOIPreConditionNotRun(cls.__name__)
 
         inst = cls.get_inst_name(cls, args, cfg)
-        serv_name = cls._cfg_val(cfg, 'ktl_serv', inst)
+        inst_cfg = cls._inst_cfg(cls, cfg, inst)
 
         # these are values that later will be KTL keywords
-        guider_cent_x = cls._cfg_val(cfg, f'{inst}_parameters',
-                                          'guider_cent_x')
-        guider_cent_y = cls._cfg_val(cfg, f'{inst}_parameters',
-                                          'guider_cent_y')
-
-        ktl_pixel_scale = cls._cfg_val(cfg, f"ktl_kw_{inst}",
-                                            'guider_pix_scale')
-        guider_pix_scale = ktl.read(serv_name, ktl_pixel_scale)
+        guider_pix_scale = float(cls._read_kw_cached(
+            cls, cfg, inst_cfg.serv_name, inst_cfg.ktl_guider_pix_scale))
 
-        dx = guider_pix_scale * (cls.current_x - guider_cent_x)
-        dy = guider_pix_scale * (guider_cent_y - cls.current_y)
+        dx = guider_pix_scale * (ctx.current_x - inst_cfg.guider_cent_x)
+        dy = guider_pix_scale * (inst_cfg.guider_cent_y - ctx.current_y)
 
         # get the OB keywords
         key_gx_offset = cls._cfg_val(cfg, 'ob_keys', 'guider_x_offset')
-        key_gy_offset = cls._cfg_val(cfg, 'ob_keys', 'guider_x_offset')
+        key_gy_offset = cls._cfg_val(cfg, 'ob_keys', 'guider_y_offset')
 
-        OffsetGuiderCoordXY.execute({key_gx_offset: dx, key_gy_offset: dy})
+        from telescopetranslator.gxy import OffsetGuiderCoordXY
+        OffsetGuiderCoordXY.execute({key_gx_offset: dx, key_gy_offset: dy,
+                                     'instrument': inst}, cfg=cfg)
 
     @classmethod
     def post_condition(cls, args, logger, cfg):
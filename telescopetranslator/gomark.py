@@ -1,9 +1,8 @@
 from telescopetranslator.BaseTelescope import TelescopeBase
+from telescopetranslator.arg_schema import ArgSchema
 
 import telescopetranslator.tel_utils as utils
 
-import ktl
-
 
 class GoToMark(TelescopeBase):
     """
@@ -27,6 +26,13 @@ class GoToMark(TelescopeBase):
     adapted from sh script: kss/mosfire/scripts/procs/tel/gmomark
     """
 
+    subsystems = ('axes', 'mark')
+    ktl_writes = ('dcs.raoff', 'dcs.decoff', 'dcs.rel2base', 'dcs.axestat')
+    ktl_reads = ('inst.ra_mark', 'inst.dec_mark')
+
+    # no arguments besides the instrument
+    arg_schema = ArgSchema()
+
     @classmethod
     def add_cmdline_args(cls, parser, cfg=None):
         """
@@ -75,12 +81,12 @@ class GoToMark(TelescopeBase):
         """
         inst = cls.get_inst_name(cls, args, cfg)
 
-        inst_serv_name = cls._cfg_val(cfg, 'ktl_serv', inst)
-        ktl_ra_mark = cls._cfg_val(cfg, f'ktl_kw_{inst}', 'ra_mark')
-        ktl_dec_mark = cls._cfg_val(cfg, f'ktl_kw_{inst}', 'dec_mark')
+        inst_cfg = cls._inst_cfg(cls, cfg, inst)
 
-        ra_mark = ktl.read(inst_serv_name, ktl_ra_mark)
-        dec_mark = ktl.read(inst_serv_name, ktl_dec_mark)
+        marks = cls.snapshot(cls, inst_cfg.serv_name,
+                             [inst_cfg.ktl_ra_mark, inst_cfg.ktl_dec_mark])
+        ra_mark = marks[inst_cfg.ktl_ra_mark]
+        dec_mark = marks[inst_cfg.ktl_dec_mark]
 
         # the ktl key name to modify and the value
         key_val = {
@@ -103,6 +109,6 @@ class GoToMark(TelescopeBase):
 
         :return: None
         """
-        utils.wait_for_cycle(cls, cfg, cls.serv_name, logger)
+        utils.wait_for_cycle(cls, cfg, 'dcs', logger)
 
 
@@ -1,4 +1,5 @@
 from telescopetranslator.BaseTelescope import TelescopeBase
+from telescopetranslator.arg_schema import ArgSchema
 
 
 class GoToBase(TelescopeBase):
@@ -26,6 +27,13 @@ class GoToBase(TelescopeBase):
     adapted from sh script: kss/mosfire/scripts/procs/tel/gotobase
     """
 
+    subsystems = ('axes',)
+    ktl_writes = ('dcs.raoff', 'dcs.decoff', 'dcs.rel2base', 'dcs.axestat')
+    ktl_reads = ()
+
+    # no arguments besides the instrument
+    arg_schema = ArgSchema()
+
     @classmethod
     def pre_condition(cls, args, logger, cfg):
         """
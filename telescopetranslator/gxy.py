@@ -1,5 +1,6 @@
 from ddoitranslatormodule.ddoiexceptions.DDOIExceptions import DDOIPreConditionNotRun
 from telescopetranslator.BaseTelescope import TelescopeBase
+from telescopetranslator.arg_schema import Arg, ArgSchema
 
 import telescopetranslator.tel_utils as utils
 from collections import OrderedDict
@@ -35,6 +36,15 @@ class OffsetGuiderCoordXY(TelescopeBase):
 
     """
 
+    subsystems = ('axes',)
+    ktl_writes = ('dcs.tvxoff', 'dcs.tvyoff', 'dcs.rel2curr', 'dcs.axestat')
+    # the offsets are in the rotated guider frame
+    ktl_reads = ('dcs.poname', 'dcs.rotpposn', 'dcs.rotstat')
+
+    arg_schema = ArgSchema(
+        Arg('x_offset', 'ob_keys', 'guider_x_offset', float, units='pixels'),
+        Arg('y_offset', 'ob_keys', 'guider_y_offset', float, units='pixels'))
+
     @classmethod
     def add_cmdline_args(cls, parser, cfg=None):
         """
@@ -54,17 +64,17 @@ class OffsetGuiderCoordXY(TelescopeBase):
                              f'Coordinates.  Modifies KTL DCS Keywords: ' \
                              f'TVXOFF, TVYOFF.'
 
-        cls.key_x_offset = cls._cfg_val(cfg, 'ob_keys', 'guider_x_offset')
-        cls.key_y_offset = cls._cfg_val(cfg, 'ob_keys', 'guider_y_offset')
+        key_x_offset = cls._cfg_val(cfg, 'ob_keys', 'guider_x_offset')
+        key_y_offset = cls._cfg_val(cfg, 'ob_keys', 'guider_y_offset')
 
         parser = cls._add_inst_arg(cls, parser, cfg)
 
         args_to_add = OrderedDict([
-            (cls.key_x_offset, {
+            (key_x_offset, {
                 'type': float,
                 'help': 'The offset in Guider X offset in pixels.'
             }),
-            (cls.key_y_offset, {
+            (key_y_offset, {
                 'type': float,
                 'help': 'The offset in Guider Y offset in pixels.'
             })
@@ -82,11 +92,11 @@ class OffsetGuiderCoordXY(TelescopeBase):
             defaults to a generic name specified in the config, by default None
         :param cfg: <class 'configparser.ConfigParser'> the config file parser.
         """
-        key_x_offset = cls._cfg_val(cfg, 'ob_keys', 'guider_x_offset')
-        key_y_offset = cls._cfg_val(cfg, 'ob_keys', 'guider_y_offset')
+        ctx = cls._context()
 
-        cls.x_off = cls._get_arg_value(args, key_x_offset)
-        cls.y_off = cls._get_arg_value(args, key_y_offset)
+        offsets = cls._validate_args(cls, args, cfg)
+        ctx.x_off = offsets.x_offset
+        ctx.y_off = offsets.y_offset
 
     @classmethod
     def perform(cls, args, logger, cfg):
@@ -99,13 +109,15 @@ class OffsetGuiderCoordXY(TelescopeBase):
 
         :return: None
         """
-        if not hasattr(cls, 'x_off'):
+        ctx = cls._context()
+
+        if not hasattr(ctx, 'x_off'):
             raise DDOIPreConditionNotRun(cls.__name__)
 
         # the ktl key name to modify and the value
         key_val = {
-            'tvxoff': cls.x_off,
-            'tvyoff': cls.y_off,
+            'tvxoff': ctx.x_off,
+            'tvyoff': ctx.y_off,
             'rel2curr': 't'
         }
         cls._write_to_kw(cls, cfg, 'dcs', key_val, logger, cls.__name__)
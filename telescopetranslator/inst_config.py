@@ -0,0 +1,150 @@
+"""
+Compiled per-instrument configuration.
+
+The [ktl_serv], [ktl_kw_<inst>] and [<inst>_parameters] values of the merged
+default + instrument config files are converted once,  when the config is
+loaded,  into an immutable InstConfig per instrument.  A malformed value fails
+the config load instead of a command part way through a move.
+"""
+from ddoitranslatormodule.ddoiexceptions.DDOIExceptions import DDOIConfigException
+
+import math
+import weakref
+import threading
+
+# {id(ConfigParser): {inst: InstConfig}},  dropped with the ConfigParser
+_compiled = {}
+_compiled_lock = threading.Lock()
+
+# InstConfig attribute: [ktl_kw_<inst>] key
+_KTL_KEYWORDS = {
+    'ktl_nod_north': 'nod_north',
+    'ktl_nod_east': 'nod_east',
+    'ktl_ra_mark': 'ra_mark',
+    'ktl_dec_mark': 'dec_mark',
+    'ktl_pixel_scale': 'pixel_scale',
+    'ktl_guider_pix_scale': 'guider_pix_scale'
+}
+
+# [<inst>_parameters] keys,  all floats
+_PARAMETERS = ('det_angle', 'rot_min_ang', 'rot_max_ang', 'guider_cent_x',
+               'guider_cent_y')
+
+
+class InstConfig:
+    """
+    The configuration of one instrument.
+
+    name = the instrument name (lower case)
+    serv_name = the instrument KTL service
+    ktl_* = the instrument KTL keyword names
+    det_angle = the detector angle [degrees]
+    det_sin, det_cos = sin/cos of the detector angle
+    rot_min_ang, rot_max_ang = the rotator limits [degrees]
+    guider_cent_x, guider_cent_y = the guider center [pixels]
+    """
+    __slots__ = ('name', 'serv_name', 'det_sin', 'det_cos') + \
+        tuple(_KTL_KEYWORDS) + _PARAMETERS
+
+    def __init__(self, name, serv_name, ktl_keywords, parameters):
+        """
+        :param name: <str> the instrument name
+        :param serv_name: <str> the instrument KTL service
+        :param ktl_keywords: <dict> {attribute: KTL keyword name}
+        :param parameters: <dict> {parameter: float}
+        """
+        values = dict(ktl_keywords, **parameters)
+        values['name'] = name
+        values['serv_name'] = serv_name
+        det_angle = math.radians(parameters['det_angle'])
+        values['det_sin'] = math.sin(det_angle)
+        values['det_cos'] = math.cos(det_angle)
+
+        for attr, val in values.items():
+            object.__setattr__(self, attr, val)
+
+    def __setattr__(self, attr, val):
+        raise AttributeError(f'{type(self).__name__} is read-only')
+
+    def __delattr__(self, attr):
+        raise AttributeError(f'{type(self).__name__} is read-only')
+
+    def __repr__(self):
+        return f'InstConfig({self.name})'
+
+
+def _compile_inst(cfg, inst):
+    """
+    Compile the configuration of one instrument.
+
+    :param cfg: <class 'configparser.ConfigParser'> the config file parser.
+    :param inst: <str> the instrument name (lower case)
+
+    :return: <InstConfig>
+    """
+    kw_section = f'ktl_kw_{inst}'
+    param_section = f'{inst}_parameters'
+
+    try:
+        serv_name = cfg.get('ktl_serv', inst)
+        ktl_keywords = {attr: cfg.get(kw_section, key)
+                        for attr, key in _KTL_KEYWORDS.items()}
+    except Exception as err:
+        msg = f'configuration error for instrument {inst}: {err}'
+        raise DDOIConfigException(msg)
+
+    parameters = {}
+    for key in _PARAMETERS:
+        try:
+            parameters[key] = cfg.getfloat(param_section, key)
+        except Exception as err:
+            msg = f'configuration error for instrument {inst}, ' \
+                  f'[{param_section}] {key}: {err}'
+            raise DDOIConfigException(msg)
+
+    return InstConfig(inst, serv_name, ktl_keywords, parameters)
+
+
+def compile_config(cfg):
+    """
+    Compile every instrument defined in a config,  an instrument is defined
+    by its [<inst>_parameters] section.  Called when the config is loaded.
+
+    :param cfg: <class 'configparser.ConfigParser'> the config file parser.
+
+    :return: <dict> {inst: InstConfig}
+    """
+    compiled = {}
+    for section in cfg.sections():
+        if section.endswith('_parameters'):
+            inst = section[:-len('_parameters')].lower()
+            compiled[inst] = _compile_inst(cfg, inst)
+
+    key = id(cfg)
+    with _compiled_lock:
+        _compiled[key] = compiled
+    weakref.finalize(cfg, _compiled.pop, key, None)
+
+    return compiled
+
+
+def get_inst_config(cfg, inst):
+    """
+    The compiled configuration of an instrument.
+
+    :param cfg: <class 'configparser.ConfigParser'> the config file parser.
+    :param inst: <str> the instrument name
+
+    :return: <InstConfig>
+    """
+    with _compiled_lock:
+        compiled = _compiled.get(id(cfg))
+
+    if compiled is None:
+        compiled = compile_config(cfg)
+
+    try:
+        return compiled[inst.lower()]
+    except KeyError:
+        msg = f'no configuration for instrument {inst}'
+        raise DDOIConfigException(msg)
@@ -0,0 +1,134 @@
+"""
+Retry policy and metrics for KTL keyword writes.
+
+The policy is read from the config files,  [ktl_retry] holds the defaults,
+[ktl_retry_<service>] overrides them for a service and
+[ktl_retry_<service>_<keyword>] for a single keyword.
+"""
+import random
+import threading
+
+# policy used if the config files do not define one
+DEFAULT_POLICY = {
+    'max_attempts': 2,
+    'backoff': 0.2,
+    'backoff_factor': 2.0,
+    'max_backoff': 2.0,
+    'jitter': 0.1
+}
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with jitter for a KTL keyword write.
+
+    max_attempts = total number of attempts,  including the first one
+    backoff = the delay before the first retry [seconds]
+    backoff_factor = the delay multiplier for each following retry
+    max_backoff = the upper limit of the delay [seconds]
+    jitter = the fraction of the delay that is randomized (+/-)
+    """
+    __slots__ = ('max_attempts', 'backoff', 'backoff_factor', 'max_backoff',
+                 'jitter')
+
+    def __init__(self, max_attempts, backoff, backoff_factor, max_backoff,
+                 jitter):
+        self.max_attempts = max(1, int(max_attempts))
+        self.backoff = float(backoff)
+        self.backoff_factor = float(backoff_factor)
+        self.max_backoff = float(max_backoff)
+        self.jitter = float(jitter)
+
+    @classmethod
+    def from_cfg(cls, cfg, ktl_service, ktl_key=None):
+        """
+        Build the policy for a service/keyword from the config files.
+
+        :param cfg: <class 'configparser.ConfigParser'> the config file parser.
+        :param ktl_service: <str> The KTL service name
+        :param ktl_key: <str> The KTL keyword name,  optional
+
+        :return: <RetryPolicy>
+        """
+        params = dict(DEFAULT_POLICY)
+        if not cfg:
+            return cls(**params)
+
+        service_section = f'ktl_retry_{ktl_service.lower()}'
+        sections = ['ktl_retry', service_section]
+        if ktl_key:
+            sections.append(f'{service_section}_{ktl_key.lower()}')
+
+        for section in sections:
+            if not cfg.has_section(section):
+                continue
+            for param in params:
+                if cfg.has_option(section, param):
+                    params[param] = cfg.get(section, param)
+
+        return cls(**params)
+
+    def delay(self, attempt):
+        """
+        The time to wait before the next attempt.
+
+        :param attempt: <int> the number of the attempt that failed (1 based)
+
+        :return: <float> the delay in seconds
+        """
+        delay = min(self.max_backoff,
+                    self.backoff * self.backoff_factor ** (attempt - 1))
+        delay *= 1.0 + random.uniform(-self.jitter, self.jitter)
+
+        return max(0.0, delay)
+
+
+class RetryStats:
+    """
+    Write counts,  retry counts and write latencies per service/keyword.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = {}
+
+    def record(self, ktl_service, ktl_key, latency, retries=0, failed=False):
+        """
+        Record a keyword write.
+
+        :param ktl_service: <str> The KTL service name
+        :param ktl_key: <str> The KTL keyword name
+        :param latency: <float> seconds from the first send to completion
+        :param retries: <int> the number of retries needed
+        :param failed: <bool> True if the write failed after all attempts
+        """
+        key = (ktl_service.lower(), ktl_key.lower())
+        with self._lock:
+            stats = self._stats.setdefault(key, {
+                'writes': 0, 'retries': 0, 'failures': 0,
+                'total_latency': 0.0, 'max_latency': 0.0})
+            stats['writes'] += 1
+            stats['retries'] += retries
+            stats['failures'] += int(failed)
+            stats['total_latency'] += latency
+            stats['max_latency'] = max(stats['max_latency'], latency)
+
+    def report(self):
+        """
+        :return: <dict> {(service, keyword): stats} including the mean latency
+        """
+        with self._lock:
+            report = {key: dict(stats) for key, stats in self._stats.items()}
+
+        for stats in report.values():
+            stats['mean_latency'] = stats['total_latency'] / stats['writes']
+
+        return report
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+
+# process-wide metrics for the KTL writes
+stats = RetryStats()
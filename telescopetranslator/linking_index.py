@@ -0,0 +1,199 @@
+"""
+Compiled index of the CLI linking table.
+
+linking_table.yml is compiled into a small JSON file in the user cache
+directory,  keyed by the path, mtime and size of the YAML file.  The CLI reads
+the JSON on start up,  PyYAML is only imported when the index is rebuilt.
+"""
+import os
+import json
+import hashlib
+import tempfile
+from pathlib import Path
+from typing import List, Tuple
+
+# bump when the layout of the compiled index changes
+INDEX_VERSION = 1
+
+
+def cache_dir() -> Path:
+    """The directory holding the compiled linking table indexes
+
+    Returns
+    -------
+    Path
+        $XDG_CACHE_HOME/telescopetranslator,  or ~/.cache/telescopetranslator
+    """
+    base = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    return Path(base) / 'telescopetranslator'
+
+
+def _source_id(filename) -> dict:
+    stat = os.stat(filename)
+    return {'source': str(Path(filename).resolve()),
+            'mtime': stat.st_mtime_ns,
+            'size': stat.st_size,
+            'version': INDEX_VERSION}
+
+
+def compile_table(filename) -> dict:
+    """Parse a linking table and resolve every entry point
+
+    Parameters
+    ----------
+    filename : str
+        Filepath to the linking table
+
+    Returns
+    -------
+    dict
+        {entry point: {'link', 'module', 'class', 'args'}}
+    """
+    import yaml
+
+    with open(filename) as f:
+        cfg = yaml.load(f, Loader=yaml.FullLoader)
+
+    prefix = cfg['common']['prefix']
+    suffix = cfg['common']['suffix']
+
+    entries = {}
+    for entry_point, link_cfg in cfg['links'].items():
+        link = link_cfg['cmd']
+        if prefix:
+            link = prefix + "." + link
+        if suffix:
+            link = link + "." + suffix
+
+        args = []
+        for arg, val in (link_cfg.get('args') or {}).items():
+            args.append((int(arg.split("_")[1]), val))
+
+        module_str, _, class_str = link.rpartition(".")
+        entries[entry_point] = {'link': link, 'module': module_str,
+                                'class': class_str, 'args': args}
+
+    return entries
+
+
+class LinkingIndex():
+    """Compiled linking table,  a drop in for LinkingTable in the CLI
+    """
+
+    def __init__(self, filename, index_dir=None):
+        """Load the compiled index,  rebuilding it if the linking table changed
+
+        Parameters
+        ----------
+        filename : str
+            Filepath to the linking table
+        index_dir : Path, optional
+            Directory of the compiled index,  by default cache_dir()
+        """
+        self.filename = filename
+        index_dir = Path(index_dir) if index_dir else cache_dir()
+        source = _source_id(filename)
+        name = Path(source['source']).stem
+        digest = hashlib.sha1(source['source'].encode()).hexdigest()[:12]
+        self.index_file = index_dir / f"{name}-{digest}.json"
+
+        self.links = self._load(source)
+        if self.links is None:
+            self.links = compile_table(filename)
+            self._save(source, index_dir)
+
+    def _load(self, source):
+        try:
+            with open(self.index_file) as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if index.get('source_id') != source:
+            return None
+
+        return index['links']
+
+    def _save(self, source, index_dir):
+        # write to a temporary file and rename,  a concurrent CLI never sees
+        # a partial index.  The index is only an optimization,  a read-only
+        # cache directory is not an error.
+        try:
+            index_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=index_dir, suffix='.tmp')
+        except OSError:
+            return
+
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump({'source_id': source, 'links': self.links}, f)
+            os.replace(tmp_name, self.index_file)
+        except (OSError, TypeError, ValueError):
+            try:
+                os.remove(tmp_name)
+            except OSError:
+                pass
+
+    def __contains__(self, entry_point) -> bool:
+        return entry_point in self.links
+
+    def get_entry_points(self) -> List[str]:
+        """Gets a list of all the entry points listed in the linking table
+
+        Returns
+        -------
+        List[str]
+            List of all entry points (keys) in the linking table
+        """
+        return list(self.links)
+
+    def print_entry_points(self, prefix="") -> None:
+        """Prints out all the entry points listed in the linking table
+
+        Parameters
+        ----------
+        prefix : str, optional
+            String to be prepended to each line, by default ""
+        """
+        for i in self.links:
+            print(prefix + i)
+
+    def get_link(self, entry_point) -> str:
+        """Gets the full import string for a given entry point (key)
+
+        Raises
+        ------
+        KeyError
+            Raised if the linking table does not have an entry matching entry_point
+        """
+        if entry_point not in self.links:
+            raise KeyError(f"Failed to find {entry_point} in table")
+        return self.links[entry_point]['link']
+
+    def get_module_and_class(self, entry_point) -> Tuple[str, str]:
+        """Gets the module import string and the class name of an entry point
+
+        Raises
+        ------
+        KeyError
+            Raised if the linking table does not have an entry matching entry_point
+        """
+        if entry_point not in self.links:
+            raise KeyError(f"Failed to find {entry_point} in table")
+        entry = self.links[entry_point]
+        return entry['module'], entry['class']
+
+    def get_link_and_args(self, entry_point) -> Tuple[str, list]:
+        """Gets both an import string for an entry point, and a list of Tuples
+        containing information about default arguments needed
+
+        Returns
+        -------
+        Tuple[str, list]
+            Import string for the entry point, and a list of tuples where the
+            first item is the index where the argument must be inserted, and
+            the second is the argument
+        """
+        link = self.get_link(entry_point)
+        args = [tuple(arg) for arg in self.links[entry_point]['args']]
+        return link, args
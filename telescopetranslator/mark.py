@@ -1,6 +1,6 @@
 from telescopetranslator.BaseTelescope import TelescopeBase
+from telescopetranslator.arg_schema import ArgSchema
 
-import ktl
 import math
 
 
@@ -28,6 +28,15 @@ class MarkCoords(TelescopeBase):
 
     adapted from sh script: kss/mosfire/scripts/procs/tel/mark
     """
+
+    # only records the offsets,  does not move the telescope
+    subsystems = ('mark',)
+    ktl_writes = ('inst.ra_mark', 'inst.dec_mark')
+    ktl_reads = ('dcs.raoff', 'dcs.decoff', 'dcs.dec')
+
+    # no arguments besides the instrument
+    arg_schema = ArgSchema()
+
     @classmethod
     def add_cmdline_args(cls, parser, cfg=None):
         """
@@ -73,19 +82,19 @@ class MarkCoords(TelescopeBase):
         """
         inst = cls.get_inst_name(cls, args, cfg)
 
-        # for precision read the raw (binary) versions -- in radians.
-        current_ra_offset = ktl.read('dcs', 'raoff', binary=True)
-        current_dec_offset = ktl.read('dcs', 'decoff', binary=True)
+        # for precision read the raw (binary) versions -- in radians.  The
+        # offsets and dec are sampled together for the cos(Dec) correction.
+        sample = cls.snapshot(cls, 'dcs', ['raoff', 'decoff', 'dec'],
+                              binary=True)
 
-        current_ra_offset = current_ra_offset * 180.0 * 3600.0 / math.pi
-        current_dec_offset = current_dec_offset * 180.0 * 3600.0 / math.pi
+        current_ra_offset = sample['raoff'] * 180.0 * 3600.0 / math.pi
+        current_dec_offset = sample['decoff'] * 180.0 * 3600.0 / math.pi
 
         # There is a bug in DCS where the value of RAOFF read back has been
         # divided by cos(Dec).  That is corrected here.
-        current_dec = ktl.read('dcs', 'dec', binary=True)
-        current_ra_offset = current_ra_offset * math.cos(current_dec)
+        current_ra_offset = current_ra_offset * math.cos(sample['dec'])
 
-        inst_serv_name = cls._cfg_val(cfg, 'ktl_serv', inst)
+        inst_serv_name = cls._inst_cfg(cls, cfg, inst).serv_name
 
         # write to instrument keywords,  keys are cfg keys not ktl keys
         key_val = {
@@ -1,4 +1,5 @@
 from telescopetranslator.BaseTelescope import TelescopeBase
+from telescopetranslator.arg_schema import ArgSchema
 
 
 class MarkBase(TelescopeBase):
@@ -29,6 +30,14 @@ class MarkBase(TelescopeBase):
 
     adapted from sh script: kss/mosfire/scripts/procs/tel/markbase
     """
+
+    subsystems = ('axes',)
+    ktl_writes = ('dcs.mark', 'dcs.raoff', 'dcs.decoff')
+    ktl_reads = ()
+
+    # no arguments besides the instrument
+    arg_schema = ArgSchema()
+
     @classmethod
     def add_cmdline_args(cls, parser, cfg=None):
         """
@@ -1,9 +1,7 @@
 from ddoitranslatormodule.ddoiexceptions.DDOIExceptions import DDOIPreConditionNotRun
 from telescopetranslator.BaseTelescope import TelescopeBase
+from telescopetranslator.arg_schema import Arg, ArgSchema
 
-from telescopetranslator.mxy import OffsetXY
-
-import ktl
 from collections import OrderedDict
 
 
@@ -50,6 +48,21 @@ class MoveP1ToP2(TelescopeBase):
     adapted from sh script: kss/mosfire/scripts/procs/tel/mov
     """
 
+    subsystems = ('axes',)
+    ktl_writes = ('dcs.instxoff', 'dcs.instyoff', 'dcs.rel2curr',
+                  'dcs.axestat')
+    # the offsets are in the rotated instrument frame
+    ktl_reads = ('inst.pixel_scale', 'dcs.poname', 'dcs.rotpposn',
+                 'dcs.rotstat')
+
+    arg_schema = ArgSchema(
+        Arg('inst_x1', 'tel_keys', 'inst_x1', float, units='pixels'),
+        Arg('inst_y1', 'tel_keys', 'inst_y1', float, units='pixels'),
+        Arg('inst_x2', 'tel_keys', 'inst_x2', float, units='pixels'),
+        Arg('inst_y2', 'tel_keys', 'inst_y2', float, units='pixels'),
+        Arg('print_only', 'tel_keys', 'print_only', bool, required=False,
+            default=False))
+
     @classmethod
     def add_cmdline_args(cls, parser, cfg=None):
         """
@@ -69,27 +82,27 @@ class MoveP1ToP2(TelescopeBase):
                              f'the detector to another.  Modifies KTL DCS ' \
                              f'Keywords: INSTXOFF and Y: INSTYOFF.'
 
-        cls.key_inst_x1 = cls._cfg_val(cfg, 'tel_keys', 'inst_x1')
-        cls.key_inst_y1 = cls._cfg_val(cfg, 'tel_keys', 'inst_y1')
-        cls.key_inst_x2 = cls._cfg_val(cfg, 'tel_keys', 'inst_x2')
-        cls.key_inst_y2 = cls._cfg_val(cfg, 'tel_keys', 'inst_y2')
+        key_inst_x1 = cls._cfg_val(cfg, 'tel_keys', 'inst_x1')
+        key_inst_y1 = cls._cfg_val(cfg, 'tel_keys', 'inst_y1')
+        key_inst_x2 = cls._cfg_val(cfg, 'tel_keys', 'inst_x2')
+        key_inst_y2 = cls._cfg_val(cfg, 'tel_keys', 'inst_y2')
 
         parser = cls._add_inst_arg(cls, parser, cfg, is_req=False)
 
         args_to_add = OrderedDict([
-            (cls.key_inst_x1, {
+            (key_inst_x1, {
                 'type': float,
                 'help': 'The X pixel position of the detector position 1.'
             }),
-            (cls.key_inst_y1, {
+            (key_inst_y1, {
                 'type': float,
                 'help': 'The Y pixel position of the detector position 1.'
             }),
-            (cls.key_inst_x2, {
+            (key_inst_x2, {
                 'type': float,
                 'help': 'The X pixel position of the detector position 2.'
             }),
-            (cls.key_inst_y2, {
+            (key_inst_y2, {
                 'type': float,
                 'help': 'The Y pixel position of the detector position 2.'
             })
@@ -107,21 +120,14 @@ class MoveP1ToP2(TelescopeBase):
             defaults to a generic name specified in the config, by default None
         :param cfg: <class 'configparser.ConfigParser'> the config file parser.
         """
-        cls.inst = cls.get_inst_name(cls, args, cfg)
-
-        tel_key_list = ['inst_x1', 'inst_y1', 'inst_x2', 'inst_y2']
-        cls.print_only = args.get('print_only', False)
-        if cls.print_only:
-            return
+        ctx = cls._context()
 
-        cls.coords = {}
-        for tel_key in tel_key_list:
-            if not hasattr(cls, tel_key):
-                key_inst = cls._cfg_val(cfg, 'tel_keys', tel_key)
-            else:
-                key_inst = getattr(cls, tel_key)
+        ctx.inst = cls.get_inst_name(cls, args, cfg)
 
-            cls.coords[tel_key] = cls._get_arg_value(args, key_inst)
+        points = cls._validate_args(cls, args, cfg)
+        ctx.print_only = points.print_only
+        ctx.coords = {'inst_x1': points.inst_x1, 'inst_y1': points.inst_y1,
+                      'inst_x2': points.inst_x2, 'inst_y2': points.inst_y2}
 
     @classmethod
     def perform(cls, args, logger, cfg):
@@ -134,30 +140,35 @@ class MoveP1ToP2(TelescopeBase):
 
         :return: None
         """
-        if not hasattr(cls, 'print_only'):
+        ctx = cls._context()
+
+        if not hasattr(ctx, 'print_only'):
             raise DDOIPreConditionNotRun(cls.__name__)
 
-        cls.inst_serv_name = cls._cfg_val(cfg, 'ktl_serv', cls.inst)
-        ktl_pixel_scale = cls._cfg_val(cfg, f'ktl_kw_{cls.inst}',
-                                            'pixel_scale')
+        inst_cfg = cls._inst_cfg(cls, cfg, ctx.inst)
+        ctx.inst_serv_name = inst_cfg.serv_name
 
-        pixel_scale = ktl.read(cls.inst_serv_name, ktl_pixel_scale)
+        pixel_scale = float(cls._read_kw_cached(cls, cfg, ctx.inst_serv_name,
+                                                inst_cfg.ktl_pixel_scale))
 
-        dx = pixel_scale * (cls.coords['inst_x1'] - cls.coords['inst_x2'])
-        dy = pixel_scale * (cls.coords['inst_y1'] - cls.coords['inst_y2'])
+        dx = pixel_scale * (ctx.coords['inst_x1'] - ctx.coords['inst_x2'])
+        dy = pixel_scale * (ctx.coords['inst_y1'] - ctx.coords['inst_y2'])
 
-        if cls.print_only:
+        if ctx.print_only:
             msg = f"Required shift is X: {dx} Y: {dy}"
             cls.write_msg(logger, msg, print_only=True)
             return
 
         key_x_offset = cls._cfg_val(cfg, 'tel_keys', 'inst_x_offset')
         key_y_offset = cls._cfg_val(cfg, 'tel_keys', 'inst_y_offset')
-        OffsetXY.execute({key_x_offset: dx, key_y_offset: dy})
 
-        msg = f"Moving target from pixel: ({cls.coords['inst_x1']}," \
-              f"{cls.coords['inst_y1']}) to ({cls.coords['inst_x1']}," \
-              f"{cls.coords['inst_y1']}),  magnitude X: {dx} Y: {dy}"
+        from telescopetranslator.mxy import OffsetXY
+        OffsetXY.execute({key_x_offset: dx, key_y_offset: dy,
+                          'instrument': ctx.inst}, cfg=cfg)
+
+        msg = f"Moving target from pixel: ({ctx.coords['inst_x1']}," \
+              f"{ctx.coords['inst_y1']}) to ({ctx.coords['inst_x1']}," \
+              f"{ctx.coords['inst_y1']}),  magnitude X: {dx} Y: {dy}"
 
         cls.write_msg(logger, msg)
 
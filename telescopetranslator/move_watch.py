@@ -0,0 +1,41 @@
+"""
+Start detection for telescope and rotator moves.
+
+A MoveWatcher is armed on a status keyword (ie: AXESTAT, ROTSTAT) before the
+move is commanded,  so even a move that is over in a fraction of a second is
+seen.  The move has started when the status leaves the "done" values,  the
+end of the move is waited for in the post_condition of the translator.
+"""
+import threading
+
+
+class MoveWatcher:
+    """
+    Follow a status keyword until a move starts.
+
+    :param kw: <ktl.Keyword> the status keyword handle
+    :param done_vals: the ascii or binary values of the keyword when no move
+        is in progress (ie: 'tracking')
+
+    started = <threading.Event> set when the status leaves the done values
+    """
+
+    def __init__(self, kw, done_vals):
+        self.kw = kw
+        self.done_vals = {str(val).lower() for val in done_vals}
+        self.started = threading.Event()
+
+        kw.callback(self._update)
+        if not kw['monitored']:
+            kw.monitor()
+
+    def _update(self, keyword):
+        if not keyword['populated']:
+            return
+
+        vals = {str(keyword['ascii']).lower(), str(keyword['binary']).lower()}
+        if not vals & self.done_vals:
+            self.started.set()
+
+    def close(self):
+        self.kw.callback(self._update, remove=True)
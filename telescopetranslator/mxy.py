@@ -1,5 +1,6 @@
 from ddoitranslatormodule.ddoiexceptions.DDOIExceptions import DDOIPreConditionNotRun
 from telescopetranslator.BaseTelescope import TelescopeBase
+from telescopetranslator.arg_schema import Arg, ArgSchema
 
 import telescopetranslator.tel_utils as utils
 
@@ -36,6 +37,16 @@ class OffsetXY(TelescopeBase):
     adapted from kss/mosfire/scripts/procs/tel/mxy
     """
 
+    subsystems = ('axes',)
+    ktl_writes = ('dcs.instxoff', 'dcs.instyoff', 'dcs.rel2curr',
+                  'dcs.axestat')
+    # the offsets are in the rotated instrument frame
+    ktl_reads = ('dcs.poname', 'dcs.rotpposn', 'dcs.rotstat')
+
+    arg_schema = ArgSchema(
+        Arg('x_offset', 'ob_keys', 'inst_x_offset', float, units='arcsec'),
+        Arg('y_offset', 'ob_keys', 'inst_y_offset', float, units='arcsec'))
+
     @classmethod
     def add_cmdline_args(cls, parser, cfg=None):
         """
@@ -55,17 +66,17 @@ class OffsetXY(TelescopeBase):
                              f'coordinates. Modifies KTL DCS Keywords: ' \
                              f'INSTXOFF,  INSTYOFF.'
 
-        cls.key_x_offset = cls._cfg_val(cfg, 'ob_keys', 'inst_x_offset')
-        cls.key_y_offset = cls._cfg_val(cfg, 'ob_keys', 'inst_y_offset')
+        key_x_offset = cls._cfg_val(cfg, 'ob_keys', 'inst_x_offset')
+        key_y_offset = cls._cfg_val(cfg, 'ob_keys', 'inst_y_offset')
 
         parser = cls._add_inst_arg(cls, parser, cfg)
 
         args_to_add = OrderedDict([
-            (cls.key_x_offset, {
+            (key_x_offset, {
                 'type': float,
                 'help': 'The offset in the direction parallel to CCD rows [arcsec]'
             }),
-            (cls.key_y_offset, {
+            (key_y_offset, {
                 'type': float,
                 'help': 'The offset in the direction perpendicular to CCD columns [arcsec]'
             })
@@ -84,16 +95,14 @@ class OffsetXY(TelescopeBase):
             defaults to a generic name specified in the config, by default None
         :param cfg: <class 'configparser.ConfigParser'> the config file parser.
         """
-        cls.inst = cls.get_inst_name(cls, args, cfg)
+        ctx = cls._context()
 
-        if not hasattr(cls, 'key_x_offset'):
-            cls.key_x_offset = cls._cfg_val(cfg, 'ob_keys', 'inst_x_offset')
-        if not hasattr(cls, 'key_y_offset'):
-            cls.key_y_offset = cls._cfg_val(cfg, 'ob_keys', 'inst_y_offset')
+        ctx.inst = cls.get_inst_name(cls, args, cfg)
 
-        cls.x_offset = cls._get_arg_value(args, cls.key_x_offset)
-        cls.y_offset = cls._get_arg_value(args, cls.key_y_offset)
-        utils.check_for_zero_offsets(cls.x_offset, cls.y_offset)
+        offsets = cls._validate_args(cls, args, cfg)
+        ctx.x_offset = offsets.x_offset
+        ctx.y_offset = offsets.y_offset
+        utils.check_for_zero_offsets(ctx.x_offset, ctx.y_offset)
 
     @classmethod
     def perform(cls, args, logger, cfg):
@@ -106,12 +115,13 @@ class OffsetXY(TelescopeBase):
 
         :return: None
         """
-        if not hasattr(cls, 'x_offset'):
+        ctx = cls._context()
+
+        if not hasattr(ctx, 'x_offset'):
             raise DDOIPreConditionNotRun(cls.__name__)
 
-        det_u, det_v = utils.transform_detector(cls._cfg_val, cfg,
-                                                cls.write_msg, cls.x_offset,
-                                                cls.y_offset, cls.inst)
+        det_u, det_v = utils.transform_detector(cls, cfg, ctx.x_offset,
+                                                ctx.y_offset, ctx.inst)
 
         # the ktl key name to modify and the value
         key_val = {
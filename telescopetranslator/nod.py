@@ -1,7 +1,7 @@
 from ddoitranslatormodule.ddoiexceptions.DDOIExceptions import DDOIPreConditionNotRun
 from telescopetranslator.BaseTelescope import TelescopeBase
+from telescopetranslator.arg_schema import Arg, ArgSchema
 
-import ktl
 from collections import OrderedDict
 
 
@@ -47,6 +47,15 @@ class SetNodValues(TelescopeBase):
     adapted from sh script: kss/mosfire/scripts/procs/tel/
     """
 
+    subsystems = ('nod',)
+    ktl_writes = ('inst.nod_north', 'inst.nod_east')
+    ktl_reads = ()
+
+    arg_schema = ArgSchema(
+        Arg('nod_north', 'ob_keys', 'tel_north_offset', float,
+            units='arcsec'),
+        Arg('nod_east', 'ob_keys', 'tel_east_offset', float, units='arcsec'))
+
     @classmethod
     def add_cmdline_args(cls, parser, cfg=None):
         """
@@ -66,17 +75,17 @@ class SetNodValues(TelescopeBase):
                              f'Specific parameters for nodding North and East.'
 
 
-        cls.key_nod_north = cls._cfg_val(cfg, 'ob_keys', 'tel_north_offset').upper()
-        cls.key_nod_east = cls._cfg_val(cfg, 'ob_keys', 'tel_east_offset').upper()
+        key_nod_north = cls._cfg_val(cfg, 'ob_keys', 'tel_north_offset').upper()
+        key_nod_east = cls._cfg_val(cfg, 'ob_keys', 'tel_east_offset').upper()
 
         parser = cls._add_inst_arg(cls, parser, cfg)
 
         args_to_add = OrderedDict([
-            (cls.key_nod_north, {
+            (key_nod_north, {
                 'type': float,
                 'help': 'Set the North Nod value [arcseconds]'
             }),
-            (cls.key_nod_east, {
+            (key_nod_east, {
                 'type': float,
                 'help': 'Set the East Nod value [arcseconds]'
             })
@@ -94,23 +103,19 @@ class SetNodValues(TelescopeBase):
             defaults to a generic name specified in the config, by default None
         :param cfg: <class 'configparser.ConfigParser'> the config file parser.
         """
-        cls.inst = cls.get_inst_name(cls, args, cfg)
+        ctx = cls._context()
+
+        ctx.inst = cls.get_inst_name(cls, args, cfg)
 
         # check if it is only set to print the current values
-        cls.print_only = args.get('print_only', False)
+        ctx.print_only = args.get('print_only', False)
 
-        if cls.print_only:
+        if ctx.print_only:
             return
 
-        if not hasattr(cls, 'key_nod_north'):
-            cls.key_nod_north = cls._cfg_val(cfg, 'ob_keys',
-                                                  'tel_north_offset')
-        if not hasattr(cls, 'key_nod_east'):
-            cls.key_nod_east = cls._cfg_val(cfg, 'ob_keys',
-                                                 'tel_east_offset')
-
-        cls.nod_north = cls._get_arg_value(args, cls.key_nod_north)
-        cls.nod_east = cls._get_arg_value(args, cls.key_nod_east)
+        nods = cls._validate_args(cls, args, cfg)
+        ctx.nod_north = nods.nod_north
+        ctx.nod_east = nods.nod_east
 
     @classmethod
     def perform(cls, args, logger, cfg):
@@ -123,32 +128,34 @@ class SetNodValues(TelescopeBase):
 
         :return: None
         """
-        if not hasattr(cls, 'print_only'):
+        ctx = cls._context()
+
+        if not hasattr(ctx, 'print_only'):
             raise DDOIPreConditionNotRun(cls.__name__)
 
-        serv_name = cls._cfg_val(cfg, 'ktl_serv', cls.inst)
+        inst_cfg = cls._inst_cfg(cls, cfg, ctx.inst)
+        serv_name = inst_cfg.serv_name
 
-        if cls.print_only:
-            key_nod_north = cls._cfg_val(cfg, f'ktl_kw_{cls.inst}',
-                                              'nod_north')
-            key_nod_east = cls._cfg_val(cfg, f'ktl_kw_{cls.inst}',
-                                             'nod_east')
+        if ctx.print_only:
+            nods = cls.snapshot(cls, serv_name,
+                                [inst_cfg.ktl_nod_north, inst_cfg.ktl_nod_east])
+            nod_north = nods[inst_cfg.ktl_nod_north]
+            nod_east = nods[inst_cfg.ktl_nod_east]
 
-            msg = f"Current Nod Values N: {ktl.read(serv_name, key_nod_north)}" \
-                  f", E: {ktl.read(serv_name, key_nod_east)}"
+            msg = f"Current Nod Values N: {nod_north}, E: {nod_east}"
             cls.write_msg(logger, msg, print_only=True)
 
             return
 
         # write to instrument keywords,  keys are cfg keys not ktl keys
         key_val = {
-            'nod_north': cls.nod_north,
-            'nod_east': cls.nod_east
+            'nod_north': ctx.nod_north,
+            'nod_east': ctx.nod_east
         }
         cls._write_to_kw(cls, cfg, serv_name, key_val, logger,
                          cls.__name__, cfg_key=True)
 
-        msg = f"New Nod Values N: {cls.nod_north}. E: {cls.nod_east}"
+        msg = f"New Nod Values N: {ctx.nod_north}. E: {ctx.nod_east}"
         cls.write_msg(logger, msg)
 
     @classmethod
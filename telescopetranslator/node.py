@@ -1,7 +1,7 @@
 from ddoitranslatormodule.ddoiexceptions.DDOIExceptions import DDOIPreConditionNotRun
 from telescopetranslator.BaseTelescope import TelescopeBase
+from telescopetranslator.arg_schema import Arg, ArgSchema
 
-import ktl
 from collections import OrderedDict
 
 
@@ -42,6 +42,13 @@ class SetNodEastValue(TelescopeBase):
     adapted from sh script: kss/mosfire/scripts/procs/tel/
     """
 
+    subsystems = ('nod',)
+    ktl_writes = ('inst.nod_east',)
+    ktl_reads = ()
+
+    arg_schema = ArgSchema(
+        Arg('nod_east', 'ob_keys', 'tel_east_offset', float, units='arcsec'))
+
     @classmethod
     def add_cmdline_args(cls, parser, cfg=None):
         """
@@ -60,12 +67,12 @@ class SetNodEastValue(TelescopeBase):
         parser.description = f'Set the nod parameters.  Modifies Instrument ' \
                              f'Specific parameters for nodding East.'
 
-        cls.key_nod_east = cls._cfg_val(cfg, 'ob_keys', 'tel_east_offset')
+        key_nod_east = cls._cfg_val(cfg, 'ob_keys', 'tel_east_offset')
 
         parser = cls._add_inst_arg(cls, parser, cfg)
 
         args_to_add = OrderedDict([
-            (cls.key_nod_east, {'type': float,
+            (key_nod_east, {'type': float,
                                 'help': 'Set the East Nod value [arcseconds]'})
         ])
         parser = cls._add_args(parser, args_to_add, print_only=True)
@@ -81,19 +88,17 @@ class SetNodEastValue(TelescopeBase):
             defaults to a generic name specified in the config, by default None
         :param cfg: <class 'configparser.ConfigParser'> the config file parser.
         """
-        cls.inst = cls.get_inst_name(cls, args, cfg)
+        ctx = cls._context()
+
+        ctx.inst = cls.get_inst_name(cls, args, cfg)
 
         # check if it is only set to print the current values
-        cls.print_only = args.get('print_only', False)
+        ctx.print_only = args.get('print_only', False)
 
-        if cls.print_only:
+        if ctx.print_only:
             return
 
-        if not hasattr(cls, 'key_nod_east'):
-            cls.key_nod_east = cls._cfg_val(cfg, 'ob_keys',
-                                                 'tel_east_offset')
-
-        cls.nod_east = cls._get_arg_value(args, cls.key_nod_east)
+        ctx.nod_east = cls._validate_args(cls, args, cfg).nod_east
 
     @classmethod
     def perform(cls, args, logger, cfg):
@@ -106,26 +111,27 @@ class SetNodEastValue(TelescopeBase):
 
         :return: None
         """
-        if not hasattr(cls, 'print_only'):
-            raise DDOIPreConditionNotRun(cls.__name__)
+        ctx = cls._context()
 
-        serv_name = cls._cfg_val(cfg, 'ktl_serv', cls.inst)
+        if not hasattr(ctx, 'print_only'):
+            raise DDOIPreConditionNotRun(cls.__name__)
 
-        if cls.print_only:
-            key_nod_east = cls._cfg_val(cfg, f'ktl_kw_{cls.inst}',
-                                             'nod_east')
+        inst_cfg = cls._inst_cfg(cls, cfg, ctx.inst)
+        serv_name = inst_cfg.serv_name
 
-            msg = f"Current Nod Values E: {ktl.read(serv_name, key_nod_east)}"
+        if ctx.print_only:
+            nod_east = cls._read_kw(cls, serv_name, inst_cfg.ktl_nod_east)
+            msg = f"Current Nod Values E: {nod_east}"
             cls.write_msg(logger, msg, print_only=True)
 
             return
 
         # write to instrument keywords,  keys are cfg keys not ktl keys
-        key_val = {'nod_east': cls.nod_east}
+        key_val = {'nod_east': ctx.nod_east}
         cls._write_to_kw(cls, cfg, serv_name, key_val, logger, cls.__name__,
                          cfg_key=True)
 
-        msg = f"New Nod East Value: {cls.nod_east}"
+        msg = f"New Nod East Value: {ctx.nod_east}"
         cls.write_msg(logger, msg)
 
     @classmethod
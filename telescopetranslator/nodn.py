@@ -1,7 +1,7 @@
 from ddoitranslatormodule.ddoiexceptions.DDOIExceptions import DDOIPreConditionNotRun
 from telescopetranslator.BaseTelescope import TelescopeBase
+from telescopetranslator.arg_schema import Arg, ArgSchema
 
-import ktl
 from collections import OrderedDict
 
 
@@ -43,6 +43,14 @@ class SetNodNorthValue(TelescopeBase):
     adapted from sh script: kss/mosfire/scripts/procs/tel/
     """
 
+    subsystems = ('nod',)
+    ktl_writes = ('inst.nod_north',)
+    ktl_reads = ()
+
+    arg_schema = ArgSchema(
+        Arg('nod_north', 'ob_keys', 'tel_north_offset', float,
+            units='arcsec'))
+
     @classmethod
     def add_cmdline_args(cls, parser, cfg=None):
         """
@@ -61,12 +69,12 @@ class SetNodNorthValue(TelescopeBase):
         parser.description = f'Set the nod parameters.  Modifies Instrument ' \
                              f'Specific parameters for nodding North.'
 
-        cls.key_nod_north = cls._cfg_val(cfg, 'ob_keys', 'tel_north_offset')
+        key_nod_north = cls._cfg_val(cfg, 'ob_keys', 'tel_north_offset')
 
         parser = cls._add_inst_arg(cls, parser, cfg)
 
         args_to_add = OrderedDict([
-            (cls.key_nod_north, {'type': float,
+            (key_nod_north, {'type': float,
                                  'help': 'Set the North Nod value [arcseconds]'})
         ])
         parser = cls._add_args(parser, args_to_add, print_only=True)
@@ -82,19 +90,17 @@ class SetNodNorthValue(TelescopeBase):
             defaults to a generic name specified in the config, by default None
         :param cfg: <class 'configparser.ConfigParser'> the config file parser.
         """
-        cls.inst = cls.get_inst_name(cls, args, cfg)
+        ctx = cls._context()
+
+        ctx.inst = cls.get_inst_name(cls, args, cfg)
 
         # check if it is only set to print the current values
-        cls.print_only = args.get('print_only', False)
+        ctx.print_only = args.get('print_only', False)
 
-        if cls.print_only:
+        if ctx.print_only:
             return
 
-        if not hasattr(cls, 'key_nod_north'):
-            cls.key_nod_north = cls._cfg_val(cfg, 'ob_keys',
-                                                  'tel_north_offset')
-
-        cls.nod_north = cls._get_arg_value(args, cls.key_nod_north)
+        ctx.nod_north = cls._validate_args(cls, args, cfg).nod_north
 
     @classmethod
     def perform(cls, args, logger, cfg):
@@ -107,24 +113,26 @@ class SetNodNorthValue(TelescopeBase):
 
         :return: None
         """
-        if not hasattr(cls, 'print_only'):
+        ctx = cls._context()
+
+        if not hasattr(ctx, 'print_only'):
             raise DDOIPreConditionNotRun(cls.__name__)
 
-        serv_name = cls._cfg_val(cfg, 'ktl_serv', cls.inst)
+        inst_cfg = cls._inst_cfg(cls, cfg, ctx.inst)
+        serv_name = inst_cfg.serv_name
 
-        if cls.print_only:
-            key_nod_north = cls._cfg_val(cfg, f'ktl_kw_{cls.inst}',
-                                               'nod_north')
-            msg = f"Current Nod Values E: {ktl.read(serv_name, key_nod_north)}"
+        if ctx.print_only:
+            nod_north = cls._read_kw(cls, serv_name, inst_cfg.ktl_nod_north)
+            msg = f"Current Nod Values E: {nod_north}"
             cls.write_msg(logger, msg)
             return
 
         # write to instrument keywords,  keys are cfg keys not ktl keys
-        key_val = {'nod_north': cls.nod_north}
+        key_val = {'nod_north': ctx.nod_north}
         cls._write_to_kw(cls, cfg, serv_name, key_val, logger, cls.__name__,
                          cfg_key=True)
 
-        msg = f"New Nod East Value: {cls.nod_north}"
+        msg = f"New Nod East Value: {ctx.nod_north}"
         cls.write_msg(logger, msg)
 
     @classmethod
@@ -0,0 +1,229 @@
+"""
+Run several translator modules at the same time.
+
+Translators that move different subsystems (see TelescopeBase.subsystems)
+run concurrently,  ie: a rotator move,  a secondary focus and a primary
+focus mode change:
+
+    result = run_parallel([(SetRotSkyPA, {'rot_cfg_pa_sky': 45}),
+                           (MoveTelescopeFocus, {'tcs_cfg_focus': 0.1}),
+                           (PMFM, {'pmfm_nm': 500})], logger=logger)
+    result.check()
+
+The operations that share a subsystem are put in one lane and run one
+after the other,  in the order given.  A translator with unknown subsystems
+(None) shares a lane with every other operation.
+"""
+from telescopetranslator import request_scope, subsystem_locks
+
+import contextvars
+from time import monotonic
+from concurrent.futures import ThreadPoolExecutor
+
+
+class Operation:
+    """
+    One translator execute and its outcome.
+
+    translator = the translator class
+    args = the OB (or subset) in dictionary form
+    name = the name in the report,  by default the translator name
+    lane = the index of the lane the operation ran in
+    start / end = monotonic start and end time,  None if not run
+    result = the return value of execute
+    error = the exception raised by execute,  None on success
+    skipped = True if not run because an earlier operation in the lane failed
+    """
+    __slots__ = ('translator', 'args', 'name', 'lane', 'start', 'end',
+                 'result', 'error', 'skipped')
+
+    def __init__(self, translator, args, name=None):
+        self.translator = translator
+        self.args = args
+        self.name = name or translator.__name__
+        self.lane = None
+        self.start = None
+        self.end = None
+        self.result = None
+        self.error = None
+        self.skipped = False
+
+    @property
+    def elapsed(self):
+        if self.start is None or self.end is None:
+            return None
+        return self.end - self.start
+
+    @property
+    def ok(self):
+        return self.error is None and not self.skipped
+
+    def __repr__(self):
+        return f'Operation({self.name}, lane={self.lane}, ' \
+               f'elapsed={self.elapsed}, error={self.error!r})'
+
+
+class ParallelResult:
+    """
+    The outcome of run_parallel.
+
+    operations = the operations,  in the order given
+    lanes = the operations of each lane,  in run order
+    elapsed = the wall clock seconds of the whole run
+    """
+    __slots__ = ('operations', 'lanes', 'elapsed')
+
+    def __init__(self, operations, lanes, elapsed):
+        self.operations = operations
+        self.lanes = lanes
+        self.elapsed = elapsed
+
+    @property
+    def ok(self):
+        return all(op.ok for op in self.operations)
+
+    @property
+    def errors(self):
+        """
+        :return: <list> [(operation name, exception)] of the failed operations
+        """
+        return [(op.name, op.error) for op in self.operations
+                if op.error is not None]
+
+    def check(self):
+        """
+        Raise the error of the first failed operation (in the order given).
+        """
+        for op in self.operations:
+            if op.error is not None:
+                raise op.error
+
+    def serial_time(self):
+        """
+        :return: <float> the seconds the operations would take one after
+            the other
+        """
+        return sum(op.elapsed or 0.0 for op in self.operations)
+
+    def report(self):
+        """
+        :return: <str> the per operation timing,  one line per operation
+        """
+        lines = []
+        for op in self.operations:
+            if op.skipped:
+                status = 'skipped'
+            elif op.error is not None:
+                status = f'failed: {op.error}'
+            else:
+                status = 'ok'
+            elapsed = '-' if op.elapsed is None else f'{op.elapsed:.2f} s'
+            lines.append(f'{op.name:30s} lane {op.lane}  {elapsed:>10s}  '
+                         f'{status}')
+        lines.append(f'total {self.elapsed:.2f} s  (serial '
+                     f'{self.serial_time():.2f} s,  {len(self.lanes)} lanes)')
+
+        return '\n'.join(lines)
+
+
+def _conflicts(op1, op2):
+    subs1 = op1.translator.subsystems
+    subs2 = op2.translator.subsystems
+    if subs1 is None or subs2 is None:
+        return True
+
+    return bool(set(subs1) & set(subs2))
+
+
+def plan_lanes(operations):
+    """
+    Group the operations into lanes,  two operations are in the same lane
+    if they conflict directly or through other operations.
+
+    :param operations: <list> the Operations
+
+    :return: <list> of lanes,  each a list of Operations in the order given
+    """
+    parent = list(range(len(operations)))
+
+    def _root(idx):
+        while parent[idx] != idx:
+            parent[idx] = parent[parent[idx]]
+            idx = parent[idx]
+        return idx
+
+    for idx1, op1 in enumerate(operations):
+        for idx2 in range(idx1):
+            if _conflicts(op1, operations[idx2]):
+                parent[_root(idx1)] = _root(idx2)
+
+    lanes = {}
+    for idx, op in enumerate(operations):
+        lanes.setdefault(_root(idx), []).append(op)
+
+    return list(lanes.values())
+
+
+def _run_lane(lane, logger, cfg, stop_on_error):
+    failed = False
+    with request_scope.child_scope():
+        for op in lane:
+            if failed and stop_on_error:
+                op.skipped = True
+                continue
+
+            op.start = monotonic()
+            try:
+                op.result = op.translator.execute(op.args, logger=logger,
+                                                  cfg=cfg)
+            except Exception as err:
+                op.error = err
+                failed = True
+                if logger:
+                    logger.error(f'{op.name} failed: {err}')
+            finally:
+                op.end = monotonic()
+
+
+def run_parallel(operations, logger=None, cfg=None, max_workers=None,
+                 stop_on_error=True):
+    """
+    Run translator modules,  the ones on independent subsystems concurrently.
+
+    :param operations: <list> of Operation or (translator, args) tuples
+    :param logger: <DDOILoggerClient>, optional
+        The DDOILoggerClient that should be used. If none is provided,
+        defaults to a generic name specified in the config, by default None
+    :param cfg: <class 'configparser.ConfigParser'> the config file parser.
+    :param max_workers: <int> the maximum number of lanes run at the same
+        time,  by default all of them
+    :param stop_on_error: <bool> skip the rest of a lane after a failure,
+        the other lanes always run to the end
+
+    Called inside an execute,  the lanes run on the subsystems the caller
+    holds (see subsystem_locks.delegate),  instead of waiting for the caller
+    to release them.
+
+    :return: <ParallelResult>
+    """
+    operations = [op if isinstance(op, Operation) else Operation(*op)
+                  for op in operations]
+    lanes = plan_lanes(operations)
+    for idx, lane in enumerate(lanes):
+        for op in lane:
+            op.lane = idx
+
+    start = monotonic()
+    if lanes:
+        with subsystem_locks.locks.delegate(), \
+                ThreadPoolExecutor(max_workers=max_workers or len(lanes),
+                                   thread_name_prefix='translator-lane') as pool:
+            # each lane runs in a copy of the caller context,  with its
+            # own copy of the request scope
+            futures = [pool.submit(contextvars.copy_context().run, _run_lane,
+                                   lane, logger, cfg, stop_on_error)
+                       for lane in lanes]
+            for future in futures:
+                future.result()
+
+    return ParallelResult(operations, lanes, monotonic() - start)
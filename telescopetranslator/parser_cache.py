@@ -0,0 +1,211 @@
+"""
+Cached command line parsers of the translator modules.
+
+The arguments a translator module adds in add_cmdline_args are recorded once
+as a JSON spec and the ArgumentParser is rebuilt from the spec afterwards,
+without loading the config or running add_cmdline_args.  The specs are kept
+in memory (daemon) and in the user cache directory (CLI),  keyed by the
+mtimes of the module files of the translator class and of the config files.
+
+A parser that uses anything the spec can not hold (argument groups, custom
+types or actions) is built directly every time.
+"""
+import os
+import sys
+import json
+import inspect
+import tempfile
+import threading
+from argparse import ArgumentParser
+from pathlib import Path
+
+from telescopetranslator.linking_index import cache_dir
+
+# bump when the layout of the spec changes
+SPEC_VERSION = 1
+
+_CFG_DIR = Path(__file__).parent / 'ddoi_configurations'
+
+# the types a spec can hold
+_TYPES = {'str': str, 'int': int, 'float': float, 'bool': bool}
+
+# {class qualified name: (key, spec)}
+_specs = {}
+_specs_lock = threading.Lock()
+_stats = {'memory_hits': 0, 'disk_hits': 0, 'builds': 0, 'uncacheable': 0}
+
+
+class _Uncacheable(Exception):
+    pass
+
+
+class _RecordingParser(ArgumentParser):
+    """
+    An ArgumentParser that records the add_argument calls.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.recorded = []
+        self.cacheable = True
+
+    def add_argument(self, *args, **kwargs):
+        try:
+            self.recorded.append(_encode_argument(args, kwargs))
+        except _Uncacheable:
+            self.cacheable = False
+        return super().add_argument(*args, **kwargs)
+
+    def add_argument_group(self, *args, **kwargs):
+        self.cacheable = False
+        return super().add_argument_group(*args, **kwargs)
+
+    def add_mutually_exclusive_group(self, *args, **kwargs):
+        self.cacheable = False
+        return super().add_mutually_exclusive_group(*args, **kwargs)
+
+    def set_defaults(self, **kwargs):
+        self.cacheable = False
+        return super().set_defaults(**kwargs)
+
+
+def _encode_argument(args, kwargs):
+    kwargs = dict(kwargs)
+    arg_type = kwargs.get('type')
+    if arg_type is not None:
+        if arg_type not in _TYPES.values():
+            raise _Uncacheable()
+        kwargs['type'] = arg_type.__name__
+    if 'action' in kwargs and not isinstance(kwargs['action'], str):
+        raise _Uncacheable()
+
+    spec = {'args': list(args), 'kwargs': kwargs}
+    try:
+        json.dumps(spec)
+    except (TypeError, ValueError):
+        raise _Uncacheable()
+
+    return spec
+
+
+def _replay(spec):
+    parser = ArgumentParser(add_help=False)
+    parser.description = spec['description']
+    for argument in spec['arguments']:
+        kwargs = dict(argument['kwargs'])
+        if 'type' in kwargs:
+            kwargs['type'] = _TYPES[kwargs['type']]
+        parser.add_argument(*argument['args'], **kwargs)
+
+    return parser
+
+
+def _source_key(function):
+    """
+    The mtimes of the files the parser of a translator class depends on,
+    the modules of the class (and its bases) and the config files.
+    """
+    files = set()
+    for cls in inspect.getmro(function):
+        module = sys.modules.get(cls.__module__)
+        file_name = getattr(module, '__file__', None)
+        if file_name:
+            files.add(os.path.abspath(file_name))
+    files.update(str(path) for path in _CFG_DIR.glob('*.ini'))
+
+    key = [SPEC_VERSION]
+    for file_name in sorted(files):
+        try:
+            key.append([file_name, os.stat(file_name).st_mtime_ns])
+        except OSError:
+            key.append([file_name, None])
+
+    return key
+
+
+def _spec_file(name):
+    return cache_dir() / 'parsers' / f'{name}.json'
+
+
+def _load_spec(name, key):
+    try:
+        with open(_spec_file(name)) as f:
+            stored = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if stored.get('key') != key:
+        return None
+
+    return stored['spec']
+
+
+def _save_spec(name, key, spec):
+    # the spec cache is only an optimization,  failures are ignored
+    spec_file = _spec_file(name)
+    try:
+        spec_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=spec_file.parent, suffix='.tmp')
+    except OSError:
+        return
+
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump({'key': key, 'spec': spec}, f)
+        os.replace(tmp_name, spec_file)
+    except OSError:
+        try:
+            os.remove(tmp_name)
+        except OSError:
+            pass
+
+
+def _count(stat):
+    with _specs_lock:
+        _stats[stat] += 1
+
+
+def build_parser(function):
+    """
+    The command line parser of a translator class.
+
+    :param function: the translator class (TranslatorModuleFunction)
+
+    :return: <ArgumentParser>
+    """
+    name = f'{function.__module__}.{function.__qualname__}'
+    key = _source_key(function)
+
+    with _specs_lock:
+        cached = _specs.get(name)
+    if cached and cached[0] == key:
+        _count('memory_hits')
+        return _replay(cached[1])
+
+    spec = _load_spec(name, key)
+    if spec is not None:
+        _count('disk_hits')
+    else:
+        parser = _RecordingParser(add_help=False)
+        parser = function.add_cmdline_args(parser)
+        if not isinstance(parser, _RecordingParser) or not parser.cacheable:
+            _count('uncacheable')
+            return parser
+
+        _count('builds')
+        spec = {'description': parser.description,
+                'arguments': parser.recorded}
+        _save_spec(name, key, spec)
+
+    with _specs_lock:
+        _specs[name] = (key, spec)
+
+    return _replay(spec)
+
+
+def parser_cache_stats():
+    """
+    :return: <dict> the memory hits, disk hits, builds and uncacheable parsers
+    """
+    with _specs_lock:
+        return dict(_stats)
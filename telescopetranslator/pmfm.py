@@ -1,4 +1,5 @@
 from telescopetranslator.BaseTelescope import TelescopeBase
+from telescopetranslator.arg_schema import Arg, ArgSchema
 
 import ktl
 from collections import OrderedDict
@@ -50,6 +51,13 @@ class PMFM(TelescopeBase):
     adapted from sh script: kss/mosfire/scripts/procs/tel/
     """
 
+    subsystems = ('primary',)
+    ktl_writes = ('acs.pmfm',)
+    ktl_reads = ()
+
+    arg_schema = ArgSchema(
+        Arg('pmfm', None, 'pmfm_nm', float, units='nm'))
+
     @classmethod
     def add_cmdline_args(cls, parser, cfg=None, descrip=None):
         """
@@ -98,12 +106,12 @@ class PMFM(TelescopeBase):
         :return: None
         """
         if args.get('print_only', False):
-            current_pmfm = ktl.read('acs', 'pmfm')
+            current_pmfm = cls._read_kw(cls, 'acs', 'pmfm')
             cls.write_msg(logger, f"The current PMFM is {current_pmfm}",
                           print_only=True)
             return
 
-        pmfm_new = cls._get_arg_value(args, 'pmfm_nm')
+        pmfm_new = cls._validate_args(cls, args, cfg).pmfm
 
         # the ktl key name to modify and the value
         key_val = {
@@ -112,11 +120,12 @@ class PMFM(TelescopeBase):
         cls._write_to_kw(cls, cfg, 'acs', key_val, logger, cls.__name__)
 
         timeout = float(cls._cfg_val(cfg, 'ktl_timeout', 'default'))
-        try:
-            ktl.waitfor(f"{'pmfm'}={pmfm_new}", service='acs', timeout=timeout)
-        except ktl.TimeoutException as err:
-            msg = f"{cls.__name__} current pmfm {ktl.read('acs', 'pmfm')}" \
-                  f",  timeout moving to {pmfm_new}. KTL Error: {err}"
+        if not cls._wait_for_kw(cls, 'acs', 'pmfm',
+                                lambda val: float(val) == pmfm_new, timeout,
+                                binary=True):
+            current_pmfm = cls._read_kw(cls, 'acs', 'pmfm')
+            msg = f"{cls.__name__} current pmfm {current_pmfm}" \
+                  f",  timeout moving to {pmfm_new}."
             if logger:
                 logger.error(msg)
             raise ktl.TimeoutException(msg)
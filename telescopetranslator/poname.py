@@ -1,6 +1,6 @@
 from telescopetranslator.BaseTelescope import TelescopeBase
+from telescopetranslator.arg_schema import Arg, ArgSchema
 
-import ktl
 from collections import OrderedDict
 
 
@@ -42,6 +42,13 @@ class SetPointingOriginName(TelescopeBase):
     adapted from sh script: kss/mosfire/scripts/procs/tel/
     """
 
+    subsystems = ('axes',)
+    ktl_writes = ('dcs.poname', 'dcs.poselect')
+    ktl_reads = ()
+
+    arg_schema = ArgSchema(
+        Arg('po_name', 'ob_keys', 'pointing_origin_name', str))
+
     @classmethod
     def add_cmdline_args(cls, parser, cfg=None):
         """
@@ -60,10 +67,10 @@ class SetPointingOriginName(TelescopeBase):
         parser.description = f'Set or show the current pointing origin. ' \
                              f'Modifies DCS KTL Keyword: PONAME,  POSELECT.'
 
-        cls.key_po_name = cls._cfg_val(cfg, 'ob_keys', 'pointing_origin_name')
+        key_po_name = cls._cfg_val(cfg, 'ob_keys', 'pointing_origin_name')
 
         args_to_add = OrderedDict([
-            (cls.key_po_name, {'type': str,
+            (key_po_name, {'type': str,
                                'help': 'The name of the pointing origin to select'})
         ])
         parser = cls._add_args(parser, args_to_add, print_only=True)
@@ -94,17 +101,13 @@ class SetPointingOriginName(TelescopeBase):
 
         :return: None
         """
-        if not hasattr(cls, 'key_po_name'):
-            cls.key_po_name = cls._cfg_val(cfg, 'ob_keys',
-                                                'pointing_origin_name')
-
         # check if it is only set to print the current values
         if args.get('print_only', False):
-            cls.write_msg(logger, ktl.read('dcs', 'poname'),
+            cls.write_msg(logger, cls._read_kw(cls, 'dcs', 'poname'),
                           print_only=True)
             return
 
-        po_name = cls._get_arg_value(args, cls.key_po_name)
+        po_name = cls._validate_args(cls, args, cfg).po_name
 
         # the ktl key name to modify and the value
         key_val = {
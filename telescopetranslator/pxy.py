@@ -1,9 +1,7 @@
 from ddoitranslatormodule.ddoiexceptions.DDOIExceptions import DDOIPreConditionNotRun
 from telescopetranslator.BaseTelescope import TelescopeBase
+from telescopetranslator.arg_schema import Arg, ArgSchema
 
-from telescopetranslator.mxy import OffsetXY
-
-import ktl
 from collections import OrderedDict
 
 
@@ -40,6 +38,17 @@ class MovePixelXY(TelescopeBase):
     adapted from sh script: kss/mosfire/scripts/procs/tel/pxy
     """
 
+    subsystems = ('axes',)
+    ktl_writes = ('dcs.instxoff', 'dcs.instyoff', 'dcs.rel2curr',
+                  'dcs.axestat')
+    # the offsets are in the rotated instrument frame
+    ktl_reads = ('inst.pixel_scale', 'dcs.poname', 'dcs.rotpposn',
+                 'dcs.rotstat')
+
+    arg_schema = ArgSchema(
+        Arg('x_offset', 'tel_keys', 'inst_offset_xpix', float, units='pixels'),
+        Arg('y_offset', 'tel_keys', 'inst_offset_ypix', float, units='pixels'))
+
     @classmethod
     def add_cmdline_args(cls, parser, cfg=None):
         """
@@ -61,13 +70,13 @@ class MovePixelXY(TelescopeBase):
 
         parser = cls._add_inst_arg(cls, parser, cfg)
 
-        cls.key_x_offset = cls._cfg_val(cfg, 'tel_keys', 'inst_offset_xpix')
-        cls.key_y_offset = cls._cfg_val(cfg, 'tel_keys', 'inst_offset_ypix')
+        key_x_offset = cls._cfg_val(cfg, 'tel_keys', 'inst_offset_xpix')
+        key_y_offset = cls._cfg_val(cfg, 'tel_keys', 'inst_offset_ypix')
 
         args_to_add = OrderedDict([
-            (cls.key_x_offset, {'type': float,
+            (key_x_offset, {'type': float,
                                 'help': 'The Instrument X offset in pixels.'}),
-            (cls.key_y_offset, {'type': float,
+            (key_y_offset, {'type': float,
                                 'help': 'The Instrument Y offset in pixels.'})
         ])
         parser = cls._add_args(parser, args_to_add, print_only=False)
@@ -83,15 +92,13 @@ class MovePixelXY(TelescopeBase):
             defaults to a generic name specified in the config, by default None
         :param cfg: <class 'configparser.ConfigParser'> the config file parser.
         """
-        cls.inst = cls.get_inst_name(cls, args, cfg)
+        ctx = cls._context()
 
-        if not hasattr(cls, 'key_x_offset'):
-            cls.key_x_offset = cls._cfg_val(cfg, 'tel_keys', 'inst_offset_xpix')
-        if not hasattr(cls, 'key_y_offset'):
-            cls.key_y_offset = cls._cfg_val(cfg, 'tel_keys', 'inst_offset_ypix')
+        ctx.inst = cls.get_inst_name(cls, args, cfg)
 
-        cls.x_offset = cls._get_arg_value(args, cls.key_x_offset)
-        cls.y_offset = cls._get_arg_value(args, cls.key_y_offset)
+        offsets = cls._validate_args(cls, args, cfg)
+        ctx.x_offset = offsets.x_offset
+        ctx.y_offset = offsets.y_offset
 
     @classmethod
     def perform(cls, args, logger, cfg):
@@ -104,20 +111,24 @@ class MovePixelXY(TelescopeBase):
 
         :return: None
         """
-        if not hasattr(cls, 'x_offset'):
+        ctx = cls._context()
+
+        if not hasattr(ctx, 'x_offset'):
             raise DDOIPreConditionNotRun(cls.__name__)
 
-        serv_name = cls._cfg_val(cfg, 'ktl_serv', cls.inst)
-        ktl_pixel_scale = cls._cfg_val(cfg, f'ktl_kw_{cls.inst}', 'pixel_scale')
-        pixel_scale = ktl.read(serv_name, ktl_pixel_scale)
+        inst_cfg = cls._inst_cfg(cls, cfg, ctx.inst)
+        pixel_scale = float(cls._read_kw_cached(cls, cfg, inst_cfg.serv_name,
+                                                inst_cfg.ktl_pixel_scale))
 
-        dx = pixel_scale * cls.x_offset
-        dy = pixel_scale * cls.y_offset
+        dx = pixel_scale * ctx.x_offset
+        dy = pixel_scale * ctx.y_offset
 
         key_x_offset = cls._cfg_val(cfg, 'ob_keys', 'inst_x_offset')
         key_y_offset = cls._cfg_val(cfg, 'ob_keys', 'inst_y_offset')
 
-        OffsetXY.execute({key_x_offset: dx, key_y_offset: dy}, cfg=cfg)
+        from telescopetranslator.mxy import OffsetXY
+        OffsetXY.execute({key_x_offset: dx, key_y_offset: dy,
+                          'instrument': ctx.inst}, cfg=cfg)
 
 
     @classmethod
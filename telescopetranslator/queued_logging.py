@@ -0,0 +1,170 @@
+"""
+Non-blocking logging for the CLI.
+
+The logger only puts the records on a bounded queue,  a listener thread
+formats them and writes them to the console and the log file.  The log file
+is on NFS (/s/sdata1701/...),  a slow write must not slow down a move.
+
+Backpressure when the queue is full:
+    - DEBUG / INFO records are dropped
+    - WARNING and above wait up to block_timeout for space,  then are dropped
+The number of dropped records is logged once the queue has space again.
+"""
+import os
+import copy
+import queue
+import atexit
+import getpass
+import logging
+import threading
+from pathlib import Path
+from datetime import datetime, timedelta
+from logging.handlers import QueueHandler, QueueListener
+
+
+class BoundedQueueHandler(QueueHandler):
+    """
+    Puts the log records on a bounded queue without blocking the caller.
+
+    :param queue_size: <int> the maximum number of queued records
+    :param block_timeout: <float> seconds a WARNING or above record waits
+        for space in a full queue
+    """
+
+    def __init__(self, queue_size=10000, block_timeout=0.5):
+        super().__init__(queue.Queue(queue_size))
+        self.block_timeout = block_timeout
+        self.dropped = 0
+        self._dropped_lock = threading.Lock()
+
+    def prepare(self, record):
+        # merge the message arguments now (they may change),  the formatting
+        # is left to the listener thread
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record):
+        if self.dropped:
+            self._report_dropped()
+
+        try:
+            self.queue.put_nowait(record)
+            return
+        except queue.Full:
+            if record.levelno < logging.WARNING:
+                self._count_dropped()
+                return
+
+        try:
+            self.queue.put(record, timeout=self.block_timeout)
+        except queue.Full:
+            self._count_dropped()
+
+    def _count_dropped(self):
+        with self._dropped_lock:
+            self.dropped += 1
+
+    def _report_dropped(self):
+        with self._dropped_lock:
+            dropped, self.dropped = self.dropped, 0
+
+        record = logging.LogRecord('queued_logging', logging.WARNING,
+                                   __file__, 0,
+                                   f'log queue full,  dropped {dropped} '
+                                   f'records', None, None)
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._dropped_lock:
+                self.dropped += dropped
+
+
+class DeferredFileHandler(logging.Handler):
+    """
+    A file handler that works out the log directory and opens the file on
+    the first record,  in the listener thread instead of at start up.  The
+    file is re-opened in the new night directory when the observing date
+    changes (the daemon runs for many nights).
+
+    :param file_name: <str> the log file name
+    :param level: <int> the handler level
+    """
+
+    def __init__(self, file_name, level=logging.NOTSET):
+        super().__init__(level)
+        self.file_name = file_name
+        self._handler = None
+        self._handler_dir = None
+        self._failed_dir = None
+
+    @staticmethod
+    def log_dir():
+        """
+        The observing night log directory,  /s/sdata1701/<user>/<date>/logs
+        where the date is the (HST) date the night started.
+
+        :return: <Path>
+        """
+        try:
+            user = os.getlogin()
+        except OSError:
+            user = getpass.getuser()
+        date = datetime.utcnow() - timedelta(days=1)
+        date_str = date.strftime('%Y%b%d').lower()
+        return Path(f"/s/sdata1701/{user}/{date_str}/logs")
+
+    def _open(self, logdir):
+        logdir.mkdir(parents=True, exist_ok=True)
+        handler = logging.FileHandler(logdir / self.file_name)
+        handler.setFormatter(self.formatter)
+        return handler
+
+    def emit(self, record):
+        logdir = self.log_dir()
+        if logdir == self._failed_dir:
+            return
+
+        if logdir != self._handler_dir:
+            if self._handler is not None:
+                self._handler.close()
+                self._handler = None
+            try:
+                self._handler = self._open(logdir)
+                self._handler_dir = logdir
+            except OSError:
+                # report once per night,  the console still has the records
+                self._failed_dir = logdir
+                self.handleError(record)
+                return
+
+        self._handler.emit(record)
+
+    def close(self):
+        if self._handler is not None:
+            self._handler.close()
+        super().close()
+
+
+def start_queued_logging(logger, handlers, queue_size=10000,
+                         block_timeout=0.5):
+    """
+    Send the records of a logger through a queue to the handlers.
+
+    :param logger: <logging.Logger> the logger
+    :param handlers: <list> the handlers run by the listener thread
+    :param queue_size: <int> the maximum number of queued records
+    :param block_timeout: <float> see BoundedQueueHandler
+
+    :return: <QueueListener> the started listener,  stopped (and flushed)
+        at exit.
+    """
+    queue_handler = BoundedQueueHandler(queue_size, block_timeout)
+    listener = QueueListener(queue_handler.queue, *handlers,
+                             respect_handler_level=True)
+    logger.addHandler(queue_handler)
+    listener.start()
+    atexit.register(listener.stop)
+
+    return listener
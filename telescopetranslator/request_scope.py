@@ -0,0 +1,176 @@
+"""
+State shared by a top level translator execute and every translator execute
+nested under it (ie: mov -> mxy,  gcent -> gxy,  fromsky -> en).
+
+The scope is held in a context variable,  so concurrent commands in other
+threads each see their own scope.
+
+Each translator execute also gets its own ExecContext,  the per-call state
+of the translator from pre_condition through perform and post_condition.
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import monotonic
+
+_current_scope = ContextVar('telescopetranslator_request_scope', default=None)
+_current_exec = ContextVar('telescopetranslator_exec_context', default=None)
+
+
+class Deadline:
+    """
+    The time budget of a command.  Nested executes and KTL operations take
+    the remaining time instead of starting a fresh timeout.
+    """
+    __slots__ = ('seconds', 'expires')
+
+    def __init__(self, seconds):
+        self.seconds = float(seconds)
+        self.expires = monotonic() + self.seconds
+
+    def remaining(self):
+        """
+        :return: <float> the seconds left,  0 if expired.
+        """
+        return max(0.0, self.expires - monotonic())
+
+    def expired(self):
+        return monotonic() >= self.expires
+
+    def clamp(self, timeout):
+        """
+        Limit a timeout to the remaining time.
+
+        :param timeout: <float> the timeout of the operation,  None for no
+            limit
+
+        :return: <float> the timeout to use
+        """
+        if timeout is None:
+            return self.remaining()
+
+        return min(float(timeout), self.remaining())
+
+
+class RequestScope:
+    """
+    The values resolved once per top level command.
+
+    inst = the instrument name used by the command
+    current_inst = the instrument selected by DCS (INSTRUME)
+    deadline = the Deadline of the command,  None if unbounded
+    """
+    __slots__ = ('inst', 'current_inst', 'deadline')
+
+    def __init__(self):
+        self.inst = None
+        self.current_inst = None
+        self.deadline = None
+
+
+def current():
+    """
+    The request scope of the running command.
+
+    :return: <RequestScope> or None if not called inside an execute.
+    """
+    return _current_scope.get()
+
+
+@contextmanager
+def request_scope(deadline=None):
+    """
+    Enter the request scope.  The top level execute creates the scope,  the
+    nested executes re-use it.
+
+    :param deadline: <float> the time budget in seconds,  a nested execute
+        can only shorten the deadline of the scope.
+
+    :return: <RequestScope> the active scope
+    """
+    scope = _current_scope.get()
+    if scope is not None:
+        previous = scope.deadline
+        if deadline is not None and (
+                previous is None or previous.remaining() > deadline):
+            scope.deadline = Deadline(deadline)
+        try:
+            yield scope
+        finally:
+            scope.deadline = previous
+        return
+
+    scope = RequestScope()
+    if deadline is not None:
+        scope.deadline = Deadline(deadline)
+    token = _current_scope.set(scope)
+    try:
+        yield scope
+    finally:
+        _current_scope.reset(token)
+
+
+@contextmanager
+def child_scope():
+    """
+    Enter a copy of the request scope of the caller,  for a worker thread
+    that runs translator executes concurrently with other workers of the
+    same command (see parallel_exec,  step_graph).  The worker starts with
+    the values and the deadline of the caller,  a nested execute in the
+    worker can not change the deadline seen by the other workers.
+
+    :return: <RequestScope> the scope of the worker,  None if the caller
+        has no scope
+    """
+    parent = _current_scope.get()
+    if parent is None:
+        yield None
+        return
+
+    scope = RequestScope()
+    scope.inst = parent.inst
+    scope.current_inst = parent.current_inst
+    scope.deadline = parent.deadline
+    token = _current_scope.set(scope)
+    try:
+        yield scope
+    finally:
+        _current_scope.reset(token)
+
+
+class ExecContext:
+    """
+    The state of one translator execute.  The translator sets its values as
+    attributes in pre_condition and reads them in perform / post_condition,
+    an attribute that is not set means pre_condition did not set it in this
+    execute.
+    """
+
+    def __init__(self, name):
+        self.name = name
+
+
+def current_exec():
+    """
+    The execution context of the running translator.
+
+    :return: <ExecContext> or None if not called inside an execute.
+    """
+    return _current_exec.get()
+
+
+@contextmanager
+def exec_context(name):
+    """
+    Enter a new execution context,  a nested execute gets its own context
+    and the context of the caller is restored on exit.
+
+    :param name: <str> the translator name
+
+    :return: <ExecContext>
+    """
+    ctx = ExecContext(name)
+    token = _current_exec.set(ctx)
+    try:
+        yield ctx
+    finally:
+        _current_exec.reset(token)
@@ -1,8 +1,7 @@
-from ddoitranslatormodule.ddoiexceptions.DDOIExceptions import DDOIPreConditionNotRun
+from ddoitranslatormodule.ddoiexceptions.DDOIExceptions import DDOIPreConditionNotRun, DDOIKTLTimeOut
 from telescopetranslator.BaseTelescope import TelescopeBase
+from telescopetranslator.arg_schema import Arg, ArgSchema
 
-import ktl
-from time import sleep
 from collections import OrderedDict
 
 
@@ -36,6 +35,14 @@ class RotatePhysicalPosAngle(TelescopeBase):
     adapted from sh script: kss/mosfire/scripts/procs/tel/rotpposn
     """
 
+    subsystems = ('rotator',)
+    ktl_writes = ('dcs.rotdest', 'dcs.rotmode', 'dcs.rotstat', 'dcs.rotpposn')
+    ktl_reads = ()
+
+    arg_schema = ArgSchema(
+        Arg('rotator_angle', 'ob_keys', 'rot_physical_angle', float,
+            units='deg'))
+
     @classmethod
     def add_cmdline_args(cls, parser, cfg=None):
         """
@@ -56,11 +63,11 @@ class RotatePhysicalPosAngle(TelescopeBase):
                              f'ROTDEST, ROTMODE.'
 
 
-        cls.key_rot_angle = cls._cfg_val(cfg, 'ob_keys',
-                                              'rot_physical_angle')
+        key_rot_angle = cls._cfg_val(cfg, 'ob_keys',
+                                     'rot_physical_angle')
 
         args_to_add = OrderedDict([
-            (cls.key_rot_angle, {
+            (key_rot_angle, {
                 'type': float,
                 'help': 'Set the physical rotator position angle [deg].'
             })
@@ -78,17 +85,15 @@ class RotatePhysicalPosAngle(TelescopeBase):
             defaults to a generic name specified in the config, by default None
         :param cfg: <class 'configparser.ConfigParser'> the config file parser.
         """
+        ctx = cls._context()
+
         # check if it is only set to print the current values
-        cls.print_only = args.get('print_only', False)
+        ctx.print_only = args.get('print_only', False)
 
-        if cls.print_only:
+        if ctx.print_only:
             return
 
-        if not hasattr(cls, 'key_rot_angle'):
-            cls.key_rot_angle = cls._cfg_val(cfg, 'ob_keys',
-                                                  'rot_physical_angle')
-
-        cls.rotator_angle = cls._get_arg_value(args, cls.key_rot_angle)
+        ctx.rotator_angle = cls._validate_args(cls, args, cfg).rotator_angle
 
     @classmethod
     def perform(cls, args, logger, cfg):
@@ -101,22 +106,25 @@ class RotatePhysicalPosAngle(TelescopeBase):
 
         :return: None
         """
-        if not hasattr(cls, 'print_only'):
+        ctx = cls._context()
+
+        if not hasattr(ctx, 'print_only'):
             raise DDOIPreConditionNotRun(cls.__name__)
 
-        if cls.print_only:
-            cls.write_msg(logger, ktl.read('dcs', 'rotpposn'),
+        if ctx.print_only:
+            cls.write_msg(logger, cls._read_kw(cls, 'dcs', 'rotpposn'),
                             print_only=True)
             return
 
         # the ktl key name to modify and the value
         key_val = {
-            'rotdest': cls.rotator_angle,
+            'rotdest': ctx.rotator_angle,
             'rotmode': 'stationary'
         }
+        watch = cls._watch_move(cls, 'dcs', 'rotstat', ('tracking',))
         cls._write_to_kw(cls, cfg, 'dcs', key_val, logger, cls.__name__)
 
-        sleep(1)
+        cls._wait_move_ack(cls, cfg, watch, 'rotpposn', logger)
 
     @classmethod
     def post_condition(cls, args, logger, cfg):
@@ -129,10 +137,19 @@ class RotatePhysicalPosAngle(TelescopeBase):
 
         :return: None
         """
+        ctx = cls._context()
+
         timeout = cls._cfg_val(cfg, 'ktl_timeout', 'rotpposn')
 
-        if not cls.print_only:
-            ktl.waitfor(f'rotstat=tracking', service='dcs',
-                        timeout=float(timeout))
+        if ctx.print_only:
+            return
+
+        if not cls._wait_for_kw(cls, 'dcs', 'rotstat', ('tracking',),
+                                float(timeout)):
+            msg = f'{cls.__name__} timeout,  rotator not tracking after ' \
+                  f'{timeout} s.'
+            if logger:
+                logger.error(msg)
+            raise DDOIKTLTimeOut(msg)
 
         return
@@ -1,8 +1,7 @@
-from ddoitranslatormodule.ddoiexceptions.DDOIExceptions import DDOIPreConditionNotRun
+from ddoitranslatormodule.ddoiexceptions.DDOIExceptions import DDOIPreConditionNotRun, DDOIKTLTimeOut
 from telescopetranslator.BaseTelescope import TelescopeBase
+from telescopetranslator.arg_schema import Arg, ArgSchema
 
-from time import sleep
-import ktl
 from collections import OrderedDict
 
 
@@ -42,6 +41,13 @@ class SetRotSkyPA(TelescopeBase):
     adapted from sh script: kss/mosfire/scripts/procs/tel/skypa
     """
 
+    subsystems = ('rotator',)
+    ktl_writes = ('dcs.rotdest', 'dcs.rotmode', 'dcs.rotstat', 'dcs.rotpposn')
+    ktl_reads = ('dcs.rotpposn',)
+
+    arg_schema = ArgSchema(
+        Arg('rotator_angle', 'ob_keys', 'rot_sky_angle', float, units='deg'))
+
     @classmethod
     def add_cmdline_args(cls, parser, cfg=None):
         """
@@ -61,7 +67,7 @@ class SetRotSkyPA(TelescopeBase):
                              f'position angle mode.  Modifies DCS KTL ' \
                              f'keywords: ROTDEST, ROTMODE.'
 
-        cls.key_rot_angle = cls._cfg_val(cfg, 'ob_keys', 'rot_sky_angle')
+        key_rot_angle = cls._cfg_val(cfg, 'ob_keys', 'rot_sky_angle')
 
         parser = cls._add_inst_arg(cls, parser, cfg)
 
@@ -69,7 +75,7 @@ class SetRotSkyPA(TelescopeBase):
                                    'Rotate relative to the current position.')
 
         args_to_add = OrderedDict([
-            (cls.key_rot_angle, {
+            (key_rot_angle, {
                 'type': float,
                 'help': 'Set the physical rotator position angle [deg].'
             })
@@ -87,21 +93,19 @@ class SetRotSkyPA(TelescopeBase):
             defaults to a generic name specified in the config, by default None
         :param cfg: <class 'configparser.ConfigParser'> the config file parser.
         """
-        cls.inst = cls.get_inst_name(cls, args, cfg)
+        ctx = cls._context()
+
+        ctx.inst = cls.get_inst_name(cls, args, cfg)
 
-        cls.relative = args.get('relative', False)
+        ctx.relative = args.get('relative', False)
 
         # check if it is only set to print the current values
-        cls.print_only = args.get('print_only', False)
+        ctx.print_only = args.get('print_only', False)
 
-        if cls.print_only:
+        if ctx.print_only:
             return
 
-        if not hasattr(cls, 'key_rot_angle'):
-            cls.key_rot_angle = cls._cfg_val(cfg, 'ob_keys',
-                                                  'rot_sky_angle')
-
-        cls.rotator_angle = cls._get_arg_value(args, cls.key_rot_angle)
+        ctx.rotator_angle = cls._validate_args(cls, args, cfg).rotator_angle
 
     @classmethod
     def perform(cls, args, logger, cfg):
@@ -114,28 +118,32 @@ class SetRotSkyPA(TelescopeBase):
 
         :return: None
         """
-        if not hasattr(cls, 'print_only'):
+        ctx = cls._context()
+
+        if not hasattr(ctx, 'print_only'):
             raise DDOIPreConditionNotRun(cls.__name__)
 
-        if cls.print_only or cls.relative:
-            rot_angle = ktl.read('dcs', 'rotpposn')
+        if ctx.print_only or ctx.relative:
+            rot_angle = cls._read_kw(cls, 'dcs', 'rotpposn')
 
-        if cls.print_only:
+        if ctx.print_only:
             msg = f"Current Rotator Angle = {rot_angle}"
             cls.write_msg(logger, msg, print_only=True)
             return
 
-        rot_dest = args['rot_sky_angle']
-        if cls.relative:
-            rot_dest += rot_angle
+        rot_dest = float(ctx.rotator_angle)
+        if ctx.relative:
+            rot_dest += float(rot_angle)
 
         # the ktl key name to modify and the value
         key_val = {
             'rotdest': rot_dest,
             'rotmode': 1
         }
+        watch = cls._watch_move(cls, 'dcs', 'rotstat', ('8', 'tracking'))
         cls._write_to_kw(cls, cfg, 'dcs', key_val, logger, cls.__name__)
-        sleep(3)
+
+        cls._wait_move_ack(cls, cfg, watch, 'skypa', logger)
 
     @classmethod
     def post_condition(cls, args, logger, cfg):
@@ -148,9 +156,19 @@ class SetRotSkyPA(TelescopeBase):
 
         :return: None
         """
+        ctx = cls._context()
+
         timeout = cls._cfg_val(cfg, 'ktl_timeout', 'skypa')
 
-        if not cls.print_only:
-            ktl.waitfor(f'rotstat=8', service='dcs',
-                        timeout=timeout)
+        if ctx.print_only:
+            return
+
+        if not cls._wait_for_kw(cls, 'dcs', 'rotstat',
+                                lambda val: int(val) == 8, float(timeout),
+                                binary=True):
+            msg = f'{cls.__name__} timeout,  rotator not at the new sky ' \
+                  f'PA after {timeout} s.'
+            if logger:
+                logger.error(msg)
+            raise DDOIKTLTimeOut(msg)
 
@@ -1,9 +1,6 @@
-from ddoitranslatormodule.ddoiexceptions.DDOIExceptions import DDOIDetectorAngleUndefined
 from telescopetranslator.BaseTelescope import TelescopeBase
+from telescopetranslator.arg_schema import Arg, ArgSchema
 
-from telescopetranslator.mxy import OffsetXY
-
-import math
 from collections import OrderedDict
 
 
@@ -33,6 +30,16 @@ class MoveAlongSlit(TelescopeBase):
     adapted from sh script: kss/mosfire/scripts/procs/tel/slitmov
     """
 
+    subsystems = ('axes',)
+    ktl_writes = ('dcs.instxoff', 'dcs.instyoff', 'dcs.rel2curr',
+                  'dcs.axestat')
+    # the offsets are in the rotated instrument frame
+    ktl_reads = ('dcs.poname', 'dcs.rotpposn', 'dcs.rotstat')
+
+    arg_schema = ArgSchema(
+        Arg('slit_offset', 'ob_keys', 'inst_slit_offset', float,
+            units='arcsec'))
+
     @classmethod
     def add_cmdline_args(cls, parser, cfg=None):
         """
@@ -52,13 +59,13 @@ class MoveAlongSlit(TelescopeBase):
                              f' Modifies DCS KTL Keywords: ' \
                              f'INSTXOFF, INSTYOFF.'
 
-        cls.key_slit_offset = cls._cfg_val(cfg, 'ob_keys',
-                                                'inst_slit_offset')
+        key_slit_offset = cls._cfg_val(cfg, 'ob_keys',
+                                       'inst_slit_offset')
 
         parser = cls._add_inst_arg(cls, parser, cfg)
 
         args_to_add = OrderedDict([
-            (cls.key_slit_offset, {
+            (key_slit_offset, {
                 'type': float,
                 'help': 'The number of arcseconds to offset object along the slit.'
             })
@@ -88,29 +95,20 @@ class MoveAlongSlit(TelescopeBase):
 
         :return: None
         """
-        if not hasattr(cls, 'key_slit_offset'):
-            cls.key_slit_offset = cls._cfg_val(cfg, 'ob_keys',
-                                                    'inst_slit_offset')
-
-        slit_offset = cls._get_arg_value(args, cls.key_slit_offset)
+        slit_offset = cls._validate_args(cls, args, cfg).slit_offset
 
         inst = cls.get_inst_name(cls, args, cfg)
 
-        # TODO
-        det_angle = cls._cfg_val(cfg, f'{inst}_parameters', 'det_angle')
-
-        try:
-            det_angle = float(det_angle)
-        except (ValueError, TypeError):
-            msg = 'ERROR, could not determine detector angle'
-            raise DDOIDetectorAngleUndefined(msg)
+        inst_cfg = cls._inst_cfg(cls, cfg, inst)
 
-        dx = slit_offset * math.sin(math.radians(det_angle))
-        dy = slit_offset * math.cos(math.radians(det_angle))
+        dx = slit_offset * inst_cfg.det_sin
+        dy = slit_offset * inst_cfg.det_cos
 
         # run mxy with the calculated offsets
         key_x_offset = cls._cfg_val(cfg, 'ob_keys', 'inst_x_offset')
         key_y_offset = cls._cfg_val(cfg, 'ob_keys', 'inst_y_offset')
+
+        from telescopetranslator.mxy import OffsetXY
         OffsetXY.execute({key_x_offset: dx, key_y_offset: dy,
                           'instrument': inst}, cfg=cfg)
 
@@ -0,0 +1,50 @@
+"""
+A set of KTL keyword values sampled together.
+
+TelescopeBase.snapshot reads the keywords concurrently and returns a
+Snapshot,  so derived values (ie: RA offset corrected by cos(Dec)) are
+computed from samples taken at (nearly) the same moment.
+"""
+from time import monotonic, time
+
+
+class Snapshot:
+    """
+    The values of several keywords of one KTL service.
+
+    service = the KTL service name
+    values = {keyword: value}
+    binary = True if the binary values were read
+    timestamp = the unix time of the middle of the sample window
+    spread = the seconds between the first and the last sample
+    """
+    __slots__ = ('service', 'values', 'binary', 'timestamp', 'spread')
+
+    def __init__(self, service, samples, binary=False):
+        """
+        :param service: <str> The KTL service name
+        :param samples: <dict> {keyword: (value, monotonic sample time)}
+        :param binary: <bool> True if the binary values were read
+        """
+        self.service = service
+        self.binary = binary
+        self.values = {key: val for key, (val, _) in samples.items()}
+
+        times = [sample_time for _, sample_time in samples.values()]
+        if times:
+            self.spread = max(times) - min(times)
+            middle = (max(times) + min(times)) / 2.0
+        else:
+            self.spread = 0.0
+            middle = monotonic()
+        self.timestamp = time() - (monotonic() - middle)
+
+    def __getitem__(self, key):
+        return self.values[key]
+
+    def __contains__(self, key):
+        return key in self.values
+
+    def __repr__(self):
+        return f'Snapshot({self.service}, {self.values}, ' \
+               f'spread={self.spread:.4f})'
@@ -0,0 +1,285 @@
+"""
+Run the telescope steps of an OB as a dependency graph.
+
+The steps are given in OB order.  A step runs after the steps it depends
+on,  the steps without a path between them run at the same time:
+
+    steps = [Step(SetPointingOriginName, {'tcs_cfg_po_name': 'SLIT'}),
+             Step(SetRotSkyPA, {'rot_cfg_pa_sky': 45, 'instrument': 'KPF'}),
+             Step(OffsetXY, {'inst_offset_x': 1, 'inst_offset_y': 2}),
+             Step(WaitForTel, {})]
+    result = run_graph(steps, logger=logger)
+    print(result.report())
+
+The dependencies are the step names in after,  or when after is None they
+are inferred from the keywords the translators declare (ktl_writes,
+ktl_reads):  a step depends on an earlier step that writes a keyword it
+reads or writes,  or reads a keyword it writes.  Above,  the origin and the
+rotator are set together,  the offset (in the rotated instrument frame)
+follows both and the wait follows the offset.
+"""
+from ddoitranslatormodule.ddoiexceptions.DDOIExceptions import DDOIInvalidArguments
+
+from telescopetranslator import request_scope, subsystem_locks
+from telescopetranslator.parallel_exec import Operation
+
+import contextvars
+from time import monotonic
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+
+class Step(Operation):
+    """
+    One translator execute in the graph.
+
+    after = the names of the steps to run after,  None to infer them
+    depends = the resolved dependencies,  set by plan_graph
+    finish = the earliest finish of the step along its dependencies
+        (seconds from the graph start),  set by GraphResult
+    """
+    __slots__ = ('after', 'depends', 'finish')
+
+    def __init__(self, translator, args, name=None, after=None):
+        super().__init__(translator, args, name)
+        self.after = after
+        self.depends = []
+        self.finish = None
+
+
+def _keywords(translator):
+    writes = translator.ktl_writes
+    if writes is None:
+        return None, None
+
+    return set(writes), set(translator.ktl_reads)
+
+
+def _conflicts(earlier, later):
+    writes1, reads1 = _keywords(earlier.translator)
+    writes2, reads2 = _keywords(later.translator)
+    if writes1 is None or writes2 is None:
+        return True
+
+    return bool(writes1 & (reads2 | writes2) or reads1 & writes2)
+
+
+def plan_graph(steps):
+    """
+    Resolve the dependencies of the steps,  sets Step.depends.  The step
+    names are made unique (name#2, name#3, ...).
+
+    :param steps: <list> the Steps in OB order
+
+    :return: <list> the steps
+
+    :raises DDOIInvalidArguments: on an unknown step name or a cycle
+    """
+    by_name = {}
+    for step in steps:
+        name, count = step.name, 1
+        while name in by_name:
+            count += 1
+            name = f'{step.name}#{count}'
+        step.name = name
+        by_name[name] = step
+
+    for idx, step in enumerate(steps):
+        if step.after is None:
+            step.depends = [earlier for earlier in steps[:idx]
+                            if _conflicts(earlier, step)]
+            continue
+
+        unknown = [name for name in step.after if name not in by_name]
+        if unknown:
+            raise DDOIInvalidArguments(f'step {step.name} runs after unknown '
+                                       f'steps: {", ".join(unknown)}')
+        step.depends = [by_name[name] for name in step.after]
+
+    # check for a cycle in the declared dependencies
+    _topological_order(steps)
+
+    return steps
+
+
+def _topological_order(steps):
+    """
+    The steps ordered so that every step follows the steps it depends on,
+    after can name a later step in the OB.
+
+    :param steps: <list> the Steps,  with the dependencies resolved
+
+    :return: <list> the steps
+
+    :raises DDOIInvalidArguments: on a cycle
+    """
+    state = {}
+    order = []
+
+    def _visit(step, path):
+        if state.get(step.name) == 'done':
+            return
+        if state.get(step.name) == 'visiting':
+            cycle = ' -> '.join(path + [step.name])
+            raise DDOIInvalidArguments(f'step dependency cycle: {cycle}')
+        state[step.name] = 'visiting'
+        for dep in step.depends:
+            _visit(dep, path + [step.name])
+        state[step.name] = 'done'
+        order.append(step)
+
+    for step in steps:
+        _visit(step, [])
+
+    return order
+
+
+class GraphResult:
+    """
+    The outcome of run_graph.
+
+    steps = the steps,  in OB order
+    elapsed = the wall clock seconds of the whole graph
+    """
+    __slots__ = ('steps', 'elapsed')
+
+    def __init__(self, steps, elapsed):
+        self.steps = steps
+        self.elapsed = elapsed
+        # the finish of a step needs the finish of the steps it depends on
+        for step in _topological_order(steps):
+            start = max((dep.finish for dep in step.depends), default=0.0)
+            step.finish = start + (step.elapsed or 0.0)
+
+    @property
+    def ok(self):
+        return all(step.ok for step in self.steps)
+
+    @property
+    def errors(self):
+        """
+        :return: <list> [(step name, exception)] of the failed steps
+        """
+        return [(step.name, step.error) for step in self.steps
+                if step.error is not None]
+
+    def check(self):
+        """
+        Raise the error of the first failed step (in OB order).
+        """
+        for step in self.steps:
+            if step.error is not None:
+                raise step.error
+
+    def critical_path(self):
+        """
+        The longest chain of dependent steps,  by the time each step took.
+        The graph can not finish faster than this chain.
+
+        :return: <list> the Steps of the chain,  first to last
+        """
+        if not self.steps:
+            return []
+
+        path = [max(self.steps, key=lambda step: step.finish)]
+        while path[-1].depends:
+            path.append(max(path[-1].depends, key=lambda step: step.finish))
+
+        return path[::-1]
+
+    def report(self):
+        """
+        :return: <str> the per step timing and the critical path
+        """
+        lines = []
+        for step in self.steps:
+            if step.skipped:
+                status = 'skipped'
+            elif step.error is not None:
+                status = f'failed: {step.error}'
+            else:
+                status = 'ok'
+            elapsed = '-' if step.elapsed is None else f'{step.elapsed:.2f} s'
+            after = ', '.join(dep.name for dep in step.depends) or '-'
+            lines.append(f'{step.name:30s} {elapsed:>10s}  {status}  '
+                         f'(after: {after})')
+
+        path = self.critical_path()
+        path_time = path[-1].finish if path else 0.0
+        lines.append(f'critical path {path_time:.2f} s: '
+                     f'{" -> ".join(step.name for step in path)}')
+        serial = sum(step.elapsed or 0.0 for step in self.steps)
+        lines.append(f'total {self.elapsed:.2f} s  (serial {serial:.2f} s)')
+
+        return '\n'.join(lines)
+
+
+def _run_step(step, logger, cfg):
+    with request_scope.child_scope():
+        step.start = monotonic()
+        try:
+            step.result = step.translator.execute(step.args, logger=logger,
+                                                  cfg=cfg)
+        except Exception as err:
+            step.error = err
+            if logger:
+                logger.error(f'step {step.name} failed: {err}')
+        finally:
+            step.end = monotonic()
+
+
+def run_graph(steps, logger=None, cfg=None, max_workers=None):
+    """
+    Run the steps,  each as soon as the steps it depends on are done.  The
+    steps that depend (directly or not) on a failed step are skipped.
+
+    :param steps: <list> of Step or (translator, args) tuples,  in OB order
+    :param logger: <DDOILoggerClient>, optional
+        The DDOILoggerClient that should be used. If none is provided,
+        defaults to a generic name specified in the config, by default None
+    :param cfg: <class 'configparser.ConfigParser'> the config file parser.
+    :param max_workers: <int> the maximum number of steps run at the same
+        time,  by default the number of steps
+
+    Called inside an execute,  the steps run on the subsystems the caller
+    holds (see subsystem_locks.delegate),  instead of waiting for the caller
+    to release them.
+
+    :return: <GraphResult>
+    """
+    steps = plan_graph([step if isinstance(step, Step) else Step(*step)
+                        for step in steps])
+
+    waiting = list(steps)
+    done = set()
+    running = {}
+
+    start = monotonic()
+    with subsystem_locks.locks.delegate(), \
+            ThreadPoolExecutor(max_workers=max_workers or max(len(steps), 1),
+                               thread_name_prefix='translator-step') as pool:
+        while waiting or running:
+            for step in list(waiting):
+                if any(not dep.ok and dep.name in done
+                       for dep in step.depends):
+                    step.skipped = True
+                elif all(dep.name in done for dep in step.depends):
+                    # each step runs in a copy of the caller context,
+                    # with its own copy of the request scope
+                    future = pool.submit(contextvars.copy_context().run,
+                                         _run_step, step, logger, cfg)
+                    running[future] = step
+                else:
+                    continue
+                waiting.remove(step)
+                if step.skipped:
+                    done.add(step.name)
+
+            if not running:
+                continue
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                future.result()
+                done.add(running.pop(future).name)
+
+    return GraphResult(steps, monotonic() - start)
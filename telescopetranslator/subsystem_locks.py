@@ -0,0 +1,169 @@
+"""
+Locks on the telescope subsystems.
+
+TelescopeBase.execute holds the locks of the subsystems a translator
+declares (TelescopeBase.subsystems) for the whole execute,  so translators
+that move the same mechanism (ie: en and gotobase both write raoff, decoff;
+skypa and rotpposn both write rotdest, rotmode) run one after the other,
+and translators on other subsystems are not held up.
+
+The locks are re-entrant and taken in sorted order.  A translator that
+executes another one nested must declare the subsystems of the nested
+translator as well (mov -> mxy,  fromsky -> en),  the nested execute then
+only re-enters locks that are already held.
+
+The locks held by a call chain are kept in a context variable.  The worker
+threads of run_parallel / run_graph started inside an execute can not
+re-enter the locks of the caller thread,  they get a delegate lock per held
+subsystem instead (see delegate):  the workers still run one after the other
+on a subsystem,  and other commands still wait for the caller.
+"""
+from ddoitranslatormodule.ddoiexceptions.DDOIExceptions import DDOIKTLTimeOut
+
+from telescopetranslator import cancel
+
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import monotonic
+
+# the subsystems a translator with unknown subsystems (None) locks
+SUBSYSTEMS = ('axes', 'guider', 'mark', 'nod', 'primary', 'rotator',
+              'secondary')
+
+# the longest a cancellable command waits for a lock between cancel checks
+CANCEL_POLL = 0.05
+
+# {subsystem: lock} the locks held by the current call chain
+_held = ContextVar('telescopetranslator_held_subsystems', default=None)
+
+
+class SubsystemLocks:
+    """
+    One re-entrant lock per subsystem.
+    """
+
+    def __init__(self):
+        self._locks = {name: threading.RLock() for name in SUBSYSTEMS}
+        # {subsystem: [name of the outermost holder, hold depth]}
+        self._owners = {}
+        self._lock = threading.Lock()
+
+    def _get(self, name):
+        with self._lock:
+            lock = self._locks.get(name)
+            if lock is None:
+                lock = self._locks[name] = threading.RLock()
+            return lock
+
+    @staticmethod
+    def _acquire(lock, expires, token):
+        """
+        Acquire a lock,  in slices of CANCEL_POLL when the command can be
+        cancelled.
+
+        :param lock: <threading.RLock> the lock
+        :param expires: <float> monotonic time to give up,  None for no limit
+        :param token: <CancelToken> the cancel token,  None if not cancellable
+
+        :return: <bool> True if acquired,  False on timeout.
+
+        :raises CommandCancelled: if the command is cancelled while waiting
+        """
+        while True:
+            if token is not None:
+                token.check()
+            wait = -1 if expires is None else max(0.0, expires - monotonic())
+            if token is not None:
+                wait = CANCEL_POLL if wait < 0 else min(wait, CANCEL_POLL)
+            if lock.acquire(timeout=wait):
+                return True
+            if expires is not None and monotonic() >= expires:
+                return False
+
+    def names(self, subsystems):
+        """
+        :param subsystems: the declared subsystems,  None for all
+
+        :return: <list> the sorted subsystem names to lock
+        """
+        if subsystems is None:
+            with self._lock:
+                return sorted(self._locks)
+
+        return sorted(set(subsystems))
+
+    @contextmanager
+    def hold(self, subsystems, owner='', timeout=None):
+        """
+        Hold the locks of the subsystems.
+
+        :param subsystems: the subsystems to lock,  None for all
+        :param owner: <str> the name shown in the timeout message and report
+        :param timeout: <float> the seconds to wait for all the locks,  None
+            to wait without limit
+
+        :raises DDOIKTLTimeOut: if the locks are not free within timeout
+        :raises CommandCancelled: if the command is cancelled while waiting
+        """
+        expires = None if timeout is None else monotonic() + timeout
+        token = cancel.current()
+        chain = _held.get() or {}
+
+        held = []
+        chain_token = None
+        try:
+            for name in self.names(subsystems):
+                # the lock of the call chain (or its delegate) is re-entered
+                lock = chain.get(name) or self._get(name)
+                if not self._acquire(lock, expires, token):
+                    with self._lock:
+                        busy = self._owners.get(name, ['unknown'])[0]
+                    raise DDOIKTLTimeOut(f'{owner} timeout waiting for the '
+                                         f'{name} subsystem,  held by {busy}')
+                held.append((name, lock))
+                with self._lock:
+                    self._owners.setdefault(name, [owner, 0])[1] += 1
+
+            chain_token = _held.set(dict(chain, **dict(held)))
+            yield [name for name, _ in held]
+        finally:
+            if chain_token is not None:
+                _held.reset(chain_token)
+            for name, lock in reversed(held):
+                with self._lock:
+                    self._owners[name][1] -= 1
+                    if not self._owners[name][1]:
+                        del self._owners[name]
+                lock.release()
+
+    @contextmanager
+    def delegate(self):
+        """
+        Hand the subsystems held by the current call chain to the worker
+        threads started in the block,  with contextvars.copy_context() (see
+        parallel_exec,  step_graph).  The caller keeps holding the locks,  so
+        other commands still wait for it,  and the workers share one new
+        lock per held subsystem,  so they still run one after the other on
+        it.  The caller must wait for the workers inside the block.
+        """
+        chain = _held.get()
+        if not chain:
+            yield
+            return
+
+        token = _held.set({name: threading.RLock() for name in chain})
+        try:
+            yield
+        finally:
+            _held.reset(token)
+
+    def report(self):
+        """
+        :return: <dict> {subsystem: name of the translator holding it}
+        """
+        with self._lock:
+            return {name: entry[0] for name, entry in self._owners.items()}
+
+
+locks = SubsystemLocks()
@@ -2,10 +2,7 @@ from time import time
 
 from ddoitranslatormodule.ddoiexceptions.DDOIExceptions import DDOINoInstrumentDefined, DDOIConfigException, DDOIZeroOffsets
 
-from telescopetranslator.wftel import WaitForTel
-
 import math
-import ktl
 
 
 def check_for_zero_offsets(offset1, offset2):
@@ -35,9 +32,11 @@ def wait_for_cycle(cls, cfg, ktl_serv, logger):
     """
     start_time = time()
 
-    auto_resume = ktl.read(ktl_serv, 'autresum')
+    auto_resume = cls._read_kw(cls, ktl_serv, 'autresum')
 
-    WaitForTel.execute({"auto_resume": auto_resume})
+    # wftel is only imported by the commands that wait for a cycle
+    from telescopetranslator.wftel import WaitForTel
+    WaitForTel.execute({"auto_resume": auto_resume}, cfg=cfg)
 
     elapsed_time = time() - start_time
 
@@ -53,16 +52,11 @@ def transform_detector(cls, cfg, x, y, inst):
     :param x: <float> the X coordinate to transform
     :param y: <float> the Y coordinate to transform
     :param inst: <str> the instrument string
-    :return: 
+    :return: <tuple> (det_u, det_v) the detector coordinates
     """
-    det_ang = cls._cfg_val(cfg, f'{inst}_parameters', 'det_angle')
-    try:
-        det_ang = float()
-    except (ValueError, TypeError):
-        msg = 'ERROR, could not determine detector angle'
-        cls.write_msg(cls.logger, msg, print_only=False)
-
-    det_u = x * math.cos(det_ang) + y * math.sin(det_ang)
-    det_v = y * math.cos(det_ang) - x * math.sin(det_ang)
+    inst_cfg = cls._inst_cfg(cls, cfg, inst)
+
+    det_u = x * inst_cfg.det_cos + y * inst_cfg.det_sin
+    det_v = y * inst_cfg.det_cos - x * inst_cfg.det_sin
 
     return det_u, det_v
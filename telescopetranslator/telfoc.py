@@ -1,7 +1,7 @@
 from ddoitranslatormodule.ddoiexceptions.DDOIExceptions import DDOIKTLTimeOut
 from telescopetranslator.BaseTelescope import TelescopeBase
+from telescopetranslator.arg_schema import Arg, ArgSchema
 
-import ktl
 from collections import OrderedDict
 
 
@@ -28,6 +28,13 @@ class MoveTelescopeFocus(TelescopeBase):
 
     """
 
+    subsystems = ('secondary',)
+    ktl_writes = ('dcs.telfocus', 'dcs.secmove')
+    ktl_reads = ()
+
+    arg_schema = ArgSchema(
+        Arg('focus', 'ob_keys', 'tel_foc', float))
+
     @classmethod
     def add_cmdline_args(cls, parser, cfg=None):
         """
@@ -47,12 +54,12 @@ class MoveTelescopeFocus(TelescopeBase):
                              f'Modifies DCS KTL keywords: TELFOCUS, SECMOVE.'
 
 
-        cls.key_tel_focus = cls._cfg_val(cfg, 'ob_keys', 'tel_foc')
+        key_tel_focus = cls._cfg_val(cfg, 'ob_keys', 'tel_foc')
 
         parser = cls._add_inst_arg(cls, parser, cfg)
 
         args_to_add = OrderedDict([
-            (cls.key_tel_focus, {'type': float,
+            (key_tel_focus, {'type': float,
                                  'help': 'The new value for telescope '
                                          'secondary position.'})
         ])
@@ -81,21 +88,20 @@ class MoveTelescopeFocus(TelescopeBase):
 
         :return: None
         """
+        ctx = cls._context()
+
 
         # check if it is only set to print the current values
-        cls.print_only = args.get('print_only', False)
+        ctx.print_only = args.get('print_only', False)
 
-        if cls.print_only:
-            current_focus = ktl.read('dcs', 'telfocus')
+        if ctx.print_only:
+            current_focus = cls._read_kw(cls, 'dcs', 'telfocus')
             msg = f"Current Focus = {current_focus}"
             cls.write_msg(logger, msg, print_only=True)
 
             return
 
-        if not hasattr(cls, 'key_tel_focus'):
-            cls.key_tel_focus = cls._cfg_val(cfg, 'ob_keys', 'tel_foc')
-
-        focus_move_val = cls._get_arg_value(args, cls.key_tel_focus)
+        focus_move_val = cls._validate_args(cls, args, cfg).focus
 
         timeout = int(cls._cfg_val(cfg, 'ktl_timeout', 'default'))
 
@@ -106,9 +112,9 @@ class MoveTelescopeFocus(TelescopeBase):
         }
         cls._write_to_kw(cls, cfg, 'dcs', key_val, logger, cls.__name__)
 
-        try:
-            ktl.waitfor('secmove=0', service='dcs', timeout=timeout)
-        except ktl.TimeoutException:
+        if not cls._wait_for_kw(cls, 'dcs', 'secmove',
+                                lambda val: int(val) == 0, timeout,
+                                binary=True):
             msg = f'{cls.__name__} timeout for secondary move.'
             if logger:
                 logger.error(msg)
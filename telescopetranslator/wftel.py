@@ -1,8 +1,8 @@
 from ddoitranslatormodule.ddoiexceptions.DDOIExceptions import DDOIPreConditionNotRun
 from telescopetranslator.BaseTelescope import TelescopeBase
+from telescopetranslator.arg_schema import Arg, ArgSchema
 
 import ktl
-from time import sleep
 from collections import OrderedDict
 
 
@@ -40,6 +40,15 @@ class WaitForTel(TelescopeBase):
     adapted from sh script: kss/mosfire/scripts/procs/tel/wftel
     """
 
+    # waits for the guider to settle after a telescope move,  so it stays
+    # in the lane of the moves it follows
+    subsystems = ('axes',)
+    ktl_writes = ()
+    ktl_reads = ('dcs.axestat', 'dcs.autactiv', 'dcs.autresum', 'dcs.autgo')
+
+    arg_schema = ArgSchema(
+        Arg('auto_resume', None, 'auto_resume', int, required=False))
+
     @classmethod
     def add_cmdline_args(cls, parser, cfg=None):
         """
@@ -69,24 +78,34 @@ class WaitForTel(TelescopeBase):
             defaults to a generic name specified in the config, by default None
         :param cfg: <class 'configparser.ConfigParser'> the config file parser.
         """
-        cls.timeout = cls._cfg_val(cfg, 'ktl_timeout', 'default')
-        cls.auto_resume = args.get('auto_resume', None)
+        ctx = cls._context()
 
-        try:
-            waited = ktl.waitfor('axestat=tracking', service='dcs',
-                                 timeout=cls.timeout, )
-        except:
-            waited = False
+        ctx.timeout = float(cls._cfg_val(cfg, 'ktl_timeout', 'default'))
+        ctx.auto_resume = cls._validate_args(cls, args, cfg).auto_resume
 
-        if not waited:
-            msg = f'tracking was not established in {cls.timeout}'
-            cls.write_msg(logger, msg)
-            raise Exception(msg) 
+        def _tracking():
+            try:
+                waited = cls._wait_for_kw(cls, 'dcs', 'axestat', ('tracking',),
+                                          ctx.timeout)
+            except ktl.ktlError:
+                waited = False
 
-        if ktl.read('dcs', 'autactiv') == 'no':
-            msg = 'guider not currently active'
-            cls.write_msg(logger, msg)
-            raise Exception(msg) 
+            if not waited:
+                raise Exception(f'tracking was not established in '
+                                f'{ctx.timeout}')
+
+        def _guider_active():
+            if cls._read_kw(cls, 'dcs', 'autactiv') == 'no':
+                raise Exception('guider not currently active')
+
+        # fail as soon as either check fails
+        try:
+            cls._run_preconditions(cls, {'tracking': _tracking,
+                                         'guider_active': _guider_active})
+        except Exception as err:
+            if logger:
+                cls.write_msg(logger, str(err))
+            raise
 
     @classmethod
     def perform(cls, args, logger, cfg):
@@ -99,22 +118,24 @@ class WaitForTel(TelescopeBase):
 
         :return: None
         """
-        if not hasattr(cls, 'timeout'):
-            raise DDOIPreConditionNotRun(cls.__name__)
+        ctx = cls._context()
 
-        serv_auto_resume = ktl.cache('dcs', 'autresum')
-        serv_auto_go = ktl.cache('dcs', 'autgo')
+        if not hasattr(ctx, 'timeout'):
+            raise DDOIPreConditionNotRun(cls.__name__)
 
-        # set the value for the current autpause
-        if not cls.auto_resume:
-            cls.auto_resume = serv_auto_resume.read()
+        # set the value for the current autresum
+        if not ctx.auto_resume:
+            ctx.auto_resume = cls._read_kw(cls, 'dcs', 'autresum')
+        start_resume = int(ctx.auto_resume)
 
-        if not cls.waited_for_val(cls.timeout, serv_auto_resume, cls.autresum):
+        if not cls._wait_for_kw(cls, 'dcs', 'autresum',
+                                lambda val: int(val) > start_resume,
+                                ctx.timeout):
             msg = 'timeout waiting for dcs keyword AUTRESUM to increment'
             cls.write_msg(logger, msg)
 
-        if not cls.waited_for_val(cls.timeout, serv_auto_go, "RESUMEACK",
-                                  val2="GUIDE"):
+        if not cls._wait_for_kw(cls, 'dcs', 'autgo', ('RESUMEACK', 'GUIDE'),
+                                ctx.timeout):
             msg = 'timeout waiting for dcs keyword AUTGO ' \
                   'to go to RESUMEACK or GUIDE'
             cls.write_msg(logger, msg)
@@ -131,30 +152,3 @@ class WaitForTel(TelescopeBase):
         :return: None
         """
         return
-
-
-    @staticmethod
-    def waited_for_val(timeout, ktl_cache, val1, val2=None):
-        """
-        Wait for ktl keyword value to change to specified value(s)
-
-        @param timeout: <int> the length in seconds to wait
-        @param ktl_cache: <ktl cache> the ktl cached connection
-        @param val1: <> the value to wait for.
-        @param val2: <> optionally specify a second value to wait for.
-
-        @return: <bool> True if the keyword became the awaited value,  False on
-                        timeout.
-        """
-        for cnt in range(0, timeout):
-            chk_val = ktl_cache.read()
-            if not val2:
-                if chk_val == val1:
-                    return True
-            else:
-                if chk_val == val1 or chk_val == val2:
-                    return True
-
-            sleep(1)
-
-        return False
@@ -0,0 +1,55 @@
+"""
+The tests run against the fake ktl module in this directory (ktl.py).
+"""
+import os
+import pytest
+
+import ktl
+
+CONFIG_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)),
+                          'telescopetranslator', 'ddoi_configurations')
+
+
+@pytest.fixture
+def fake_ktl():
+    """
+    A clean fake KTL,  DCS reports KPF as the selected instrument.  The
+    pooled handles and the keyword cache of TelescopeBase are cleared.
+    """
+    from telescopetranslator.BaseTelescope import TelescopeBase
+
+    ktl.reset({('dcs', 'instrume'): 'KPF'})
+    TelescopeBase._ktl_services.clear()
+    TelescopeBase._ktl_keywords.clear()
+    TelescopeBase._kw_cache.clear()
+    TelescopeBase._kw_cache_watched.clear()
+    TelescopeBase._kw_cache_stats.update(hits=0, misses=0, invalidations=0)
+
+    yield ktl
+
+    ktl.reset()
+
+
+@pytest.fixture
+def load_cfg():
+    """
+    :return: a function that parses the default and the config file of an
+        instrument,  not through the config cache so the tests can change
+        the values.
+    """
+    from telescopetranslator.config_cache import ConfigCache
+
+    def _load(inst='kpf'):
+        return ConfigCache._parse([
+            os.path.join(CONFIG_DIR, 'default_tel_config.ini'),
+            os.path.join(CONFIG_DIR, f'{inst}_tel_config.ini')])
+
+    return _load
+
+
+@pytest.fixture
+def cfg(load_cfg):
+    """
+    A private parse of the default and KPF config files.
+    """
+    return load_cfg('kpf')
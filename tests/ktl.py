@@ -0,0 +1,126 @@
+"""
+A minimal in-memory stand-in for the KTL python module,  enough for the
+translator tests to run without a KTL installation.
+
+The keyword values are kept in STORE {(service, keyword): value},  the
+ascii and binary values are the same.  KeywordHandle.set changes a value and
+runs the callbacks,  as a broadcast from the service would.
+
+CALLS logs the writes and the write waits in the order they are made,
+('write', service, keyword, value, wait) and ('wait', service, keyword).
+FAILURES {(service, keyword): [exception, ...]} makes the next writes of a
+keyword raise,  one exception per write.
+"""
+import threading
+
+
+class ktlError(Exception):
+    pass
+
+
+class TimeoutException(ktlError):
+    pass
+
+
+STORE = {}
+WRITES = []
+CALLS = []
+FAILURES = {}
+_handles = {}
+_lock = threading.Lock()
+
+
+def reset(values=None):
+    """
+    Clear the keyword values,  the write log and the handles.
+
+    :param values: <dict> {(service, keyword): value} to start with
+    """
+    with _lock:
+        STORE.clear()
+        WRITES.clear()
+        CALLS.clear()
+        FAILURES.clear()
+        _handles.clear()
+    STORE.update(values or {})
+
+
+class KeywordHandle:
+
+    def __init__(self, service, name):
+        self.service = service
+        self.name = name
+        self._callbacks = []
+        self._sequence = 0
+
+    def __getitem__(self, item):
+        value = STORE.get((self.service, self.name))
+        if item == 'populated':
+            return value is not None
+        if item == 'monitored':
+            return True
+        return value
+
+    def read(self, binary=False, timeout=None):
+        return STORE.get((self.service, self.name))
+
+    def write(self, value, wait=True, timeout=None):
+        with _lock:
+            CALLS.append(('write', self.service, self.name, value, wait))
+            failures = FAILURES.get((self.service, self.name))
+            if failures:
+                raise failures.pop(0)
+            WRITES.append((self.service, self.name, value))
+            self._sequence += 1
+            sequence = self._sequence
+        self.set(value)
+        return sequence
+
+    def wait(self, sequence=None, timeout=None):
+        with _lock:
+            CALLS.append(('wait', self.service, self.name))
+        return True
+
+    def set(self, value):
+        STORE[(self.service, self.name)] = value
+        for callback in list(self._callbacks):
+            callback(self)
+
+    def callback(self, function, remove=False):
+        if remove:
+            if function in self._callbacks:
+                self._callbacks.remove(function)
+        else:
+            self._callbacks.append(function)
+
+    def monitor(self, start=True, prime=True, wait=True):
+        pass
+
+
+def cache(service, name):
+    key = (service.lower(), name.lower())
+    with _lock:
+        if key not in _handles:
+            _handles[key] = KeywordHandle(*key)
+        return _handles[key]
+
+
+def read(service, name, binary=False, timeout=None):
+    return cache(service, name).read(binary=binary, timeout=timeout)
+
+
+def write(service, name, value, wait=True, timeout=None):
+    return cache(service, name).write(value, wait=wait, timeout=timeout)
+
+
+def waitfor(expression, service=None, timeout=None):
+    return True
+
+
+class Service:
+
+    def __init__(self, name, populate=False):
+        self.name = name
+
+    def __getitem__(self, name):
+        return cache(self.name, name)
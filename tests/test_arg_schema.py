@@ -0,0 +1,110 @@
+import argparse
+import importlib
+
+import pytest
+
+pytest.importorskip('ddoitranslatormodule')
+
+from ddoitranslatormodule.ddoiexceptions.DDOIExceptions import DDOIInvalidArguments
+
+from telescopetranslator.BaseTelescope import TelescopeBase
+from telescopetranslator.arg_schema import Arg, ArgSchema
+from telescopetranslator.nod import SetNodValues
+
+SCHEMA = ArgSchema(
+    Arg('x_offset', 'ob_keys', 'inst_x_offset', float, units='arcsec'),
+    Arg('count', None, 'count', int, required=False, default=1),
+    Arg('relative', None, 'relative', bool, required=False, default=False),
+    Arg('name', None, 'name', str, required=False))
+
+TRANSLATORS = [
+    'azel.OffsetAzEl', 'en.OffsetEastNorth', 'gxy.OffsetGuiderCoordXY',
+    'mov.MoveP1ToP2', 'mxy.OffsetXY', 'pxy.MovePixelXY',
+    'skypa.SetRotSkyPA', 'rotpposn.RotatePhysicalPosAngle',
+    'telfoc.MoveTelescopeFocus', 'pmfm.PMFM',
+    'poname.SetPointingOriginName', 'elabs.MoveToElevation',
+    'slitmov.MoveAlongSlit', 'gcent.MoveToGuiderCenter',
+    'nod.SetNodValues', 'node.SetNodEastValue', 'nodn.SetNodNorthValue',
+    'mark.MarkCoords', 'gomark.GoToMark', 'fromsky.OffsetBackFromNod',
+    'markbase.MarkBase', 'gotobase.GoToBase', 'wftel.WaitForTel',
+]
+
+
+def test_coerces_values(cfg):
+    key = cfg.get('ob_keys', 'inst_x_offset')
+    values = SCHEMA.compile(cfg).validate(
+        {key: '1.5', 'count': '3', 'relative': 'yes', 'name': 'REF'})
+
+    assert values.x_offset == 1.5
+    assert values.count == 3
+    assert values.relative is True
+    assert values.name == 'REF'
+
+
+def test_defaults_of_optional_args(cfg):
+    key = cfg.get('ob_keys', 'inst_x_offset')
+    values = SCHEMA.compile(cfg).validate({key: 2})
+
+    assert values.x_offset == 2.0
+    assert values.count == 1
+    assert values.relative is False
+    assert values.name is None
+
+
+def test_namespace_args(cfg):
+    key = cfg.get('ob_keys', 'inst_x_offset')
+    values = SCHEMA.compile(cfg).validate(argparse.Namespace(**{key: 0.5}))
+    assert values.x_offset == 0.5
+
+
+def test_every_error_listed(cfg):
+    with pytest.raises(DDOIInvalidArguments) as err:
+        SCHEMA.compile(cfg).validate({'count': 'many', 'relative': 'maybe'},
+                                     'Test')
+
+    msg = str(err.value)
+    assert msg.startswith('Test: ')
+    assert f"{cfg.get('ob_keys', 'inst_x_offset')} argument not defined" in msg
+    assert "count expected int, got 'many'" in msg
+    assert "relative expected bool, got 'maybe'" in msg
+
+
+def test_units_in_message(cfg):
+    key = cfg.get('ob_keys', 'inst_x_offset')
+    with pytest.raises(DDOIInvalidArguments, match=r'expected float \[arcsec\]'):
+        SCHEMA.compile(cfg).validate({key: 'left'})
+
+
+def test_compiled_once_per_config(load_cfg):
+    cfg = load_cfg()
+    assert SCHEMA.compile(cfg) is SCHEMA.compile(cfg)
+    assert SCHEMA.compile(load_cfg()) is not SCHEMA.compile(cfg)
+
+
+@pytest.mark.parametrize('path', TRANSLATORS)
+def test_every_translator_declares_a_schema(path, cfg):
+    module, name = path.rsplit('.', 1)
+    translator = getattr(importlib.import_module(
+        f'telescopetranslator.{module}'), name)
+
+    assert isinstance(translator.arg_schema, ArgSchema)
+    # the OB key names are in the config
+    translator.arg_schema.compile(cfg).ob_keys()
+
+
+def test_validate_args_of_a_translator(cfg):
+    north = cfg.get('ob_keys', 'tel_north_offset')
+    east = cfg.get('ob_keys', 'tel_east_offset')
+    nods = SetNodValues.validate_args({north: '1', east: -2}, cfg)
+
+    assert (nods.nod_north, nods.nod_east) == (1.0, -2.0)
+    with pytest.raises(DDOIInvalidArguments, match='SetNodValues'):
+        SetNodValues.validate_args({north: 1}, cfg)
+
+
+def test_validate_args_without_schema(cfg):
+    class _NoSchema(TelescopeBase):
+        pass
+
+    with pytest.raises(DDOIInvalidArguments, match='no arg_schema'):
+        _NoSchema.validate_args({}, cfg)
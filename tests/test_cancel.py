@@ -0,0 +1,103 @@
+import threading
+import configparser
+from time import monotonic, sleep
+
+import pytest
+
+pytest.importorskip('ddoitranslatormodule')
+
+from telescopetranslator import subsystem_locks
+from telescopetranslator.BaseTelescope import TelescopeBase
+from telescopetranslator.cancel import CancelToken, CommandCancelled
+
+
+class _Blocked(TelescopeBase):
+    """
+    Blocks in perform until cancelled,  on the wait given in args.
+    """
+    subsystems = ('rotator',)
+
+    @classmethod
+    def pre_condition(cls, args, logger, cfg):
+        pass
+
+    @classmethod
+    def perform(cls, args, logger, cfg):
+        if args['wait'] == 'keyword':
+            cls._wait_for_kw(cls, 'dcs', 'rotstat', ['tracking'], 30)
+        else:
+            cls._sleep(30)
+
+    @classmethod
+    def post_condition(cls, args, logger, cfg):
+        pass
+
+
+def _cancel_after(args, delay=0.1):
+    """
+    Execute _Blocked in a thread and cancel it after delay.
+
+    :return: <tuple> (the exception raised by execute,  the seconds from
+        the cancel to the end of execute)
+    """
+    token = CancelToken()
+    raised = []
+
+    def _run():
+        try:
+            _Blocked.execute(args, cfg=configparser.ConfigParser(),
+                             cancel_token=token)
+        except Exception as err:
+            raised.append(err)
+
+    thread = threading.Thread(target=_run)
+    thread.start()
+    sleep(delay)
+    start = monotonic()
+    token.cancel('test')
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+
+    return raised[0] if raised else None, monotonic() - start
+
+
+def test_cancel_unwinds_keyword_wait(fake_ktl):
+    fake_ktl.STORE[('dcs', 'rotstat')] = 'slewing'
+
+    err, elapsed = _cancel_after({'wait': 'keyword'})
+
+    assert isinstance(err, CommandCancelled)
+    assert err.reason == 'test'
+    assert err.state is not None
+    assert elapsed < 1
+
+
+def test_cancel_unwinds_sleep(fake_ktl):
+    err, elapsed = _cancel_after({'wait': 'sleep'})
+
+    assert isinstance(err, CommandCancelled)
+    assert elapsed < 1
+
+
+def test_cancel_unwinds_subsystem_lock_wait(fake_ktl):
+    locks = subsystem_locks.locks
+    release = threading.Event()
+    holding = threading.Event()
+
+    def _hold():
+        with locks.hold(('rotator',), owner='holder'):
+            holding.set()
+            release.wait(5)
+
+    holder = threading.Thread(target=_hold)
+    holder.start()
+    holding.wait(5)
+    try:
+        err, elapsed = _cancel_after({'wait': 'sleep'})
+    finally:
+        release.set()
+        holder.join()
+
+    assert isinstance(err, CommandCancelled)
+    assert elapsed < 1
+    assert locks.report() == {}
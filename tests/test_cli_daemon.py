@@ -0,0 +1,78 @@
+import os
+import logging
+
+import pytest
+
+pytest.importorskip('ddoitranslatormodule')
+
+from telescopetranslator import cli_daemon, cli_interface
+
+
+@pytest.fixture
+def sock(tmp_path):
+    """
+    A socket path in a private directory,  made as a plain owner-only file.
+    """
+    path = tmp_path / 'daemon.sock'
+    path.touch(mode=0o600)
+    os.chmod(tmp_path, 0o700)
+    return str(path)
+
+
+def test_socket_path_in_runtime_dir(monkeypatch, tmp_path):
+    monkeypatch.delenv('TELTRANSLATOR_SOCKET', raising=False)
+    monkeypatch.setenv('XDG_RUNTIME_DIR', str(tmp_path))
+    assert cli_daemon.socket_path() == str(tmp_path / 'telescopetranslator.sock')
+
+
+def test_socket_path_in_private_dir(monkeypatch):
+    monkeypatch.delenv('TELTRANSLATOR_SOCKET', raising=False)
+    monkeypatch.delenv('XDG_RUNTIME_DIR', raising=False)
+    path = cli_daemon.socket_path()
+    assert os.path.dirname(path) == cli_daemon._private_dir()
+    assert str(os.getuid()) in os.path.basename(os.path.dirname(path))
+
+
+def test_check_owner_accepts_own_socket(sock):
+    cli_daemon.check_owner(sock)
+
+
+def test_check_owner_refuses_open_mode(sock):
+    os.chmod(sock, 0o666)
+    with pytest.raises(PermissionError, match='open to other users'):
+        cli_daemon.check_owner(sock)
+
+
+def test_check_owner_refuses_other_user(monkeypatch, sock):
+    uid = os.getuid()
+    monkeypatch.setattr(os, 'getuid', lambda: uid + 1)
+    with pytest.raises(PermissionError, match='owned by uid'):
+        cli_daemon.check_owner(sock)
+
+
+def test_check_owner_refuses_symlink(tmp_path, sock):
+    link = tmp_path / 'link.sock'
+    link.symlink_to(sock)
+    with pytest.raises(PermissionError):
+        cli_daemon.check_owner(str(link))
+
+
+def test_client_does_not_connect_to_foreign_socket(monkeypatch, sock, capsys):
+    connects = []
+    monkeypatch.setattr(cli_daemon.socket.socket, 'connect',
+                        lambda self, path: connects.append(path))
+    os.chmod(sock, 0o666)
+
+    assert cli_daemon.send_command(['mov', '1', '2'], sock) is None
+    assert connects == []
+    assert 'not using the translator daemon' in capsys.readouterr().err
+
+
+def test_serve_keeps_foreign_socket(monkeypatch, sock):
+    monkeypatch.setattr(cli_interface, 'create_logger',
+                        lambda *a, **kw: logging.getLogger('test_cli_daemon'))
+    uid = os.getuid()
+    monkeypatch.setattr(os, 'getuid', lambda: uid + 1)
+
+    assert cli_daemon.serve(sock) == 1
+    assert os.path.exists(sock)
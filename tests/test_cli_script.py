@@ -0,0 +1,106 @@
+import io
+import logging
+
+import pytest
+
+pytest.importorskip('ddoitranslatormodule')
+
+from telescopetranslator import cli_interface
+from telescopetranslator.cli_interface import CANCELLED_STATUS
+
+LOGGER = logging.getLogger('test_cli_script')
+
+
+@pytest.fixture
+def ran(monkeypatch):
+    """
+    Replaces run() for the commands of a script,  the first word of a
+    command is its exit status ('exit' raises SystemExit(2) as argparse).
+    :return: the list of commands run
+    """
+    commands = []
+
+    def _run(argv, logger=None, linking_tbl=None, stdin=None):
+        commands.append(' '.join(argv))
+        if argv[0] == 'exit':
+            raise SystemExit(2)
+        return int(argv[0])
+
+    monkeypatch.setattr(cli_interface, 'run', _run)
+    return commands
+
+
+def test_parse_script_splits_and_skips():
+    lines = ['# comment\n', '\n', '0 a; 0 b\n', '  ; 0 c  \n']
+    assert cli_interface.parse_script(lines) == [
+        (3, '0 a'), (3, '0 b'), (4, '0 c')]
+
+
+def test_all_succeed(ran):
+    assert cli_interface.run_script(['0 a', '0 b'], LOGGER, None) == 0
+    assert ran == ['0 a', '0 b']
+
+
+def test_stop_on_first_failure(ran):
+    status = cli_interface.run_script(['0 a', '3 b', '0 c'], LOGGER, None)
+    assert status == 3
+    assert ran == ['0 a', '3 b']
+
+
+def test_continue_returns_first_failure(ran):
+    status = cli_interface.run_script(['4 a', '5 b', '0 c'], LOGGER, None,
+                                      on_error='continue')
+    assert status == 4
+    assert ran == ['4 a', '5 b', '0 c']
+
+
+def test_directive_changes_policy(ran):
+    lines = ['on-error continue', '1 a', 'on-error stop', '2 b', '0 c']
+    assert cli_interface.run_script(lines, LOGGER, None) == 1
+    assert ran == ['1 a', '2 b']
+
+
+def test_cancel_stops_continue(ran):
+    lines = [f'{CANCELLED_STATUS} a', '0 b']
+    status = cli_interface.run_script(lines, LOGGER, None, on_error='continue')
+    assert status == CANCELLED_STATUS
+    assert ran == [f'{CANCELLED_STATUS} a']
+
+
+def test_argparse_exit_is_a_failure(ran):
+    status = cli_interface.run_script(['exit a', '0 b'], LOGGER, None,
+                                      on_error='continue')
+    assert status == 2
+    assert ran == ['exit a', '0 b']
+
+
+def test_bad_quoting_is_status_2(ran):
+    assert cli_interface.run_script(['0 "a', '0 b'], LOGGER, None) == 2
+    assert ran == []
+
+
+def test_summary_lists_every_command(ran, capsys):
+    cli_interface.run_script(['0 a', '1 b'], LOGGER, None, on_error='continue')
+    out = capsys.readouterr().out
+    assert '2 commands, 1 failed' in out
+
+
+def test_run_missing_script_file(tmp_path):
+    argv = ['--script', str(tmp_path / 'missing.txt')]
+    assert cli_interface.run(argv, logger=LOGGER, linking_tbl=object()) == 1
+
+
+def test_run_script_from_stdin(monkeypatch):
+    seen = {}
+
+    def _run_script(lines, logger, linking_tbl, on_error='stop'):
+        seen['lines'] = list(lines)
+        seen['on_error'] = on_error
+        return 7
+
+    monkeypatch.setattr(cli_interface, 'run_script', _run_script)
+    status = cli_interface.run(['-s', '-', '--on-error', 'continue'],
+                               logger=LOGGER, linking_tbl=object(),
+                               stdin=io.StringIO('0 a\n'))
+    assert status == 7
+    assert seen == {'lines': ['0 a\n'], 'on_error': 'continue'}
@@ -0,0 +1,136 @@
+import os
+from time import sleep
+
+import pytest
+
+pytest.importorskip('ddoitranslatormodule')
+
+from telescopetranslator.config_cache import ConfigCache
+from telescopetranslator.mxy import OffsetXY
+from telescopetranslator.wftel import WaitForTel
+
+
+def _write(path, text, bump=0):
+    """
+    Write a config file,  bump moves its mtime on (the mtime resolution of
+    the file system may be coarse).
+    """
+    with open(path, 'w') as config_file:
+        config_file.write(text)
+    if bump:
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + bump))
+
+
+@pytest.fixture
+def files(tmp_path):
+    default = tmp_path / 'default_tel_config.ini'
+    inst = tmp_path / 'kpf_tel_config.ini'
+    _write(default, '[ktl_timeout]\ndefault = 30\nskypa = 300\n')
+    _write(inst, '[ktl_timeout]\nskypa = 100\n')
+
+    return [str(default), str(inst)]
+
+
+def test_unchanged_files_parsed_once(files):
+    cache = ConfigCache()
+
+    first = cache.load(files)
+
+    assert cache.load(files) is first
+    assert first.get('ktl_timeout', 'skypa') == '100'
+    assert first.get('ktl_timeout', 'default') == '30'
+    report = cache.report()
+    assert (report['misses'], report['hits'], report['entries']) == (1, 1, 1)
+
+
+def test_file_lists_cached_apart(files):
+    cache = ConfigCache()
+
+    assert cache.load(files[:1]).get('ktl_timeout', 'skypa') == '300'
+    assert cache.load(files).get('ktl_timeout', 'skypa') == '100'
+    assert cache.report()['entries'] == 2
+
+
+def test_changed_file_parsed_again(files):
+    cache = ConfigCache()
+    first = cache.load(files)
+
+    _write(files[1], '[ktl_timeout]\nskypa = 50\n', bump=10 ** 9)
+    second = cache.load(files)
+
+    assert second is not first
+    assert second.get('ktl_timeout', 'skypa') == '50'
+    # a command holding the old parser keeps its values
+    assert first.get('ktl_timeout', 'skypa') == '100'
+    assert cache.report()['reloads'] == 1
+
+
+def test_missing_file_cached(tmp_path, files):
+    cache = ConfigCache()
+    missing = str(tmp_path / 'none_tel_config.ini')
+
+    config = cache.load([files[0], missing])
+
+    assert cache.load([files[0], missing]) is config
+
+
+def test_refresh_swaps_changed_config(files):
+    cache = ConfigCache()
+    first = cache.load(files)
+
+    assert cache.refresh() == 0
+    _write(files[1], '[ktl_timeout]\nskypa = 50\n', bump=10 ** 9)
+    assert cache.refresh() == 1
+
+    assert cache.load(files).get('ktl_timeout', 'skypa') == '50'
+    assert first.get('ktl_timeout', 'skypa') == '100'
+    assert cache.report()['hot_reloads'] == 1
+
+
+def test_broken_config_keeps_the_previous(files):
+    cache = ConfigCache()
+    first = cache.load(files)
+
+    _write(files[1], '[kpf_parameters]\ndet_angle = north\n', bump=10 ** 9)
+
+    assert cache.refresh() == 0
+    assert cache.load(files) is first
+    assert cache.report()['reload_errors'] == 1
+    # not parsed again until the files change
+    assert cache.refresh() == 0
+    assert cache.report()['reload_errors'] == 1
+
+
+def test_watcher_reloads_in_the_background(files):
+    cache = ConfigCache()
+    cache.load(files)
+    cache.start_watcher(interval=0.01)
+    try:
+        _write(files[1], '[ktl_timeout]\nskypa = 50\n', bump=10 ** 9)
+        for _ in range(200):
+            if cache.report()['hot_reloads']:
+                break
+            sleep(0.01)
+
+        assert cache.load(files).get('ktl_timeout', 'skypa') == '50'
+    finally:
+        cache.stop_watcher()
+
+    assert not cache.watching()
+
+
+def test_nested_execute_keeps_the_parent_config(fake_ktl, cfg, monkeypatch):
+    seen = []
+
+    def _execute(args, logger=None, cfg=None, **kwargs):
+        seen.append(cfg)
+
+    monkeypatch.setattr(WaitForTel, 'execute', _execute)
+    fake_ktl.STORE[('dcs', 'autresum')] = '3'
+
+    OffsetXY.execute({'inst_offset_x': 1.0, 'inst_offset_y': 2.0,
+                      'instrument': 'KPF'}, cfg=cfg)
+
+    # a reload between the parent and the nested execute is not seen
+    assert seen == [cfg]
@@ -0,0 +1,77 @@
+import configparser
+from time import monotonic, sleep
+
+import pytest
+
+pytest.importorskip('ddoitranslatormodule')
+
+from ddoitranslatormodule.ddoiexceptions.DDOIExceptions import DDOIKTLTimeOut
+
+from telescopetranslator import request_scope
+from telescopetranslator.BaseTelescope import TelescopeBase
+
+
+class _Seen(TelescopeBase):
+    """
+    Records the time left in perform,  waits on ROTSTAT for 30 s.
+    """
+    subsystems = ()
+    seen = []
+
+    @classmethod
+    def pre_condition(cls, args, logger, cfg):
+        pass
+
+    @classmethod
+    def perform(cls, args, logger, cfg):
+        cls.seen.append(cls._time_left(30))
+        if args.get('nested'):
+            _Seen.execute({}, cfg=cfg, deadline=args['nested'])
+        if args.get('wait'):
+            cls._wait_for_kw(cls, 'dcs', 'rotstat', ('tracking',), 30)
+
+    @classmethod
+    def post_condition(cls, args, logger, cfg):
+        pass
+
+
+def test_no_deadline_keeps_the_timeout():
+    assert TelescopeBase._time_left(30) == 30
+
+
+def test_timeout_clamped_to_the_deadline():
+    with request_scope.request_scope(deadline=5):
+        assert 4 < TelescopeBase._time_left(30) <= 5
+        assert TelescopeBase._time_left(1) == 1
+        assert 4 < TelescopeBase._time_left(None) <= 5
+
+
+def test_nested_execute_only_shortens(fake_ktl):
+    cfg = configparser.ConfigParser()
+    _Seen.seen = []
+
+    _Seen.execute({'nested': 60}, cfg=cfg, deadline=5)
+    _Seen.execute({'nested': 1}, cfg=cfg, deadline=5)
+
+    assert [round(left) for left in _Seen.seen] == [5, 5, 5, 1]
+
+
+def test_wait_ends_at_the_deadline(fake_ktl):
+    fake_ktl.STORE[('dcs', 'rotstat')] = 'slewing'
+
+    start = monotonic()
+    _Seen.execute({'wait': True}, cfg=configparser.ConfigParser(),
+                  deadline=0.1)
+
+    assert monotonic() - start < 1
+
+
+def test_expired_deadline_not_started(fake_ktl):
+    _Seen.seen = []
+
+    with request_scope.request_scope(deadline=0.01):
+        sleep(0.02)
+        with pytest.raises(DDOIKTLTimeOut):
+            _Seen.execute({}, cfg=configparser.ConfigParser())
+
+    assert _Seen.seen == []
@@ -0,0 +1,92 @@
+import threading
+import configparser
+
+import pytest
+
+pytest.importorskip('ddoitranslatormodule')
+
+from telescopetranslator.BaseTelescope import TelescopeBase
+
+
+class _Recorder(TelescopeBase):
+    """
+    Keeps its argument on the execution context in pre_condition and
+    records what perform sees,  the perform calls of concurrent executes
+    overlap at the barrier.
+    """
+    subsystems = ()
+    barrier = None
+    seen = {}
+
+    @classmethod
+    def pre_condition(cls, args, logger, cfg):
+        ctx = cls._context()
+        ctx.value = args['value']
+
+    @classmethod
+    def perform(cls, args, logger, cfg):
+        ctx = cls._context()
+        if cls.barrier is not None:
+            cls.barrier.wait(timeout=5)
+        cls.seen[args['value']] = ctx.value
+
+    @classmethod
+    def post_condition(cls, args, logger, cfg):
+        pass
+
+
+class _Parent(_Recorder):
+
+    @classmethod
+    def perform(cls, args, logger, cfg):
+        ctx = cls._context()
+        _Recorder.execute({'value': 'nested'}, cfg=cfg)
+        cls.seen['parent'] = cls._context() is ctx and ctx.value
+
+
+def test_concurrent_executes_keep_their_own_state(fake_ktl):
+    cfg = configparser.ConfigParser()
+    _Recorder.barrier = threading.Barrier(4)
+    _Recorder.seen = {}
+    try:
+        threads = [threading.Thread(target=_Recorder.execute,
+                                    args=({'value': val},),
+                                    kwargs={'cfg': cfg})
+                   for val in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        _Recorder.barrier = None
+
+    assert _Recorder.seen == {val: val for val in range(4)}
+    assert not hasattr(_Recorder, 'value')
+
+
+def test_nested_execute_restores_parent_context(fake_ktl):
+    _Recorder.seen = {}
+    _Parent.execute({'value': 'outer'}, cfg=configparser.ConfigParser())
+
+    assert _Recorder.seen['nested'] == 'nested'
+    assert _Recorder.seen['parent'] == 'outer'
+
+
+def test_context_outside_execute_raises():
+    with pytest.raises(RuntimeError, match='no execution context'):
+        TelescopeBase._context()
+
+
+def test_hook_called_directly_raises(fake_ktl):
+    cfg = configparser.ConfigParser()
+    with pytest.raises(RuntimeError, match='through execute'):
+        _Recorder.pre_condition({'value': 1}, None, cfg)
+
+
+def test_context_after_execute_raises(fake_ktl):
+    _Recorder.seen = {}
+    _Recorder.execute({'value': 'done'}, cfg=configparser.ConfigParser())
+
+    assert _Recorder.seen == {'done': 'done'}
+    with pytest.raises(RuntimeError):
+        TelescopeBase._context()
@@ -0,0 +1,23 @@
+import pytest
+
+pytest.importorskip('ddoitranslatormodule')
+
+from telescopetranslator.en import OffsetEastNorth
+from telescopetranslator.fromsky import OffsetBackFromNod
+
+
+def test_offsets_back_by_the_nod(fake_ktl, cfg, monkeypatch):
+    sent = []
+
+    def _execute(args, logger=None, cfg=None, **kwargs):
+        sent.append(args)
+
+    monkeypatch.setattr(OffsetEastNorth, 'execute', _execute)
+    # the snapshot reads the ascii values
+    fake_ktl.STORE.update({('kpfguide', 'nodn'): '3.5',
+                           ('kpfguide', 'node'): '-2'})
+
+    OffsetBackFromNod.execute({'instrument': 'KPF'}, cfg=cfg)
+
+    assert sent == [{'tcs_offset_east': 2.0, 'tcs_offset_north': -3.5,
+                     'instrument': 'kpf'}]
@@ -0,0 +1,104 @@
+import math
+import configparser
+
+import pytest
+
+pytest.importorskip('ddoitranslatormodule')
+
+from ddoitranslatormodule.ddoiexceptions.DDOIExceptions import DDOIConfigException
+
+from telescopetranslator import inst_config
+from telescopetranslator import tel_utils
+from telescopetranslator.BaseTelescope import TelescopeBase
+from telescopetranslator.mxy import OffsetXY
+
+
+def test_compiled_values(cfg):
+    kpf = inst_config.get_inst_config(cfg, 'KPF')
+
+    assert kpf.serv_name == 'kpfguide'
+    assert kpf.ktl_pixel_scale == 'pscale'
+    assert kpf.guider_cent_x == 512.0
+    assert (kpf.det_sin, kpf.det_cos) == (0.0, 1.0)
+
+
+def test_compiled_config_read_only(cfg):
+    kpf = inst_config.get_inst_config(cfg, 'kpf')
+
+    with pytest.raises(AttributeError):
+        kpf.det_angle = 1.0
+
+
+def test_malformed_value_fails_the_load(load_cfg):
+    cfg = load_cfg('kpf')
+    cfg.set('kpf_parameters', 'det_angle', 'north')
+
+    with pytest.raises(DDOIConfigException, match='det_angle'):
+        inst_config.compile_config(cfg)
+
+
+def test_unknown_instrument(cfg):
+    with pytest.raises(DDOIConfigException):
+        inst_config.get_inst_config(cfg, 'hires')
+
+
+def test_nires_sections(load_cfg):
+    cfg = load_cfg('nires')
+
+    nires = inst_config.get_inst_config(cfg, 'nires')
+
+    assert nires.serv_name == 'nires'
+    assert nires.ktl_guider_pix_scale == 'gscale'
+    assert nires.det_angle == -2.02
+    assert not cfg.has_section('osiris_parameters')
+
+
+def _transform(cfg, inst, x, y):
+    return tel_utils.transform_detector(TelescopeBase, cfg, x, y, inst)
+
+
+def test_zero_angle_offsets_unchanged(cfg):
+    # before the detector angle was applied every instrument sent x, y
+    assert _transform(cfg, 'kpf', 1.5, -2.0) == (1.5, -2.0)
+
+
+def test_offsets_rotated_by_the_detector_angle(load_cfg):
+    angle = math.radians(0.136)
+
+    det_u, det_v = _transform(load_cfg('mosfire'), 'mosfire', 1.0, 0.0)
+
+    assert (det_u, det_v) == pytest.approx((math.cos(angle),
+                                            -math.sin(angle)))
+    assert det_v != 0.0
+
+
+def test_quarter_turn():
+    cfg = configparser.ConfigParser()
+    cfg.read_dict({'ktl_serv': {'test': 'test'},
+                   'ktl_kw_test': {key: key for key in
+                                   inst_config._KTL_KEYWORDS.values()},
+                   'test_parameters': {'det_angle': '90',
+                                       'rot_min_ang': '0',
+                                       'rot_max_ang': '0',
+                                       'guider_cent_x': '0',
+                                       'guider_cent_y': '0'}})
+
+    assert _transform(cfg, 'test', 1.0, 2.0) == pytest.approx((2.0, -1.0))
+
+
+@pytest.mark.parametrize('inst, expected', [
+    ('kpf', (1.0, 0.0)),
+    ('mosfire', (math.cos(math.radians(0.136)),
+                 -math.sin(math.radians(0.136)))),
+])
+def test_mxy_sends_detector_offsets(fake_ktl, load_cfg, monkeypatch,
+                                    inst, expected):
+    fake_ktl.STORE[('dcs', 'instrume')] = inst.upper()
+    monkeypatch.setattr(tel_utils, 'wait_for_cycle', lambda *args: None)
+
+    OffsetXY.execute({'inst_offset_x': 1.0, 'inst_offset_y': 0.0,
+                      'instrument': inst.upper()}, cfg=load_cfg(inst))
+
+    sent = {name: val for _, name, val in fake_ktl.WRITES}
+    assert (sent['instxoff'], sent['instyoff']) == pytest.approx(expected)
+    assert fake_ktl.WRITES[-1] == ('dcs', 'rel2curr', 't')
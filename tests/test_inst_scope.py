@@ -0,0 +1,71 @@
+import pytest
+
+pytest.importorskip('ddoitranslatormodule')
+
+from ddoitranslatormodule.ddoiexceptions.DDOIExceptions import DDOINotSelectedInstrument
+
+from telescopetranslator.BaseTelescope import TelescopeBase
+
+
+class _Child(TelescopeBase):
+    subsystems = ()
+    insts = []
+
+    @classmethod
+    def pre_condition(cls, args, logger, cfg):
+        cls.insts.append(cls.get_inst_name(cls, args, cfg))
+
+    @classmethod
+    def perform(cls, args, logger, cfg):
+        pass
+
+    @classmethod
+    def post_condition(cls, args, logger, cfg):
+        pass
+
+
+class _Parent(_Child):
+
+    @classmethod
+    def perform(cls, args, logger, cfg):
+        _Child.execute({}, cfg=cfg)
+        _Child.execute({'instrument': 'KPF'}, cfg=cfg)
+
+
+@pytest.fixture
+def dcs_reads(fake_ktl, cfg, monkeypatch):
+    """
+    The DCS INSTRUME reads,  without the read cache.
+    """
+    cfg.remove_option('ktl_cache_ttl', 'instrume')
+    reads = []
+    read_kw = TelescopeBase._read_kw
+
+    def _read_kw(cls, ktl_service, ktl_key, **kwargs):
+        if ktl_key == 'instrume':
+            reads.append(ktl_service)
+        return read_kw(cls, ktl_service, ktl_key, **kwargs)
+
+    monkeypatch.setattr(TelescopeBase, '_read_kw', _read_kw)
+    _Child.insts = []
+
+    return reads
+
+
+def test_instrument_read_once_per_command(dcs_reads, cfg):
+    _Parent.execute({'instrument': 'KPF'}, cfg=cfg)
+
+    assert _Child.insts == ['kpf', 'kpf', 'kpf']
+    assert dcs_reads == ['dcs']
+
+
+def test_each_command_reads_again(dcs_reads, cfg):
+    _Child.execute({}, cfg=cfg)
+    _Child.execute({}, cfg=cfg)
+
+    assert dcs_reads == ['dcs', 'dcs']
+
+
+def test_instrument_not_selected(dcs_reads, cfg):
+    with pytest.raises(DDOINotSelectedInstrument):
+        _Child.execute({'instrument': 'MOSFIRE'}, cfg=cfg)
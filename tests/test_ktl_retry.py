@@ -0,0 +1,94 @@
+import configparser
+
+import pytest
+
+pytest.importorskip('ddoitranslatormodule')
+
+from telescopetranslator import ktl_retry
+from telescopetranslator.BaseTelescope import TelescopeBase
+from telescopetranslator.ktl_retry import RetryPolicy
+
+
+def _cfg(sections):
+    cfg = configparser.ConfigParser()
+    cfg.read_dict(sections)
+    return cfg
+
+
+def test_policy_defaults_without_config():
+    policy = RetryPolicy.from_cfg(None, 'dcs', 'rotdest')
+
+    assert policy.max_attempts == ktl_retry.DEFAULT_POLICY['max_attempts']
+
+
+def test_keyword_section_overrides_service_and_default():
+    cfg = _cfg({'ktl_retry': {'max_attempts': '2', 'backoff': '0.5'},
+                'ktl_retry_dcs': {'max_attempts': '3', 'jitter': '0'},
+                'ktl_retry_dcs_rotdest': {'max_attempts': '5'}})
+
+    rotdest = RetryPolicy.from_cfg(cfg, 'DCS', 'ROTDEST')
+    rotmode = RetryPolicy.from_cfg(cfg, 'dcs', 'rotmode')
+    pmfm = RetryPolicy.from_cfg(cfg, 'acs', 'pmfm')
+
+    assert (rotdest.max_attempts, rotdest.backoff, rotdest.jitter) == \
+        (5, 0.5, 0.0)
+    assert rotmode.max_attempts == 3
+    assert (pmfm.max_attempts, pmfm.jitter) == \
+        (2, ktl_retry.DEFAULT_POLICY['jitter'])
+
+
+def test_backoff_grows_to_the_limit():
+    policy = RetryPolicy(max_attempts=5, backoff=0.1, backoff_factor=2.0,
+                         max_backoff=0.3, jitter=0)
+
+    assert [policy.delay(attempt) for attempt in (1, 2, 3, 4)] == \
+        pytest.approx([0.1, 0.2, 0.3, 0.3])
+
+
+def test_jitter_within_its_fraction():
+    policy = RetryPolicy(max_attempts=2, backoff=1.0, backoff_factor=1.0,
+                         max_backoff=1.0, jitter=0.1)
+
+    for _ in range(50):
+        assert 0.9 <= policy.delay(1) <= 1.1
+
+
+@pytest.fixture
+def retry_cfg(cfg):
+    cfg.read_dict({'ktl_retry': {'max_attempts': '3', 'backoff': '0.01',
+                                 'jitter': '0'}})
+    ktl_retry.stats.reset()
+    return cfg
+
+
+def test_retry_resends_only_the_failed_keywords(fake_ktl, retry_cfg):
+    fake_ktl.FAILURES[('dcs', 'instyoff')] = [fake_ktl.ktlError('busy')]
+
+    TelescopeBase._write_to_kw(TelescopeBase, retry_cfg, 'dcs',
+                               {'instxoff': 1.0, 'instyoff': 2.0,
+                                'rel2curr': 't'}, None, 'test')
+
+    sent = [call[2] for call in fake_ktl.CALLS if call[0] == 'write']
+    assert sent == ['instxoff', 'instyoff', 'instyoff', 'rel2curr']
+    assert TelescopeBase.kw_write_stats()[('dcs', 'instyoff')]['retries'] == 1
+
+
+def test_gives_up_after_max_attempts(fake_ktl, retry_cfg):
+    fake_ktl.FAILURES[('dcs', 'rotdest')] = [fake_ktl.ktlError('busy')] * 3
+
+    with pytest.raises(fake_ktl.ktlError, match='Tried 3 time'):
+        TelescopeBase._write_to_kw(TelescopeBase, retry_cfg, 'dcs',
+                                   {'rotdest': 1.0}, None, 'test')
+
+    assert TelescopeBase.kw_write_stats()[('dcs', 'rotdest')]['failures'] == 1
+
+
+def test_timeout_not_retried(fake_ktl, retry_cfg):
+    fake_ktl.FAILURES[('dcs', 'rotdest')] = [
+        fake_ktl.TimeoutException('no response')]
+
+    with pytest.raises(fake_ktl.TimeoutException):
+        TelescopeBase._write_to_kw(TelescopeBase, retry_cfg, 'dcs',
+                                   {'rotdest': 1.0}, None, 'test')
+
+    assert len(fake_ktl.CALLS) == 1
@@ -0,0 +1,89 @@
+import threading
+from time import sleep
+
+import pytest
+
+pytest.importorskip('ddoitranslatormodule')
+
+from telescopetranslator.BaseTelescope import TelescopeBase
+
+
+def _read(cfg, service='kpfguide', name='pscale'):
+    return TelescopeBase._read_kw_cached(TelescopeBase, cfg, service, name)
+
+
+def test_cached_until_the_ttl(fake_ktl, cfg):
+    fake_ktl.STORE[('kpfguide', 'pscale')] = '0.05'
+    assert _read(cfg) == '0.05'
+
+    # changed without a broadcast,  the cached value is used
+    fake_ktl.STORE[('kpfguide', 'pscale')] = '0.06'
+    assert _read(cfg) == '0.05'
+    assert TelescopeBase.kw_cache_stats()['hits'] == 1
+
+
+def test_expired_entry_read_again(fake_ktl, cfg):
+    cfg.set('ktl_cache_ttl', 'pscale', '0.05')
+    fake_ktl.STORE[('kpfguide', 'pscale')] = '0.05'
+    _read(cfg)
+
+    fake_ktl.STORE[('kpfguide', 'pscale')] = '0.06'
+    sleep(0.1)
+
+    assert _read(cfg) == '0.06'
+    assert TelescopeBase.kw_cache_stats()['misses'] == 2
+
+
+def test_write_invalidates(fake_ktl, cfg):
+    fake_ktl.STORE[('kpfguide', 'pscale')] = '0.05'
+    _read(cfg)
+
+    TelescopeBase._write_to_kw(TelescopeBase, cfg, 'kpfguide',
+                               {'pscale': '0.06'}, None, 'test')
+
+    assert _read(cfg) == '0.06'
+    assert TelescopeBase.kw_cache_stats()['invalidations'] == 1
+
+
+def test_keyword_without_ttl_not_cached(fake_ktl, cfg):
+    fake_ktl.STORE[('dcs', 'rotpposn')] = '10.0'
+    _read(cfg, 'dcs', 'rotpposn')
+    fake_ktl.STORE[('dcs', 'rotpposn')] = '20.0'
+
+    assert _read(cfg, 'dcs', 'rotpposn') == '20.0'
+    assert TelescopeBase.kw_cache_stats()['entries'] == 0
+
+
+def test_dropped_handle_drops_the_entries(fake_ktl, cfg):
+    fake_ktl.STORE[('kpfguide', 'pscale')] = '0.05'
+    _read(cfg)
+
+    TelescopeBase._drop_kw(TelescopeBase, 'kpfguide')
+    fake_ktl.STORE[('kpfguide', 'pscale')] = '0.06'
+
+    assert _read(cfg) == '0.06'
+    assert ('kpfguide', 'pscale') in TelescopeBase._kw_cache_watched
+
+
+def test_concurrent_misses_watch_once(fake_ktl, cfg, monkeypatch):
+    fake_ktl.STORE[('kpfguide', 'pscale')] = '0.05'
+    get_kw = TelescopeBase._get_kw
+
+    def _slow_get_kw(cls, ktl_service, ktl_key):
+        sleep(0.01)
+        return get_kw(cls, ktl_service, ktl_key)
+
+    monkeypatch.setattr(TelescopeBase, '_get_kw', _slow_get_kw)
+    barrier = threading.Barrier(8)
+
+    def _miss():
+        barrier.wait(timeout=5)
+        _read(cfg)
+
+    threads = [threading.Thread(target=_miss) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(fake_ktl.cache('kpfguide', 'pscale')._callbacks) == 1
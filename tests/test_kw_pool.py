@@ -0,0 +1,63 @@
+import threading
+
+import pytest
+
+pytest.importorskip('ddoitranslatormodule')
+
+from telescopetranslator.BaseTelescope import TelescopeBase
+from telescopetranslator.mxy import OffsetXY
+from telescopetranslator.skypa import SetRotSkyPA
+
+
+@pytest.fixture
+def opened(fake_ktl, monkeypatch):
+    """
+    The names of the KTL services opened,  in order.
+    """
+    opened = []
+    service = fake_ktl.Service
+
+    def _open(name, *args, **kwargs):
+        opened.append(name)
+        return service(name, *args, **kwargs)
+
+    monkeypatch.setattr(fake_ktl, 'Service', _open)
+
+    return opened
+
+
+def test_handles_shared_by_translators(opened):
+    kw = OffsetXY._get_kw(OffsetXY, 'dcs', 'instxoff')
+
+    assert SetRotSkyPA._get_kw(SetRotSkyPA, 'DCS', 'INSTXOFF') is kw
+    SetRotSkyPA._get_kw(SetRotSkyPA, 'dcs', 'rotdest')
+    assert opened == ['dcs']
+
+
+def test_concurrent_first_use_opens_once(opened):
+    barrier = threading.Barrier(8)
+    handles = []
+
+    def _get():
+        barrier.wait(timeout=5)
+        handles.append(TelescopeBase._get_kw(TelescopeBase, 'dcs', 'axestat'))
+
+    threads = [threading.Thread(target=_get) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert opened == ['dcs']
+    assert len({id(kw) for kw in handles}) == 1
+
+
+def test_dropped_service_reopened(opened):
+    TelescopeBase._get_kw(TelescopeBase, 'dcs', 'rotdest')
+    TelescopeBase._get_kw(TelescopeBase, 'acs', 'pmfm')
+
+    TelescopeBase._drop_kw(TelescopeBase, 'dcs')
+    TelescopeBase._get_kw(TelescopeBase, 'dcs', 'rotdest')
+    TelescopeBase._get_kw(TelescopeBase, 'acs', 'pmfm')
+
+    assert opened == ['dcs', 'acs', 'dcs']
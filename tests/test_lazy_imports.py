@@ -0,0 +1,52 @@
+import os
+import sys
+import subprocess
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip('ddoitranslatormodule')
+
+TESTS_DIR = Path(__file__).parent
+REPO_DIR = TESTS_DIR.parent
+
+
+def _modules_after(statement):
+    """
+    The telescopetranslator modules loaded by a statement in a fresh
+    interpreter.
+    """
+    path = [str(TESTS_DIR), str(REPO_DIR)]
+    if os.environ.get('PYTHONPATH'):
+        path.append(os.environ['PYTHONPATH'])
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(path))
+
+    code = f'{statement}\n' \
+           f'import sys\n' \
+           f'print(" ".join(name for name in sys.modules ' \
+           f'if name.startswith("telescopetranslator")))'
+    out = subprocess.run([sys.executable, '-c', code], env=env, check=True,
+                         capture_output=True, text=True).stdout
+
+    return set(out.split())
+
+
+def test_command_import_skips_unrelated_translators():
+    loaded = _modules_after('import telescopetranslator.slitmov')
+
+    assert 'telescopetranslator.slitmov' in loaded
+    for name in ('en', 'gxy', 'wftel', 'mxy', 'skypa'):
+        assert f'telescopetranslator.{name}' not in loaded
+
+
+def test_package_import_loads_no_translator():
+    loaded = _modules_after('import telescopetranslator')
+
+    assert loaded == {'telescopetranslator'}
+
+
+def test_translator_loaded_on_access():
+    loaded = _modules_after('from telescopetranslator import MoveAlongSlit')
+
+    assert 'telescopetranslator.slitmov' in loaded
+    assert 'telescopetranslator.en' not in loaded
@@ -0,0 +1,82 @@
+import os
+import sys
+
+import pytest
+
+pytest.importorskip('yaml')
+
+from telescopetranslator.linking_index import LinkingIndex
+
+TABLE = """common:
+  prefix: telescopetranslator
+  suffix: null
+
+links:
+  mxy:
+    cmd: mxy.OffsetXY
+  en:
+    cmd: en.OffsetEastNorth
+    args:
+      arg_1: 0.0
+"""
+
+
+@pytest.fixture
+def table(tmp_path):
+    path = tmp_path / 'linking_table.yml'
+    path.write_text(TABLE)
+    return path
+
+
+def test_entries_resolved(table, tmp_path):
+    index = LinkingIndex(str(table), index_dir=tmp_path / 'index')
+
+    assert sorted(index.get_entry_points()) == ['en', 'mxy']
+    assert 'mxy' in index and 'gxy' not in index
+    assert index.get_module_and_class('mxy') == \
+        ('telescopetranslator.mxy', 'OffsetXY')
+    assert index.get_link_and_args('en') == \
+        ('telescopetranslator.en.OffsetEastNorth', [(1, 0.0)])
+    with pytest.raises(KeyError):
+        index.get_link('gxy')
+
+
+def test_index_reused_without_yaml(table, tmp_path, monkeypatch):
+    LinkingIndex(str(table), index_dir=tmp_path / 'index')
+
+    # a rebuild would import yaml
+    monkeypatch.setitem(sys.modules, 'yaml', None)
+    index = LinkingIndex(str(table), index_dir=tmp_path / 'index')
+
+    assert index.get_link('mxy') == 'telescopetranslator.mxy.OffsetXY'
+
+
+def test_changed_table_rebuilt(table, tmp_path):
+    LinkingIndex(str(table), index_dir=tmp_path / 'index')
+
+    table.write_text(TABLE + '  gxy:\n    cmd: gxy.OffsetGuiderCoordXY\n')
+    stat = os.stat(table)
+    os.utime(table, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    index = LinkingIndex(str(table), index_dir=tmp_path / 'index')
+
+    assert 'gxy' in index
+
+
+def test_unwritable_index_dir(table, tmp_path):
+    blocked = tmp_path / 'blocked'
+    blocked.write_text('not a directory')
+
+    index = LinkingIndex(str(table), index_dir=blocked / 'index')
+
+    assert 'mxy' in index
+
+
+def test_shipped_table_compiles(tmp_path):
+    table = os.path.join(os.path.dirname(os.path.dirname(__file__)),
+                         'telescopetranslator', 'linking_table.yml')
+
+    index = LinkingIndex(table, index_dir=tmp_path)
+
+    for entry_point in index.get_entry_points():
+        module, _ = index.get_module_and_class(entry_point)
+        assert module.startswith('telescopetranslator.')
@@ -0,0 +1,87 @@
+import threading
+from time import monotonic
+
+import pytest
+
+pytest.importorskip('ddoitranslatormodule')
+
+from ddoitranslatormodule.ddoiexceptions.DDOIExceptions import DDOIKTLTimeOut
+
+from telescopetranslator.rotpposn import RotatePhysicalPosAngle
+from telescopetranslator.skypa import SetRotSkyPA
+
+
+@pytest.fixture
+def rot_cfg(cfg):
+    cfg.set('move_guard', 'start_timeout', '0.5')
+    cfg.set('ktl_timeout', 'rotpposn', '0.2')
+    cfg.set('ktl_timeout', 'skypa', '0.2')
+    return cfg
+
+
+def _rotator_moves(fake_ktl, done='tracking', delay=0.05):
+    """
+    ROTMODE starts a move,  ROTSTAT reports it and is back to done after
+    delay.
+    """
+    rotstat = fake_ktl.cache('dcs', 'rotstat')
+
+    def _start(keyword):
+        rotstat.set('slewing')
+        threading.Timer(delay, rotstat.set, args=(done,)).start()
+
+    fake_ktl.cache('dcs', 'rotmode').callback(_start)
+
+
+def test_rotpposn_waits_for_tracking(fake_ktl, rot_cfg):
+    fake_ktl.STORE[('dcs', 'rotstat')] = 'tracking'
+    _rotator_moves(fake_ktl)
+
+    start = monotonic()
+    RotatePhysicalPosAngle.execute({'rot_cfg_pa_physical': 10.0},
+                                   cfg=rot_cfg)
+
+    assert monotonic() - start < 0.5
+    assert fake_ktl.STORE[('dcs', 'rotstat')] == 'tracking'
+    assert ('dcs', 'rotdest', 10.0) in fake_ktl.WRITES
+
+
+def test_rotpposn_timeout(fake_ktl, rot_cfg):
+    fake_ktl.STORE[('dcs', 'rotstat')] = 'tracking'
+    _rotator_moves(fake_ktl, done='stopped')
+
+    with pytest.raises(DDOIKTLTimeOut, match='rotator not tracking'):
+        RotatePhysicalPosAngle.execute({'rot_cfg_pa_physical': 10.0},
+                                       cfg=rot_cfg)
+
+
+def test_skypa_waits_for_the_new_pa(fake_ktl, rot_cfg):
+    fake_ktl.STORE[('dcs', 'rotstat')] = 8
+    _rotator_moves(fake_ktl, done=8)
+
+    SetRotSkyPA.execute({'rot_cfg_pa_sky': 45.0, 'instrument': 'KPF'},
+                        cfg=rot_cfg)
+
+    assert fake_ktl.STORE[('dcs', 'rotstat')] == 8
+
+
+def test_skypa_timeout(fake_ktl, rot_cfg):
+    fake_ktl.STORE[('dcs', 'rotstat')] = 8
+    _rotator_moves(fake_ktl, done=3)
+
+    with pytest.raises(DDOIKTLTimeOut, match='not at the new sky PA'):
+        SetRotSkyPA.execute({'rot_cfg_pa_sky': 45.0, 'instrument': 'KPF'},
+                            cfg=rot_cfg)
+
+
+def test_move_not_seen_within_start_timeout(fake_ktl, rot_cfg):
+    rot_cfg.set('move_guard', 'start_timeout', '0.05')
+    fake_ktl.STORE[('dcs', 'rotstat')] = 'tracking'
+    watch = RotatePhysicalPosAngle._watch_move(
+        RotatePhysicalPosAngle, 'dcs', 'rotstat', ('tracking',))
+
+    start = monotonic()
+    assert not RotatePhysicalPosAngle._wait_move_ack(
+        RotatePhysicalPosAngle, rot_cfg, watch, 'rotpposn')
+    assert monotonic() - start < 0.5
+    assert not fake_ktl.cache('dcs', 'rotstat')._callbacks
@@ -0,0 +1,59 @@
+import threading
+import configparser
+
+import pytest
+
+pytest.importorskip('ddoitranslatormodule')
+
+from telescopetranslator import request_scope
+from telescopetranslator.BaseTelescope import TelescopeBase
+from telescopetranslator.parallel_exec import run_parallel
+
+
+class _Deadline(TelescopeBase):
+    """
+    Records the deadline of the request scope while both lanes are running.
+    """
+    subsystems = ()
+    barrier = None
+    seen = {}
+
+    @classmethod
+    def pre_condition(cls, args, logger, cfg):
+        pass
+
+    @classmethod
+    def perform(cls, args, logger, cfg):
+        cls.barrier.wait(timeout=5)
+        cls.seen[args['name']] = request_scope.current().deadline.seconds
+        cls.barrier.wait(timeout=5)
+
+    @classmethod
+    def post_condition(cls, args, logger, cfg):
+        pass
+
+
+class _Rotator(_Deadline):
+    subsystems = ('rotator',)
+
+
+def test_nested_deadline_stays_in_its_lane(fake_ktl):
+    _Deadline.barrier = threading.Barrier(2)
+    _Deadline.seen = {}
+    cfg = configparser.ConfigParser()
+
+    def _short(args, logger=None, cfg=None):
+        return _Deadline.execute(args, logger=logger, cfg=cfg, deadline=5)
+
+    class _Short(_Deadline):
+        execute = staticmethod(_short)
+
+    with request_scope.request_scope(60) as scope:
+        result = run_parallel([
+            (_Short, {'name': 'short'}),
+            (_Rotator, {'name': 'long'}),
+        ], cfg=cfg)
+        assert scope.deadline.seconds == 60
+
+    result.check()
+    assert _Deadline.seen == {'short': 5, 'long': 60}
@@ -0,0 +1,136 @@
+import os
+import sys
+import importlib
+
+import pytest
+
+pytest.importorskip('ddoitranslatormodule')
+
+from telescopetranslator import parser_cache
+
+MODULE = """
+class Offset:
+    calls = 0
+
+    @classmethod
+    def add_cmdline_args(cls, parser):
+        cls.calls += 1
+        parser.description = 'offset the telescope'
+        parser.add_argument('x', type=float, help='x offset')
+        parser.add_argument('--rel', action='store_true')
+        return parser
+
+
+class Grouped:
+    calls = 0
+
+    @classmethod
+    def add_cmdline_args(cls, parser):
+        cls.calls += 1
+        group = parser.add_argument_group('offsets')
+        group.add_argument('x', type=float)
+        return parser
+"""
+
+
+@pytest.fixture
+def mod(tmp_path, monkeypatch):
+    """
+    A translator module in a temporary file,  with the parser cache in a
+    temporary cache directory and its own config directory.
+    """
+    src = tmp_path / 'src'
+    src.mkdir()
+    (src / 'pc_translators.py').write_text(MODULE)
+    cfg_dir = tmp_path / 'cfg'
+    cfg_dir.mkdir()
+    (cfg_dir / 'default_tel_config.ini').write_text('[ktl]\n')
+
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path / 'cache'))
+    monkeypatch.setattr(parser_cache, '_CFG_DIR', cfg_dir)
+    monkeypatch.syspath_prepend(str(src))
+    monkeypatch.setattr(parser_cache, '_specs', {})
+    monkeypatch.setattr(parser_cache, '_stats', dict.fromkeys(
+        parser_cache._stats, 0))
+
+    module = importlib.import_module('pc_translators')
+    yield module
+    sys.modules.pop('pc_translators', None)
+
+
+def _bump(path):
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10 ** 9))
+
+
+def test_replayed_parser_parses(mod):
+    parser = parser_cache.build_parser(mod.Offset)
+    parser = parser_cache.build_parser(mod.Offset)
+
+    args = parser.parse_args(['1.5', '--rel'])
+    assert args.x == 1.5 and args.rel is True
+    assert parser.description == 'offset the telescope'
+    assert mod.Offset.calls == 1
+    assert parser_cache.parser_cache_stats() == \
+        {'memory_hits': 1, 'disk_hits': 0, 'builds': 1, 'uncacheable': 0}
+
+
+def test_disk_spec_used_by_a_new_process(mod, monkeypatch):
+    parser_cache.build_parser(mod.Offset)
+    assert parser_cache._spec_file('pc_translators.Offset').exists()
+
+    monkeypatch.setattr(parser_cache, '_specs', {})
+    parser = parser_cache.build_parser(mod.Offset)
+    assert parser.parse_args(['2']).x == 2.0
+    assert mod.Offset.calls == 1
+    assert parser_cache.parser_cache_stats()['disk_hits'] == 1
+
+
+def test_module_change_rebuilds(mod, monkeypatch):
+    parser_cache.build_parser(mod.Offset)
+    _bump(mod.__file__)
+
+    parser_cache.build_parser(mod.Offset)
+    assert mod.Offset.calls == 2
+
+    # the disk spec of the old module is not used either
+    monkeypatch.setattr(parser_cache, '_specs', {})
+    parser_cache.build_parser(mod.Offset)
+    assert mod.Offset.calls == 2
+    assert parser_cache.parser_cache_stats()['builds'] == 2
+
+
+def test_config_change_rebuilds(mod):
+    parser_cache.build_parser(mod.Offset)
+    _bump(parser_cache._CFG_DIR / 'default_tel_config.ini')
+
+    parser_cache.build_parser(mod.Offset)
+    assert mod.Offset.calls == 2
+
+
+def test_new_config_file_rebuilds(mod):
+    parser_cache.build_parser(mod.Offset)
+    (parser_cache._CFG_DIR / 'kpf_tel_config.ini').write_text('[ktl]\n')
+
+    parser_cache.build_parser(mod.Offset)
+    assert mod.Offset.calls == 2
+
+
+def test_corrupt_spec_file_rebuilds(mod, monkeypatch):
+    parser_cache.build_parser(mod.Offset)
+    parser_cache._spec_file('pc_translators.Offset').write_text('{')
+
+    monkeypatch.setattr(parser_cache, '_specs', {})
+    parser = parser_cache.build_parser(mod.Offset)
+    assert parser.parse_args(['3']).x == 3.0
+    assert mod.Offset.calls == 2
+
+
+def test_uncacheable_parser_built_every_time(mod):
+    parser = parser_cache.build_parser(mod.Grouped)
+    parser = parser_cache.build_parser(mod.Grouped)
+
+    assert parser.parse_args(['4']).x == 4.0
+    assert mod.Grouped.calls == 2
+    assert parser_cache.parser_cache_stats()['uncacheable'] == 2
+    assert not parser_cache._spec_file('pc_translators.Grouped').exists()
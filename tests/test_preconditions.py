@@ -0,0 +1,47 @@
+import threading
+import configparser
+from time import monotonic
+
+import pytest
+
+pytest.importorskip('ddoitranslatormodule')
+
+from telescopetranslator.BaseTelescope import TelescopeBase
+from telescopetranslator.wftel import WaitForTel
+
+
+def test_checks_run_concurrently():
+    barrier = threading.Barrier(3)
+
+    # each check only passes when the three run at the same time
+    checks = {name: lambda: barrier.wait(timeout=5)
+              for name in ('one', 'two', 'three')}
+    TelescopeBase._run_preconditions(TelescopeBase, checks)
+
+
+def test_first_failure_raised_without_waiting():
+    release = threading.Event()
+
+    def _fail():
+        raise ValueError('failed')
+
+    start = monotonic()
+    with pytest.raises(ValueError):
+        TelescopeBase._run_preconditions(TelescopeBase, {
+            'slow': lambda: release.wait(5), 'fail': _fail})
+    release.set()
+
+    assert monotonic() - start < 1
+
+
+def test_wftel_fails_fast_without_guider(fake_ktl):
+    fake_ktl.STORE.update({('dcs', 'axestat'): 'slewing',
+                           ('dcs', 'autactiv'): 'no'})
+    cfg = configparser.ConfigParser()
+    cfg.read_dict({'ktl_timeout': {'default': '5'}})
+
+    start = monotonic()
+    with pytest.raises(Exception, match='guider not currently active'):
+        WaitForTel.execute({}, cfg=cfg)
+
+    assert monotonic() - start < 1
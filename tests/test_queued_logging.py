@@ -0,0 +1,152 @@
+import logging
+import threading
+
+import pytest
+
+pytest.importorskip('ddoitranslatormodule')
+
+from telescopetranslator import queued_logging
+from telescopetranslator.queued_logging import BoundedQueueHandler, \
+    DeferredFileHandler, start_queued_logging
+
+
+class _Collect(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+def _record(msg, level=logging.INFO, args=None):
+    return logging.LogRecord('test', level, __file__, 0, msg, args, None)
+
+
+def _drain(handler):
+    records = []
+    while not handler.queue.empty():
+        records.append(handler.queue.get_nowait())
+    return records
+
+
+def test_full_queue_drops_info_without_waiting():
+    handler = BoundedQueueHandler(queue_size=1, block_timeout=5)
+    handler.handle(_record('first'))
+    handler.handle(_record('second'))
+    assert handler.dropped == 1
+    assert [r.msg for r in _drain(handler)] == ['first']
+
+
+def test_full_queue_drops_warning_after_timeout():
+    handler = BoundedQueueHandler(queue_size=1, block_timeout=0.01)
+    handler.handle(_record('first'))
+    handler.handle(_record('warning', logging.WARNING))
+    assert handler.dropped == 1
+
+
+def test_warning_waits_for_space():
+    handler = BoundedQueueHandler(queue_size=1, block_timeout=5)
+    handler.handle(_record('first'))
+    timer = threading.Timer(0.05, handler.queue.get_nowait)
+    timer.start()
+    handler.handle(_record('warning', logging.WARNING))
+    timer.join()
+    assert handler.dropped == 0
+    assert [r.msg for r in _drain(handler)] == ['warning']
+
+
+def test_dropped_count_reported_when_space():
+    handler = BoundedQueueHandler(queue_size=2, block_timeout=0.01)
+    for msg in ('a', 'b', 'c', 'd'):
+        handler.handle(_record(msg))
+    assert handler.dropped == 2
+    _drain(handler)
+
+    handler.handle(_record('e'))
+    assert handler.dropped == 0
+    report, record = _drain(handler)
+    assert report.levelno == logging.WARNING
+    assert 'dropped 2 records' in report.getMessage()
+    assert record.msg == 'e'
+
+
+def test_report_kept_when_queue_full_again():
+    handler = BoundedQueueHandler(queue_size=1, block_timeout=0.01)
+    handler.handle(_record('a'))
+    handler.handle(_record('b'))
+    # still full,  the report and the record are not queued
+    handler.handle(_record('c'))
+    assert handler.dropped == 2
+
+
+def test_prepare_merges_args():
+    handler = BoundedQueueHandler()
+    args = ['old']
+    handler.handle(_record('value %s', args=(args,)))
+    args[0] = 'new'
+    record, = _drain(handler)
+    assert record.msg == "value ['old']"
+    assert record.args is None
+
+
+def test_listener_stop_flushes(monkeypatch):
+    monkeypatch.setattr(queued_logging.atexit, 'register', lambda f: None)
+    logger = logging.getLogger('test_queued_logging_flush')
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    collect = _Collect()
+
+    listener = start_queued_logging(logger, [collect])
+    try:
+        for i in range(100):
+            logger.info('record %d', i)
+    finally:
+        listener.stop()
+        for handler in list(logger.handlers):
+            logger.removeHandler(handler)
+
+    assert [r.msg for r in collect.records] == \
+        [f'record {i}' for i in range(100)]
+
+
+def test_deferred_file_opens_on_first_record(monkeypatch, tmp_path):
+    logdir = tmp_path / 'night1' / 'logs'
+    monkeypatch.setattr(DeferredFileHandler, 'log_dir',
+                        staticmethod(lambda: logdir))
+    handler = DeferredFileHandler('test.log')
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    assert not logdir.exists()
+
+    handler.handle(_record('hello'))
+    handler.close()
+    assert (logdir / 'test.log').read_text() == 'hello\n'
+
+
+def test_deferred_file_follows_the_night(monkeypatch, tmp_path):
+    night = {'dir': tmp_path / 'night1'}
+    monkeypatch.setattr(DeferredFileHandler, 'log_dir',
+                        staticmethod(lambda: night['dir']))
+    handler = DeferredFileHandler('test.log')
+    handler.setFormatter(logging.Formatter('%(message)s'))
+
+    handler.handle(_record('one'))
+    night['dir'] = tmp_path / 'night2'
+    handler.handle(_record('two'))
+    handler.close()
+    assert (tmp_path / 'night1' / 'test.log').read_text() == 'one\n'
+    assert (tmp_path / 'night2' / 'test.log').read_text() == 'two\n'
+
+
+def test_deferred_file_reports_failure_once(monkeypatch, tmp_path):
+    blocker = tmp_path / 'file'
+    blocker.write_text('')
+    monkeypatch.setattr(DeferredFileHandler, 'log_dir',
+                        staticmethod(lambda: blocker / 'logs'))
+    errors = []
+    handler = DeferredFileHandler('test.log')
+    monkeypatch.setattr(handler, 'handleError', errors.append)
+
+    handler.handle(_record('one'))
+    handler.handle(_record('two'))
+    assert len(errors) == 1
@@ -0,0 +1,51 @@
+import threading
+
+import pytest
+
+pytest.importorskip('ddoitranslatormodule')
+
+from telescopetranslator.BaseTelescope import TelescopeBase
+
+
+def _snapshot(keys, **kwargs):
+    return TelescopeBase.snapshot(TelescopeBase, 'dcs', keys, **kwargs)
+
+
+def test_snapshot_values(fake_ktl):
+    fake_ktl.STORE.update({('dcs', 'raoff'): '1.5', ('dcs', 'decoff'): '-2',
+                           ('dcs', 'dec'): '0.3'})
+
+    snap = _snapshot(['raoff', 'decoff', 'dec'])
+
+    assert snap.values == {'raoff': '1.5', 'decoff': '-2', 'dec': '0.3'}
+    assert snap['dec'] == '0.3' and 'raoff' in snap
+    assert snap.service == 'dcs' and not snap.binary
+    assert snap.spread >= 0
+
+
+def test_keywords_read_concurrently(fake_ktl, monkeypatch):
+    barrier = threading.Barrier(3)
+    read_kw = TelescopeBase._read_kw
+
+    # each read only returns when the three are in flight together
+    def _read_kw(cls, ktl_service, ktl_key, **kwargs):
+        barrier.wait(timeout=5)
+        return read_kw(cls, ktl_service, ktl_key, **kwargs)
+
+    monkeypatch.setattr(TelescopeBase, '_read_kw', _read_kw)
+
+    assert len(_snapshot(['raoff', 'decoff', 'dec']).values) == 3
+
+
+def test_failed_read_raised(fake_ktl, monkeypatch):
+    read_kw = TelescopeBase._read_kw
+
+    def _read_kw(cls, ktl_service, ktl_key, **kwargs):
+        if ktl_key == 'dec':
+            raise fake_ktl.TimeoutException('dec')
+        return read_kw(cls, ktl_service, ktl_key, **kwargs)
+
+    monkeypatch.setattr(TelescopeBase, '_read_kw', _read_kw)
+
+    with pytest.raises(fake_ktl.TimeoutException):
+        _snapshot(['raoff', 'dec'])
@@ -0,0 +1,132 @@
+import threading
+import configparser
+
+import pytest
+
+pytest.importorskip('ddoitranslatormodule')
+
+from ddoitranslatormodule.ddoiexceptions.DDOIExceptions import DDOIInvalidArguments
+
+from telescopetranslator.BaseTelescope import TelescopeBase
+from telescopetranslator.step_graph import Step, GraphResult, plan_graph, \
+    run_graph
+
+
+class _Step(TelescopeBase):
+    """
+    Records the order the steps run in,  fails when args['fail'] is set.
+    """
+    subsystems = ()
+    ktl_writes = ()
+    ktl_reads = ()
+    order = []
+    lock = threading.Lock()
+
+    @classmethod
+    def pre_condition(cls, args, logger, cfg):
+        pass
+
+    @classmethod
+    def perform(cls, args, logger, cfg):
+        with cls.lock:
+            cls.order.append(args['name'])
+        if args.get('fail'):
+            raise ValueError(args['name'])
+
+    @classmethod
+    def post_condition(cls, args, logger, cfg):
+        pass
+
+
+class _WritesPo(_Step):
+    ktl_writes = ('dcs.poname',)
+
+
+class _WritesRot(_Step):
+    ktl_writes = ('dcs.rotdest',)
+
+
+class _ReadsBoth(_Step):
+    ktl_writes = ('dcs.instxoff',)
+    ktl_reads = ('dcs.poname', 'dcs.rotdest')
+
+
+class _Undeclared(_Step):
+    ktl_writes = None
+
+
+@pytest.fixture(autouse=True)
+def _order():
+    _Step.order = []
+
+
+def _step(name, translator=_Step, after=None, **args):
+    return Step(translator, dict(args, name=name), name=name, after=after)
+
+
+def _names(steps):
+    return [step.name for step in steps]
+
+
+def test_inferred_dependencies():
+    po, rot, off, free = plan_graph([
+        _step('po', _WritesPo), _step('rot', _WritesRot),
+        _step('off', _ReadsBoth), _step('free')])
+
+    assert po.depends == [] and rot.depends == []
+    assert _names(off.depends) == ['po', 'rot']
+    assert free.depends == []
+
+
+def test_undeclared_keywords_depend_on_everything():
+    steps = plan_graph([_step('a'), _step('b'), _step('c', _Undeclared)])
+    assert _names(steps[2].depends) == ['a', 'b']
+
+
+def test_duplicate_names_made_unique():
+    steps = plan_graph([_step('a'), _step('a'), _step('a')])
+    assert _names(steps) == ['a', 'a#2', 'a#3']
+
+
+def test_unknown_step_name():
+    with pytest.raises(DDOIInvalidArguments, match='unknown steps: b'):
+        plan_graph([_step('a', after=['b'])])
+
+
+def test_cycle():
+    with pytest.raises(DDOIInvalidArguments, match='cycle'):
+        plan_graph([_step('a', after=['b']), _step('b', after=['a'])])
+
+
+def test_finish_times_with_forward_after():
+    steps = plan_graph([_step('a', after=['b']), _step('b', after=['c']),
+                        _step('c', after=[])])
+    for step, elapsed in zip(steps, (1.0, 2.0, 4.0)):
+        step.start, step.end = 10.0, 10.0 + elapsed
+
+    result = GraphResult(steps, 7.0)
+    assert [step.finish for step in steps] == [7.0, 6.0, 4.0]
+    assert _names(result.critical_path()) == ['c', 'b', 'a']
+    assert 'critical path 7.00 s: c -> b -> a' in result.report()
+
+
+def test_run_forward_after_in_order(fake_ktl):
+    result = run_graph([_step('a', after=['b']), _step('b', after=['c']),
+                        _step('c', after=[])], cfg=configparser.ConfigParser())
+
+    result.check()
+    assert _Step.order == ['c', 'b', 'a']
+    assert _names(result.critical_path()) == ['c', 'b', 'a']
+
+
+def test_failed_step_skips_dependents(fake_ktl):
+    result = run_graph([_step('a', after=['b']), _step('b', fail=True),
+                        _step('c', after=[])], cfg=configparser.ConfigParser())
+
+    a, b, c = result.steps
+    assert isinstance(b.error, ValueError)
+    assert a.skipped and c.ok
+    assert 'a' not in _Step.order
+    assert _names(step for step in result.steps if not step.ok) == ['a', 'b']
+    with pytest.raises(ValueError):
+        result.check()
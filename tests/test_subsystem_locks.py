@@ -0,0 +1,166 @@
+import threading
+import configparser
+from time import sleep
+
+import pytest
+
+pytest.importorskip('ddoitranslatormodule')
+
+from ddoitranslatormodule.ddoiexceptions.DDOIExceptions import DDOIKTLTimeOut
+
+from telescopetranslator.BaseTelescope import TelescopeBase
+from telescopetranslator.parallel_exec import run_parallel
+from telescopetranslator.step_graph import Step, run_graph
+
+
+class _Overlap:
+    """
+    Counts the executes in perform at the same time.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.active = 0
+        self.most = 0
+
+    def __enter__(self):
+        with self.lock:
+            self.active += 1
+            self.most = max(self.most, self.active)
+
+    def __exit__(self, *exc):
+        with self.lock:
+            self.active -= 1
+
+
+class _Rotator(TelescopeBase):
+    subsystems = ('rotator',)
+    overlap = None
+
+    @classmethod
+    def pre_condition(cls, args, logger, cfg):
+        pass
+
+    @classmethod
+    def perform(cls, args, logger, cfg):
+        with cls.overlap:
+            sleep(0.05)
+
+    @classmethod
+    def post_condition(cls, args, logger, cfg):
+        pass
+
+
+class _Secondary(_Rotator):
+    subsystems = ('secondary',)
+
+
+def _execute_together(translators):
+    cfg = configparser.ConfigParser()
+    threads = [threading.Thread(target=translator.execute, args=({},),
+                                kwargs={'cfg': cfg})
+               for translator in translators]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def test_shared_subsystem_runs_one_at_a_time(fake_ktl):
+    _Rotator.overlap = _Overlap()
+    _execute_together([_Rotator] * 4)
+
+    assert _Rotator.overlap.most == 1
+
+
+def test_other_subsystems_run_together(fake_ktl):
+    _Rotator.overlap = _Overlap()
+    _execute_together([_Rotator, _Secondary])
+
+    assert _Rotator.overlap.most == 2
+
+
+def test_run_parallel_lanes_follow_subsystems(fake_ktl):
+    result = run_parallel([(_Rotator, {}), (_Secondary, {}), (_Rotator, {})],
+                          cfg=configparser.ConfigParser())
+
+    assert [len(lane) for lane in result.lanes] == [2, 1]
+    first, _, second = result.operations
+    assert first.lane == second.lane
+    assert second.start >= first.end
+
+
+class _Holder(_Rotator):
+    """
+    Holds the rotator and the secondary,  perform runs cls.inner.
+    """
+    subsystems = ('rotator', 'secondary')
+    inner = None
+    result = None
+
+    @classmethod
+    def perform(cls, args, logger, cfg):
+        cls.result = cls.inner(cfg)
+
+
+class _Focus(_Rotator):
+    subsystems = ('secondary',)
+    ktl_writes = ('dcs.telfocus',)
+    ktl_reads = ()
+
+
+class _Secmove(_Focus):
+    ktl_writes = ('dcs.secmove',)
+
+
+def test_run_parallel_inside_execute_uses_held_locks(fake_ktl):
+    _Rotator.overlap = _Overlap()
+    _Holder.inner = lambda cfg: run_parallel(
+        [(_Rotator, {}), (_Secondary, {}), (_Rotator, {})], cfg=cfg)
+
+    # without the hand over the lanes wait for the holder until the deadline
+    _Holder.execute({}, cfg=configparser.ConfigParser(), deadline=2)
+
+    _Holder.result.check()
+    assert _Rotator.overlap.most == 2
+    assert _Holder.result.elapsed < 1
+
+
+def test_run_graph_workers_share_a_held_subsystem_one_at_a_time(fake_ktl):
+    _Rotator.overlap = _Overlap()
+    _Holder.inner = lambda cfg: run_graph(
+        [Step(_Focus, {}), Step(_Secmove, {})], cfg=cfg)
+
+    _Holder.execute({}, cfg=configparser.ConfigParser(), deadline=2)
+
+    _Holder.result.check()
+    # no keyword in common,  both steps start together and take turns on
+    # the secondary
+    assert all(not step.depends for step in _Holder.result.steps)
+    assert _Rotator.overlap.most == 1
+
+
+def test_other_command_waits_for_the_holder(fake_ktl):
+    errors = []
+
+    def _other():
+        try:
+            _Rotator.execute({}, cfg=configparser.ConfigParser(),
+                             deadline=0.1)
+        except DDOIKTLTimeOut as err:
+            errors.append(err)
+
+    def _inner(cfg):
+        thread = threading.Thread(target=_other)
+        thread.start()
+        result = run_parallel([(_Rotator, {})], cfg=cfg)
+        thread.join()
+        return result
+
+    _Rotator.overlap = _Overlap()
+    _Holder.inner = _inner
+    _Holder.execute({}, cfg=configparser.ConfigParser(), deadline=2)
+
+    _Holder.result.check()
+    assert len(errors) == 1
+    assert '_Holder' in str(errors[0])
@@ -0,0 +1,69 @@
+import threading
+import configparser
+from time import monotonic
+
+import pytest
+
+pytest.importorskip('ddoitranslatormodule')
+
+from telescopetranslator.BaseTelescope import TelescopeBase
+from telescopetranslator.wftel import WaitForTel
+
+
+def _set_later(fake_ktl, service, name, value, delay=0.05):
+    timer = threading.Timer(delay, fake_ktl.cache(service, name).set,
+                            args=(value,))
+    timer.start()
+    return timer
+
+
+def _wait(*args, **kwargs):
+    return TelescopeBase._wait_for_kw(TelescopeBase, *args, **kwargs)
+
+
+def test_wait_returns_on_the_broadcast(fake_ktl):
+    fake_ktl.STORE[('dcs', 'axestat')] = 'slewing'
+    _set_later(fake_ktl, 'dcs', 'axestat', 'Tracking')
+
+    start = monotonic()
+    assert _wait('dcs', 'axestat', ('tracking',), 5)
+    assert monotonic() - start < 1
+
+
+def test_wait_already_met(fake_ktl):
+    fake_ktl.STORE[('dcs', 'rotstat')] = 8
+
+    assert _wait('dcs', 'rotstat', lambda val: int(val) == 8, 0,
+                 binary=True)
+
+
+def test_wait_timeout(fake_ktl):
+    fake_ktl.STORE[('dcs', 'axestat')] = 'slewing'
+
+    start = monotonic()
+    assert not _wait('dcs', 'axestat', ('tracking',), 0.1)
+    assert monotonic() - start < 1
+
+
+def test_wait_ignores_unconvertible_values(fake_ktl):
+    fake_ktl.STORE[('dcs', 'autresum')] = 'unknown'
+    _set_later(fake_ktl, 'dcs', 'autresum', '6')
+
+    assert _wait('dcs', 'autresum', lambda val: int(val) > 5, 5)
+    assert not fake_ktl.cache('dcs', 'autresum')._callbacks
+
+
+def test_wftel_follows_the_guider(fake_ktl):
+    fake_ktl.STORE.update({('dcs', 'axestat'): 'tracking',
+                           ('dcs', 'autactiv'): 'yes',
+                           ('dcs', 'autresum'): '5',
+                           ('dcs', 'autgo'): 'SUSPEND'})
+    _set_later(fake_ktl, 'dcs', 'autresum', '6')
+    _set_later(fake_ktl, 'dcs', 'autgo', 'RESUMEACK', delay=0.1)
+
+    cfg = configparser.ConfigParser()
+    cfg.read_dict({'ktl_timeout': {'default': '5'}})
+    start = monotonic()
+    WaitForTel.execute({'auto_resume': 5}, cfg=cfg)
+
+    assert monotonic() - start < 1
@@ -0,0 +1,51 @@
+import pytest
+
+pytest.importorskip('ddoitranslatormodule')
+
+from telescopetranslator.BaseTelescope import TelescopeBase
+
+
+def _write(cfg, key_val, **kwargs):
+    TelescopeBase._write_to_kw(TelescopeBase, cfg, 'dcs', key_val, None,
+                               'test', **kwargs)
+
+
+def test_trigger_written_last(fake_ktl, cfg):
+    _write(cfg, {'rel2curr': 't', 'instxoff': 1.0, 'instyoff': 2.0})
+
+    assert fake_ktl.WRITES == [('dcs', 'instxoff', 1.0),
+                               ('dcs', 'instyoff', 2.0),
+                               ('dcs', 'rel2curr', 't')]
+
+
+def test_writes_sent_before_the_waits(fake_ktl, cfg):
+    _write(cfg, {'instxoff': 1.0, 'instyoff': 2.0, 'rel2curr': 't'})
+
+    assert fake_ktl.CALLS == [('write', 'dcs', 'instxoff', 1.0, False),
+                              ('write', 'dcs', 'instyoff', 2.0, False),
+                              ('wait', 'dcs', 'instxoff'),
+                              ('wait', 'dcs', 'instyoff'),
+                              ('write', 'dcs', 'rel2curr', 't', True)]
+
+
+def test_rotmode_follows_rotdest(fake_ktl, cfg):
+    _write(cfg, {'rotmode': 1, 'rotdest': 45.0})
+
+    assert [write[1] for write in fake_ktl.WRITES] == ['rotdest', 'rotmode']
+
+
+def test_unbatched_writes_in_order(fake_ktl, cfg):
+    _write(cfg, {'rel2curr': 't', 'instxoff': 1.0}, batch=False)
+
+    assert fake_ktl.CALLS == [('write', 'dcs', 'rel2curr', 't', True),
+                              ('write', 'dcs', 'instxoff', 1.0, True)]
+
+
+def test_failed_write_does_not_trigger(fake_ktl, cfg):
+    fake_ktl.FAILURES[('dcs', 'instyoff')] = [fake_ktl.ktlError('busy')]
+
+    with pytest.raises(fake_ktl.ktlError):
+        _write(cfg, {'instxoff': 1.0, 'instyoff': 2.0, 'rel2curr': 't'},
+               retry=False)
+
+    assert fake_ktl.WRITES == [('dcs', 'instxoff', 1.0)]